@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import json
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import requests
 from requests import Session
@@ -47,6 +48,43 @@ class DatabaseClient:
         assert resp.status_code == 200
         return [cls(**data) for data in resp.json()]
 
+    def select(
+        self,
+        model: Optional[Type[T]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Union[List[T], List[Dict[str, Any]]]:
+        """Returns the rows matching the filters, the filtering, ordering and pagination happen in the database.
+
+        Arguments:
+            model: The model to select. Defaults to the model of the client.
+            filters: The column values to match. The column name can be suffixed with an operator among ``__eq``,
+                ``__ne``, ``__lt``, ``__le``, ``__gt``, ``__ge``, ``__in`` and ``__like``, e.g.
+                ``{"name": "a", "count__ge": 3}``.
+            order_by: The columns to sort the rows by, prefixed with ``-`` for a descending order.
+            limit: The maximum number of rows to return.
+            offset: The number of rows to skip.
+            columns: If provided, only these columns are returned as dictionaries instead of models.
+        """
+        cls = model if model else self.model
+        query = {
+            "filters": filters,
+            "order_by": [order_by] if isinstance(order_by, str) else order_by,
+            "limit": limit,
+            "offset": offset,
+            "columns": columns,
+        }
+        general = _GeneralModel.from_cls(cls, token=self.token)
+        general.data = json.dumps(query)
+        resp = self.session.post(self.db_url + "/select/", data=general.json())
+        assert resp.status_code == 200, resp.text
+        if columns:
+            return resp.json()
+        return [cls(**data) for data in resp.json()]
+
     def insert(self, model: T) -> None:
         resp = self.session.post(
             self.db_url + "/insert/",
@@ -68,6 +106,24 @@ class DatabaseClient:
         )
         assert resp.status_code == 200
 
+    def insert_many(self, models: List[T]) -> None:
+        """Inserts the models within a single transaction."""
+        self._post_many("/insert/", models)
+
+    def update_many(self, models: List[T]) -> None:
+        """Updates the models within a single transaction, none is updated if some of them don't exist."""
+        self._post_many("/update/", models)
+
+    def delete_many(self, models: List[T]) -> None:
+        """Deletes the models within a single transaction, none is deleted if some of them don't exist."""
+        self._post_many("/delete/", models)
+
+    def _post_many(self, path: str, models: List[T]) -> None:
+        if not models:
+            return
+        resp = self.session.post(self.db_url + path, data=_GeneralModel.from_objs(models, token=self.token).json())
+        assert resp.status_code == 200, resp.text
+
     @property
     def session(self):
         if self._session is None:
@@ -1,8 +1,6 @@
 import asyncio
 import os
-import sqlite3
 import sys
-import tempfile
 import threading
 import traceback
 from typing import List, Optional, Type, Union
@@ -11,9 +9,16 @@ import uvicorn
 from fastapi import FastAPI
 from uvicorn import run
 
-from lightning_app.components.database.utilities import _create_database, _Delete, _Insert, _SelectAll, _Update
+from lightning_app.components.database.utilities import (
+    _create_database,
+    _Delete,
+    _Insert,
+    _Select,
+    _SelectAll,
+    _Update,
+)
+from lightning_app.components.database.wal import _WALShipper
 from lightning_app.core.work import LightningWork
-from lightning_app.storage import Drive
 from lightning_app.utilities.app_helpers import Logger
 from lightning_app.utilities.imports import _is_sqlmodel_available
 from lightning_app.utilities.packaging.build_config import BuildConfig
@@ -58,6 +63,12 @@ class Database(LightningWork):
 
         The provided models are SQLModel tables
 
+        The database runs in WAL mode and is synchronized incrementally to the Drive: a full copy of the database
+        is stored once, then only the transactions committed since the previous synchronization are shipped. A new
+        full copy replaces the previous one once the shipped transactions get larger than it. The number of bytes
+        shipped is available as ``last_shipped_bytes`` and ``total_shipped_bytes`` within the work. They aren't part
+        of its state, so the synchronizations don't create state changes.
+
         Arguments:
             models: A SQLModel or a list of SQLModels table to be added to the database.
             db_filename: The name of the SQLite database.
@@ -153,24 +164,26 @@ class Database(LightningWork):
         self._models = models if isinstance(models, list) else [models]
         self._store_thread = None
         self._exit_event = None
+        self._shipper = None
+        self._last_shipped_bytes = 0
+        self._total_shipped_bytes = 0
 
-    def store_database(self):
-        try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_db_filename = os.path.join(tmpdir, os.path.basename(self.db_filename))
-
-                source = sqlite3.connect(self.db_filename)
-                dest = sqlite3.connect(tmp_db_filename)
-
-                source.backup(dest)
-
-                source.close()
-                dest.close()
+    @property
+    def last_shipped_bytes(self) -> int:
+        """The number of bytes shipped to the Drive by the last synchronization."""
+        return self._last_shipped_bytes
 
-                drive = Drive("lit://database", component_name=self.name, root_folder=tmpdir)
-                drive.put(os.path.basename(tmp_db_filename))
+    @property
+    def total_shipped_bytes(self) -> int:
+        """The number of bytes shipped to the Drive since the database started."""
+        return self._total_shipped_bytes
 
-            logger.debug("Stored the database to the Drive.")
+    def store_database(self):
+        try:
+            shipped_bytes = self._shipper.ship()
+            self._last_shipped_bytes = shipped_bytes
+            self._total_shipped_bytes += shipped_bytes
+            logger.debug(f"Stored {shipped_bytes} bytes of the database to the Drive.")
         except Exception:
             print(traceback.print_exc())
 
@@ -185,17 +198,17 @@ class Database(LightningWork):
         Arguments:
             token: Token used to protect the database access. Ensure you don't expose it through the App State.
         """
-        drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
-        filenames = drive.list(component_name=self.name)
-        if self.db_filename in filenames:
-            drive.get(self.db_filename)
+        self._shipper = _WALShipper(self.db_filename, component_name=self.name)
+        if self._shipper.restore():
             print("Retrieved the database from Drive.")
 
         app = FastAPI()
 
-        _create_database(self.db_filename, self._models, self.debug)
+        _create_database(self.db_filename, self._models, self.debug, wal=True)
+        self._shipper.connect()
         models = {m.__name__: m for m in self._models}
         app.post("/select_all/")(_SelectAll(models, token))
+        app.post("/select/")(_Select(models, token))
         app.post("/insert/")(_Insert(models, token))
         app.post("/update/")(_Update(models, token))
         app.post("/delete/")(_Delete(models, token))
@@ -222,6 +235,11 @@ class Database(LightningWork):
         return self.internal_ip
 
     def on_exit(self):
-        self._exit_event.set()
+        if self._exit_event is not None:
+            self._exit_event.set()
+        # the work might exit before running
+        if self._shipper is None:
+            return
         with _lock:
             self.store_database()
+            self._shipper.close()
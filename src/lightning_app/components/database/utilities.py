@@ -1,7 +1,8 @@
 import functools
 import json
+import operator
 import pathlib
-from typing import Any, Dict, Generic, List, Type, TypeVar
+from typing import Any, Dict, Generic, List, Tuple, Type, TypeVar
 
 from fastapi import Response, status
 from fastapi.encoders import jsonable_encoder
@@ -139,6 +140,16 @@ class _GeneralModel(BaseModel):
             }
         )
 
+    @classmethod
+    def from_objs(cls, objs, token):
+        return cls(
+            **{
+                "cls_name": objs[0].__class__.__name__,
+                "data": "[" + ",".join(obj.json() for obj in objs) + "]",
+                "token": token,
+            }
+        )
+
     @classmethod
     def from_cls(cls, obj_cls, token):
         return cls(
@@ -150,6 +161,76 @@ class _GeneralModel(BaseModel):
         )
 
 
+def _parse_objs(models: Dict[str, Type["SQLModel"]], data: Dict) -> Tuple[Type["SQLModel"], List["SQLModel"], bool]:
+    """Returns the model class, the objects and whether a list of objects was sent."""
+    cls = models[data["cls_name"]]
+    if data["data"].lstrip().startswith("["):
+        return cls, [cls.parse_obj(obj) for obj in json.loads(data["data"])], True
+    return cls, [cls.parse_raw(data["data"])], False
+
+
+def _select_by_primary_key(session: "Session", cls: Type["SQLModel"], objs: List["SQLModel"]) -> List["SQLModel"]:
+    """Returns the rows matching the primary keys of the objects, in the same order.
+
+    Raises:
+        LookupError: If some of the rows don't exist.
+    """
+    primary_key = _get_primary_key(cls)
+    identifier = getattr(cls, primary_key)
+    keys = [getattr(obj, primary_key) for obj in objs]
+    rows = {getattr(row, primary_key): row for row in session.exec(select(cls).where(identifier.in_(keys)))}
+    missing = [key for key in keys if key not in rows]
+    if missing:
+        raise LookupError(f"The rows with the {primary_key} {missing} weren't found.")
+    return [rows[key] for key in keys]
+
+
+_FILTER_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda column, value: column.in_(value),
+    "like": lambda column, value: column.like(value),
+}
+
+
+def _get_column(cls: Type["SQLModel"], name: str) -> Any:
+    if name not in cls.__table__.columns:
+        raise ValueError(f"The model {cls.__name__} has no column `{name}`.")
+    return getattr(cls, name)
+
+
+def _create_select_statement(cls: Type["SQLModel"], query: Dict[str, Any]) -> Any:
+    """Converts the query sent by the ``DatabaseClient.select`` method into a select statement.
+
+    Raises:
+        ValueError: If the query references unknown columns or operators.
+    """
+    columns = query.get("columns")
+    statement = select(*[_get_column(cls, name) for name in columns]) if columns else select(cls)
+
+    for key, value in (query.get("filters") or {}).items():
+        name, _, op = key.partition("__")
+        op = op or "eq"
+        if op not in _FILTER_OPERATORS:
+            raise ValueError(f"The filter operator `{op}` isn't supported. Use one of {list(_FILTER_OPERATORS)}.")
+        statement = statement.where(_FILTER_OPERATORS[op](_get_column(cls, name), value))
+
+    for name in query.get("order_by") or []:
+        descending = name.startswith("-")
+        column = _get_column(cls, name.lstrip("-"))
+        statement = statement.order_by(column.desc() if descending else column.asc())
+
+    if query.get("offset"):
+        statement = statement.offset(query["offset"])
+    if query.get("limit") is not None:
+        statement = statement.limit(query["limit"])
+    return statement
+
+
 class _SelectAll:
     def __init__(self, models, token):
         print(models, token)
@@ -168,6 +249,35 @@ class _SelectAll:
             return results.all()
 
 
+class _Select:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        query = json.loads(data["data"]) if data["data"] else {}
+        try:
+            statement = _create_select_statement(cls, query)
+        except ValueError as ex:
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"status": "failure", "reason": str(ex)}
+
+        with Session(engine) as session:
+            results = session.exec(statement).all()
+            columns = query.get("columns")
+            if not columns:
+                return results
+            if len(columns) == 1:
+                # the selection of a single column returns its values directly
+                return [{columns[0]: value} for value in results]
+            return [dict(zip(columns, row)) for row in results]
+
+
 class _Insert:
     def __init__(self, models, token):
         self.models = models
@@ -179,11 +289,13 @@ class _Insert:
             return {"status": "failure", "reason": "Unauthorized request to the database."}
 
         with Session(engine) as session:
-            ele = self.models[data["cls_name"]].parse_raw(data["data"])
-            session.add(ele)
+            _, elements, many = _parse_objs(self.models, data)
+            # all the elements are inserted within a single transaction
+            session.add_all(elements)
             session.commit()
-            session.refresh(ele)
-            return ele
+            for ele in elements:
+                session.refresh(ele)
+            return elements if many else elements[0]
 
 
 class _Update:
@@ -197,20 +309,27 @@ class _Update:
             return {"status": "failure", "reason": "Unauthorized request to the database."}
 
         with Session(engine) as session:
-            update_data = self.models[data["cls_name"]].parse_raw(data["data"])
-            primary_key = _get_primary_key(update_data.__class__)
-            identifier = getattr(update_data.__class__, primary_key, None)
-            statement = select(update_data.__class__).where(identifier == getattr(update_data, primary_key))
-            results = session.exec(statement)
-            result = results.one()
-            for k, v in vars(update_data).items():
-                if k in ("id", "_sa_instance_state"):
-                    continue
-                if getattr(result, k) != v:
-                    setattr(result, k, v)
-            session.add(result)
+            cls, updates_data, many = _parse_objs(self.models, data)
+            if many:
+                try:
+                    results = _select_by_primary_key(session, cls, updates_data)
+                except LookupError as ex:
+                    response.status_code = status.HTTP_404_NOT_FOUND
+                    return {"status": "failure", "reason": str(ex)}
+            else:
+                update_data = updates_data[0]
+                primary_key = _get_primary_key(update_data.__class__)
+                identifier = getattr(update_data.__class__, primary_key, None)
+                statement = select(update_data.__class__).where(identifier == getattr(update_data, primary_key))
+                results = [session.exec(statement).one()]
+            for result, update_data in zip(results, updates_data):
+                for k, v in vars(update_data).items():
+                    if k in ("id", "_sa_instance_state"):
+                        continue
+                    if getattr(result, k) != v:
+                        setattr(result, k, v)
+                session.add(result)
             session.commit()
-            session.refresh(result)
 
 
 class _Delete:
@@ -224,23 +343,37 @@ class _Delete:
             return {"status": "failure", "reason": "Unauthorized request to the database."}
 
         with Session(engine) as session:
-            update_data = self.models[data["cls_name"]].parse_raw(data["data"])
-            primary_key = _get_primary_key(update_data.__class__)
-            identifier = getattr(update_data.__class__, primary_key, None)
-            statement = select(update_data.__class__).where(identifier == getattr(update_data, primary_key))
-            results = session.exec(statement)
-            result = results.one()
-            session.delete(result)
+            cls, deletes_data, many = _parse_objs(self.models, data)
+            if many:
+                try:
+                    results = _select_by_primary_key(session, cls, deletes_data)
+                except LookupError as ex:
+                    response.status_code = status.HTTP_404_NOT_FOUND
+                    return {"status": "failure", "reason": str(ex)}
+            else:
+                update_data = deletes_data[0]
+                primary_key = _get_primary_key(update_data.__class__)
+                identifier = getattr(update_data.__class__, primary_key, None)
+                statement = select(update_data.__class__).where(identifier == getattr(update_data, primary_key))
+                results = [session.exec(statement).one()]
+            for result in results:
+                session.delete(result)
             session.commit()
 
 
-def _create_database(db_filename: str, models: List[Type["SQLModel"]], echo: bool = False):
+def _create_database(db_filename: str, models: List[Type["SQLModel"]], echo: bool = False, wal: bool = False):
     global engine
 
+    from sqlalchemy import event
     from sqlmodel import create_engine
 
     engine = create_engine(f"sqlite:///{pathlib.Path(db_filename).resolve()}", echo=echo)
 
+    if wal:
+        from lightning_app.components.database.wal import _configure_wal
+
+        event.listen(engine, "connect", lambda dbapi_connection, _: _configure_wal(dbapi_connection))
+
     logger.debug(f"Creating the following tables {models}")
     try:
         SQLModel.metadata.create_all(engine)
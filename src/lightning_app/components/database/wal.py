@@ -0,0 +1,246 @@
+"""Incremental shipping of a WAL mode SQLite database to a Drive.
+
+The database is shipped as generations: a full copy of the database file (the base) followed by the frames committed
+to its write-ahead log (the segments). Only the :class:`_WALShipper` checkpoints the log, so every frame is shipped
+before being copied into the database file, and the database file only changes when it does.
+"""
+import os
+import re
+import shutil
+import sqlite3
+import struct
+import tempfile
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from lightning_app.utilities.app_helpers import Logger
+
+if TYPE_CHECKING:
+    from lightning_app.storage import Drive
+
+logger = Logger(__name__)
+
+_DRIVE_ID = "lit://database"
+_WAL_HEADER_SIZE = 32
+_WAL_FRAME_HEADER_SIZE = 24
+_SEGMENT_MAGIC = b"LWAL"
+
+
+def _configure_wal(connection: sqlite3.Connection) -> None:
+    connection.execute("PRAGMA journal_mode=WAL")
+    # the log is only checkpointed by the ``_WALShipper`` once its frames were shipped.
+    connection.execute("PRAGMA wal_autocheckpoint=0")
+
+
+def _apply_segment(db_filename: str, segment: bytes) -> None:
+    """Writes the pages of the frames of a segment into the database file, as a checkpoint would."""
+    if segment[:4] != _SEGMENT_MAGIC:
+        raise ValueError("The provided file isn't a database segment.")
+    (page_size,) = struct.unpack_from(">I", segment, 4)
+    frame_size = _WAL_FRAME_HEADER_SIZE + page_size
+    with open(db_filename, "r+b") as f:
+        for offset in range(8, len(segment), frame_size):
+            page_number, db_size = struct.unpack_from(">II", segment, offset)
+            f.seek((page_number - 1) * page_size)
+            f.write(segment[offset + _WAL_FRAME_HEADER_SIZE : offset + frame_size])
+            # the commit frames hold the size of the database in pages after the transaction
+            if db_size:
+                f.truncate(db_size * page_size)
+
+
+class _WALShipper:
+    def __init__(self, db_filename: str, component_name: str, compaction_ratio: float = 1.0) -> None:
+        """The ``_WALShipper`` ships the changes of a WAL mode SQLite database to the Drive.
+
+        Arguments:
+            db_filename: The path of the SQLite database.
+            component_name: The name of the component owning the files in the Drive.
+            compaction_ratio: A new base is shipped once the segments of the current generation are larger than this
+                ratio of the base size, and the previous generation gets deleted.
+        """
+        self.db_filename = os.path.abspath(db_filename)
+        self.name = os.path.basename(db_filename)
+        self.component_name = component_name
+        self.compaction_ratio = compaction_ratio
+        self.generation: Optional[int] = None
+        self.sequence = 0
+        self.base_size = 0
+        self.segments_size = 0
+        self._pattern = re.compile(rf"^{re.escape(self.name)}\.(\d+)(?:\.(\d+)\.wal|\.base)$")
+        self._connection: Optional[sqlite3.Connection] = None
+        self._checkpointer: Optional[sqlite3.Connection] = None
+        self._salts: Optional[bytes] = None
+        self._offset = _WAL_HEADER_SIZE
+
+    @property
+    def wal_filename(self) -> str:
+        return self.db_filename + "-wal"
+
+    def connect(self) -> None:
+        """Opens the connections used to lock the log and checkpoint it.
+
+        They stay open, so SQLite doesn't checkpoint the log when the other connections to the database get closed.
+        """
+        if self._connection is not None:
+            return
+        self._connection = sqlite3.connect(self.db_filename, isolation_level=None, check_same_thread=False)
+        _configure_wal(self._connection)
+        self._checkpointer = sqlite3.connect(self.db_filename, isolation_level=None, check_same_thread=False)
+        self._checkpointer.execute("PRAGMA wal_autocheckpoint=0")
+
+    def _drive(self, root_folder: Optional[str] = None) -> "Drive":
+        # imported lazily as the storage depends on the components through the core.
+        from lightning_app.storage import Drive
+
+        return Drive(_DRIVE_ID, component_name=self.component_name, root_folder=root_folder)
+
+    def close(self) -> None:
+        for connection in (self._connection, self._checkpointer):
+            if connection is not None:
+                connection.close()
+        self._connection = None
+        self._checkpointer = None
+
+    def ship(self) -> int:
+        """Ships the frames committed since the last call, or a new base when needed.
+
+        Returns:
+            The number of bytes shipped to the Drive.
+        """
+        self.connect()
+        # The write lock is only held to read the new frames and checkpoint them, the writers wait meanwhile.
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            frames, page_size = self._read_frames()
+            busy, log, checkpointed = self._checkpointer.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        finally:
+            self._connection.execute("ROLLBACK")
+
+        # once the log is fully checkpointed, the database file holds all the committed transactions.
+        complete = busy == 0 and log == checkpointed
+        compact = self.generation is None or self.segments_size > self.base_size * self.compaction_ratio
+        if compact and complete:
+            return self._ship_base()
+        if self.generation is None or not frames:
+            # the frames will be part of the first base
+            return 0
+        return self._ship_segment(_SEGMENT_MAGIC + struct.pack(">I", page_size) + frames)
+
+    def _read_frames(self) -> Tuple[bytes, int]:
+        """Returns the frames committed to the log since the last call along with the page size."""
+        if not os.path.exists(self.wal_filename):
+            return b"", 0
+        with open(self.wal_filename, "rb") as f:
+            header = f.read(_WAL_HEADER_SIZE)
+            if len(header) < _WAL_HEADER_SIZE:
+                return b"", 0
+            (page_size,) = struct.unpack_from(">I", header, 8)
+            salts = header[16:24]
+            if salts != self._salts:
+                # the log was restarted after a complete checkpoint, its frames are written from the beginning.
+                self._salts = salts
+                self._offset = _WAL_HEADER_SIZE
+            f.seek(self._offset)
+            data = f.read()
+
+        frame_size = _WAL_FRAME_HEADER_SIZE + page_size
+        committed = 0
+        for offset in range(0, len(data) - frame_size + 1, frame_size):
+            # the frames left over from previous restarts of the log have different salts.
+            if data[offset + 8 : offset + 16] != salts:
+                break
+            (db_size,) = struct.unpack_from(">I", data, offset + 4)
+            if db_size:
+                committed = offset + frame_size
+        self._offset += committed
+        return data[:committed], page_size
+
+    def _put(self, filename: str, data: Optional[bytes] = None, src: Optional[str] = None) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, filename)
+            if src is not None:
+                shutil.copyfile(src, path)
+            else:
+                with open(path, "wb") as f:
+                    f.write(data)
+            self._drive(tmpdir).put(filename)
+
+    def _ship_base(self) -> int:
+        self.generation = max([generation for generation, _, _ in self._list()] + [self.generation or 0]) + 1
+        self.sequence = 0
+        self.segments_size = 0
+        # The database file is only written by the checkpoints, so it can be copied without holding any lock.
+        self._put(f"{self.name}.{self.generation:06d}.base", src=self.db_filename)
+        self.base_size = os.path.getsize(self.db_filename)
+        self._delete_generations(keep=self.generation)
+        logger.debug(f"Shipped the generation {self.generation} of the database to the Drive.")
+        return self.base_size
+
+    def _ship_segment(self, segment: bytes) -> int:
+        self.sequence += 1
+        self._put(f"{self.name}.{self.generation:06d}.{self.sequence:06d}.wal", data=segment)
+        self.segments_size += len(segment)
+        return len(segment)
+
+    def _list(self) -> List[Tuple[int, Optional[int], str]]:
+        """Returns the generation, the sequence (``None`` for the bases) and the name of the files in the Drive."""
+        drive = self._drive()
+        files = []
+        for filename in drive.list(component_name=self.component_name):
+            match = self._pattern.match(os.path.basename(filename))
+            if match:
+                sequence = match.group(2)
+                files.append((int(match.group(1)), None if sequence is None else int(sequence), match.group(0)))
+        return files
+
+    def _delete_generations(self, keep: int) -> None:
+        drive = self._drive()
+        for generation, _, filename in self._list():
+            if generation != keep:
+                drive.delete(filename)
+
+    def restore(self) -> bool:
+        """Rebuilds the database from the last generation shipped to the Drive by replaying its segments onto its
+        base. The full copies of the database stored by the previous versions are restored too.
+
+        Returns:
+            Whether the database was retrieved from the Drive.
+        """
+        files = self._list()
+        drive = self._drive()
+        bases = [generation for generation, sequence, _ in files if sequence is None]
+        if not bases:
+            if self.name not in drive.list(component_name=self.component_name):
+                return False
+            with tempfile.TemporaryDirectory() as tmpdir:
+                self._drive(tmpdir).get(self.name, component_name=self.component_name)
+                self._replace_database(os.path.join(tmpdir, self.name))
+            return True
+
+        generation = max(bases)
+        segments = sorted((sequence, filename) for g, sequence, filename in files if g == generation and sequence)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            drive = self._drive(tmpdir)
+            base_filename = f"{self.name}.{generation:06d}.base"
+            drive.get(base_filename, component_name=self.component_name)
+            db_filename = os.path.join(tmpdir, base_filename)
+            self.base_size = os.path.getsize(db_filename)
+            self.segments_size = 0
+            for _, filename in segments:
+                drive.get(filename, component_name=self.component_name)
+                with open(os.path.join(tmpdir, filename), "rb") as f:
+                    segment = f.read()
+                _apply_segment(db_filename, segment)
+                self.segments_size += len(segment)
+            self._replace_database(db_filename)
+
+        self.generation = generation
+        self.sequence = segments[-1][0] if segments else 0
+        return True
+
+    def _replace_database(self, src: str) -> None:
+        # the log and shared memory files of the replaced database would be applied to the restored one.
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(self.db_filename + suffix):
+                os.remove(self.db_filename + suffix)
+        os.makedirs(os.path.dirname(self.db_filename), exist_ok=True)
+        shutil.copyfile(src, self.db_filename)
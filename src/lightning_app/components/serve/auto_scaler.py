@@ -1,9 +1,10 @@
 import asyncio
 import logging
+import math
 import time
 import uuid
-from itertools import cycle
-from typing import Any, Dict, List, Optional
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
 from typing import SupportsFloat as Numeric
 from typing import Tuple, Type, Union
 
@@ -18,7 +19,7 @@ from starlette.staticfiles import StaticFiles
 from lightning_app.components.serve.cold_start_proxy import ColdStartProxy
 from lightning_app.core.flow import LightningFlow
 from lightning_app.core.work import LightningWork
-from lightning_app.utilities.app_helpers import Logger
+from lightning_app.utilities.app_helpers import is_overridden, Logger
 from lightning_app.utilities.cloud import is_running_in_cloud
 from lightning_app.utilities.imports import _is_aiohttp_available, requires
 from lightning_app.utilities.packaging.cloud_compute import CloudCompute
@@ -29,6 +30,156 @@ if _is_aiohttp_available():
 
 logger = Logger(__name__)
 
+# The number of batches which can be in-flight on a server at once. A second batch is sent while the first one is
+# processed to hide the network latency between the load balancer and the servers.
+_MAX_INFLIGHT_BATCHES_PER_SERVER = 2
+# The duration in seconds of the window over which the load balancer metrics are computed.
+_METRICS_WINDOW = 60.0
+
+
+class _HistogramSlice:
+    __slots__ = ("index", "buckets", "count", "total")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.total = 0.0
+
+
+class _RollingHistogram:
+    """A compact histogram of the values recorded within the last ``window`` seconds.
+
+    Like an HDR histogram, the values are bucketed on a logarithmic scale with a relative precision of ``precision``,
+    so the memory used only depends on the range of the values and not on their number. The window is split into
+    ``num_slices`` slices which are dropped once they expire.
+    """
+
+    def __init__(
+        self, window: float = _METRICS_WINDOW, num_slices: int = 6, precision: float = 0.01, min_value: float = 1e-6
+    ) -> None:
+        self.window = window
+        self.num_slices = num_slices
+        self.min_value = min_value
+        self._slice_duration = window / num_slices
+        self._log_base = math.log1p(precision)
+        self._slices: Deque[_HistogramSlice] = deque()
+        self._created_at = time.monotonic()
+
+    def record(self, value: float, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        index = int(now // self._slice_duration)
+        if not self._slices or self._slices[-1].index != index:
+            self._slices.append(_HistogramSlice(index))
+        last_slice = self._slices[-1]
+        last_slice.buckets[self._bucket(value)] += 1
+        last_slice.count += 1
+        last_slice.total += value
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return math.ceil(math.log(value / self.min_value) / self._log_base)
+
+    def _expire(self, now: float) -> None:
+        oldest = int(now // self._slice_duration) - self.num_slices + 1
+        while self._slices and self._slices[0].index < oldest:
+            self._slices.popleft()
+
+    def count(self, now: Optional[float] = None) -> int:
+        self._expire(time.monotonic() if now is None else now)
+        return sum(s.count for s in self._slices)
+
+    def total(self, now: Optional[float] = None) -> float:
+        self._expire(time.monotonic() if now is None else now)
+        return sum(s.total for s in self._slices)
+
+    def mean(self, now: Optional[float] = None) -> Optional[float]:
+        count = self.count(now)
+        return self.total(now) / count if count else None
+
+    def elapsed(self, now: Optional[float] = None) -> float:
+        """The duration covered by the window, shorter than ``window`` right after the histogram is created."""
+        now = time.monotonic() if now is None else now
+        return max(min(self.window, now - self._created_at), self._slice_duration)
+
+    def quantiles(self, *quantiles: float, now: Optional[float] = None) -> List[Optional[float]]:
+        """Returns the upper bound of the bucket holding each quantile, ``None`` if no value was recorded."""
+        self._expire(time.monotonic() if now is None else now)
+        buckets: Counter = Counter()
+        for s in self._slices:
+            buckets.update(s.buckets)
+        count = sum(buckets.values())
+        if not count:
+            return [None] * len(quantiles)
+        results = []
+        for quantile in quantiles:
+            rank = max(1, math.ceil(quantile * count))
+            cumulative = 0
+            for bucket in sorted(buckets):
+                cumulative += buckets[bucket]
+                if cumulative >= rank:
+                    results.append(self.min_value * math.exp(bucket * self._log_base))
+                    break
+        return results
+
+
+class _LoadBalancerMetrics:
+    """Tracks the latency of the requests, their queue wait, the batch fill ratio and the per server throughput and
+    utilization over a rolling window."""
+
+    def __init__(self, window: float = _METRICS_WINDOW) -> None:
+        self.window = window
+        self.latency = _RollingHistogram(window)
+        self.queue_wait = _RollingHistogram(window)
+        self.batch_fill = _RollingHistogram(window)
+        # {server_url: (batch durations, batch sizes)}
+        self.servers: Dict[str, Tuple[_RollingHistogram, _RollingHistogram]] = {}
+
+    def record_batch(self, server_url: str, size: int, max_batch_size: int, duration: float) -> None:
+        self.batch_fill.record(size / max_batch_size)
+        if server_url not in self.servers:
+            self.servers[server_url] = (_RollingHistogram(self.window), _RollingHistogram(self.window))
+        durations, sizes = self.servers[server_url]
+        durations.record(duration)
+        sizes.record(size)
+
+    def remove_server(self, server_url: str) -> None:
+        self.servers.pop(server_url, None)
+
+    def summary(self, server_urls: List[str]) -> Dict[str, Any]:
+        now = time.monotonic()
+        latency = self.latency.quantiles(0.5, 0.95, 0.99, now=now)
+        queue_wait = self.queue_wait.quantiles(0.5, 0.95, 0.99, now=now)
+        server_throughput = {}
+        server_utilization = {}
+        for server_url in server_urls:
+            if server_url not in self.servers:
+                server_throughput[server_url] = 0.0
+                server_utilization[server_url] = 0.0
+                continue
+            durations, sizes = self.servers[server_url]
+            server_throughput[server_url] = sizes.total(now) / sizes.elapsed(now)
+            # the fraction of the in-flight batch slots of the server which were busy over the window
+            busy = durations.total(now) / (durations.elapsed(now) * _MAX_INFLIGHT_BATCHES_PER_SERVER)
+            server_utilization[server_url] = min(busy, 1.0)
+        return {
+            "requests_per_second": self.latency.count(now) / self.latency.elapsed(now),
+            "latency_p50": latency[0],
+            "latency_p95": latency[1],
+            "latency_p99": latency[2],
+            "queue_wait_p50": queue_wait[0],
+            "queue_wait_p95": queue_wait[1],
+            "queue_wait_p99": queue_wait[2],
+            "batch_fill_ratio": self.batch_fill.mean(now),
+            "utilization": (
+                sum(server_utilization.values()) / len(server_utilization) if server_utilization else None
+            ),
+            "server_throughput": server_throughput,
+            "server_utilization": server_utilization,
+        }
+
 
 class _TrackableFastAPI(FastAPI):
     """A FastAPI subclass that tracks the request metadata."""
@@ -78,6 +229,20 @@ class _BatchRequestModel(BaseModel):
     inputs: List[Any]
 
 
+class _LoadBalancerMetricsModel(BaseModel):
+    requests_per_second: float
+    latency_p50: Optional[float]
+    latency_p95: Optional[float]
+    latency_p99: Optional[float]
+    queue_wait_p50: Optional[float]
+    queue_wait_p95: Optional[float]
+    queue_wait_p99: Optional[float]
+    batch_fill_ratio: Optional[float]
+    utilization: Optional[float]
+    server_throughput: Dict[str, float]
+    server_utilization: Dict[str, float]
+
+
 def _create_fastapi(title: str) -> _TrackableFastAPI:
     fastapi_app = _TrackableFastAPI(title=title)
 
@@ -102,7 +267,11 @@ def _create_fastapi(title: str) -> _TrackableFastAPI:
 
 class _LoadBalancer(LightningWork):
     r"""The LoadBalancer is a LightningWork component that collects the requests and sends them to the prediciton
-    API asynchronously using RoundRobin scheduling. It also performs auto batching of the incoming requests.
+    API asynchronously to the server with the least outstanding requests. It also performs auto batching of the
+    incoming requests: a batch is sent as soon as it is full or its oldest request waited for ``timeout_batching``.
+
+    The rolling latency percentiles, queue wait, batch fill ratio and per server throughput are served on
+    ``/system/metrics``.
 
     After enabling you will require to send username and password from the request header for the private endpoints.
 
@@ -143,11 +312,16 @@ class _LoadBalancer(LightningWork):
         self.servers = []
         self.max_batch_size = max_batch_size
         self.timeout_batching = timeout_batching
-        self._iter = None
         self._batch = []
-        self._responses = {}  # {request_id: response}
-        self._last_batch_sent = None
-        self._server_status = {}
+        self._futures = {}  # {request_id: asyncio.Future}
+        self._enqueued_at = {}  # {request_id: time}
+        self._server_outstanding = {}  # {server_url: [num_batches, num_requests]}
+        self._draining_servers = {}  # {server_url: [num_batches, num_requests]} of the de-registered servers
+        self._server_sessions = {}  # {server_url: aiohttp.ClientSession}
+        self._next_server = 0
+        self._batch_event = None
+        self._server_event = None
+        self._metrics = _LoadBalancerMetrics()
         self._api_name = api_name
         self.ready = False
 
@@ -171,82 +345,162 @@ class _LoadBalancer(LightningWork):
             raise ValueError("Internal IP not set")
         return f"http://{self._internal_ip}:{self._port}"
 
+    def _get_session(self, server_url: str) -> "aiohttp.ClientSession":
+        """Returns the session of the server, its connections are kept alive and re-used across the batches."""
+        session = self._server_sessions.get(server_url)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=self._timeout_keep_alive),
+                timeout=aiohttp.ClientTimeout(total=self._timeout_inference_request),
+                headers={"accept": "application/json", "Content-Type": "application/json"},
+            )
+            self._server_sessions[server_url] = session
+        return session
+
+    async def _close_session(self, server_url: str) -> None:
+        session = self._server_sessions.pop(server_url, None)
+        if session is not None:
+            await session.close()
+
+    def _get_events(self) -> Tuple[asyncio.Event, asyncio.Event]:
+        # the events are created lazily so they are bound to the event loop of the server.
+        if self._batch_event is None:
+            self._batch_event = asyncio.Event()
+            self._server_event = asyncio.Event()
+        return self._batch_event, self._server_event
+
+    def _resolve(self, request_id: str, result: Any) -> None:
+        self._enqueued_at.pop(request_id, None)
+        future = self._futures.pop(request_id, None)
+        # the future is cancelled if the client went away.
+        if future is not None and not future.done():
+            future.set_result(result)
+
     async def send_batch(self, batch: List[Tuple[str, _BatchRequestModel]], server_url: str):
         request_data: List[_LoadBalancer._input_type] = [b[1] for b in batch]
         batch_request_data = _BatchRequestModel(inputs=request_data)
 
+        start_time = time.monotonic()
         try:
-            self._server_status[server_url] = False
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "accept": "application/json",
-                    "Content-Type": "application/json",
-                }
-                async with session.post(
-                    f"{server_url}{self.endpoint}",
-                    json=batch_request_data.dict(),
-                    timeout=self._timeout_inference_request,
-                    headers=headers,
-                ) as response:
-                    if response.status == 408:
-                        raise HTTPException(408, "Request timed out")
-                    response.raise_for_status()
-                    response = await response.json()
-                    outputs = response["outputs"]
-                    if len(batch) != len(outputs):
-                        raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
-                    result = {request[0]: r for request, r in zip(batch, outputs)}
-                    self._responses.update(result)
+            session = self._get_session(server_url)
+            async with session.post(f"{server_url}{self.endpoint}", json=batch_request_data.dict()) as response:
+                if response.status == 408:
+                    raise HTTPException(408, "Request timed out")
+                response.raise_for_status()
+                response = await response.json()
+                outputs = response["outputs"]
+                if len(batch) != len(outputs):
+                    raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
+                for request, output in zip(batch, outputs):
+                    self._resolve(request[0], output)
         except Exception as ex:
-            result = {request[0]: ex for request in batch}
-            self._responses.update(result)
+            for request in batch:
+                self._resolve(request[0], ex)
         finally:
-            # resetting the server status so other requests can be
-            # scheduled on this node
-            if server_url in self._server_status:
+            # releasing the capacity of the server so other requests can be scheduled on it
+            outstanding = self._server_outstanding.get(server_url)
+            if outstanding is not None:
                 # TODO - if the server returns an error, track that so
                 #  we don't send more requests to it
-                self._server_status[server_url] = True
+                outstanding[0] -= 1
+                outstanding[1] -= len(batch)
+                self._metrics.record_batch(server_url, len(batch), self.max_batch_size, time.monotonic() - start_time)
+            elif server_url in self._draining_servers:
+                outstanding = self._draining_servers[server_url]
+                outstanding[0] -= 1
+                outstanding[1] -= len(batch)
+                # the session of a de-registered server is closed once its last in-flight batch completed
+                if outstanding[0] <= 0:
+                    del self._draining_servers[server_url]
+                    await self._close_session(server_url)
+            self._get_events()[1].set()
+
+    async def _update_servers(self, servers: List[str]) -> None:
+        """Registers the new servers and stops routing the batches to the ones which were removed.
+
+        The session of a removed server is only closed once its in-flight batches completed.
+        """
+        self.servers = servers
+        updated_servers = set()
+        # do not try to loop over the dict keys as the dict might change from other places
+        existing_servers = list(self._server_outstanding.keys())
+        for server in servers:
+            updated_servers.add(server)
+            if server not in existing_servers:
+                # a server registered again while draining keeps the count of its in-flight batches
+                self._server_outstanding[server] = self._draining_servers.pop(server, [0, 0])
+                logger.info(f"Registering server {server}", self._server_outstanding)
+        for existing in existing_servers:
+            if existing not in updated_servers:
+                logger.info(f"De-Registering server {existing}", self._server_outstanding)
+                outstanding = self._server_outstanding.pop(existing)
+                self._metrics.remove_server(existing)
+                if outstanding[0] > 0:
+                    self._draining_servers[existing] = outstanding
+                else:
+                    await self._close_session(existing)
+        # the consumer might be waiting for a free server
+        self._get_events()[1].set()
 
     def _find_free_server(self) -> Optional[str]:
-        existing = set(self._server_status.keys())
-        for server in existing:
-            status = self._server_status.get(server, None)
-            if status is None:
-                logger.error("Server is not found in the status list. This should not happen.")
-            if status:
-                return server
+        """Returns the server with the least outstanding requests among the ones which can accept a new batch.
+
+        The ties are broken in a round robin fashion.
+        """
+        servers = list(self._server_outstanding.items())
+        if not servers:
+            return None
+        self._next_server = (self._next_server + 1) % len(servers)
+        servers = servers[self._next_server :] + servers[: self._next_server]
+        free_servers = [(server, out) for server, out in servers if out[0] < _MAX_INFLIGHT_BATCHES_PER_SERVER]
+        if not free_servers:
+            return None
+        return min(free_servers, key=lambda item: item[1][1])[0]
 
     async def consumer(self):
-        """The consumer process that continuously checks for new requests and sends them to the API.
+        """The consumer process that sends the batches to the API as soon as they are full or their oldest request
+        waited for ``timeout_batching`` seconds, and a server is free.
 
         Two instances of this function should not be running with shared `_state_server` as that would create race
         conditions
         """
+        batch_event, server_event = self._get_events()
+        loop = asyncio.get_running_loop()
         while True:
-            await asyncio.sleep(0.05)
-            batch = self._batch[: self.max_batch_size]
-            is_batch_ready = len(batch) == self.max_batch_size
-            if len(batch) > 0 and self._last_batch_sent is None:
-                self._last_batch_sent = time.time()
+            if not self._batch:
+                batch_event.clear()
+                await batch_event.wait()
+                continue
 
-            if self._last_batch_sent:
-                is_batch_timeout = time.time() - self._last_batch_sent > self.timeout_batching
-            else:
-                is_batch_timeout = False
+            # wait until the batch is full or the deadline of its oldest request is reached
+            deadline = self._enqueued_at.get(self._batch[0][0], loop.time()) + self.timeout_batching
+            while len(self._batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                batch_event.clear()
+                try:
+                    await asyncio.wait_for(batch_event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
 
             server_url = self._find_free_server()
-            # setting the server status to be busy! This will be reset by
-            # the send_batch function after the server responds
             if server_url is None:
+                server_event.clear()
+                await server_event.wait()
                 continue
-            if batch and (is_batch_ready or is_batch_timeout):
-                self._server_status[server_url] = False
-                # find server with capacity
-                asyncio.create_task(self.send_batch(batch, server_url))
-                # resetting the batch array, TODO - not locking the array
-                self._batch = self._batch[len(batch) :]
-                self._last_batch_sent = time.time()
+
+            batch = self._batch[: self.max_batch_size]
+            self._batch = self._batch[len(batch) :]
+            now = loop.time()
+            for request_id, _ in batch:
+                self._metrics.queue_wait.record(now - self._enqueued_at.get(request_id, now))
+            # reserving the capacity of the server, this will be released by
+            # the send_batch function after the server responds
+            outstanding = self._server_outstanding[server_url]
+            outstanding[0] += 1
+            outstanding[1] += len(batch)
+            asyncio.create_task(self.send_batch(batch, server_url))
 
     async def process_request(self, data: BaseModel, request_id=None):
         if request_id is None:
@@ -263,15 +517,26 @@ class _LoadBalancer(LightningWork):
         if not self._has_processing_capacity() and self._cold_start_proxy:
             return await self._cold_start_proxy.handle_request(data)
 
-        # if we have capacity, process the request
+        # if we have capacity, process the request. The future is resolved by `send_batch`.
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        enqueued_at = loop.time()
+        self._futures[request_id] = future
+        self._enqueued_at[request_id] = enqueued_at
         self._batch.append((request_id, data))
-        while True:
-            await asyncio.sleep(0.05)
-            if request_id in self._responses:
-                result = self._responses[request_id]
-                del self._responses[request_id]
-                _maybe_raise_granular_exception(result)
-                return result
+        self._get_events()[0].set()
+        try:
+            result = await future
+        except asyncio.CancelledError:
+            # the client went away, its request isn't sent if it is still queued
+            self._batch = [request for request in self._batch if request[0] != request_id]
+            raise
+        finally:
+            self._futures.pop(request_id, None)
+            self._enqueued_at.pop(request_id, None)
+        self._metrics.latency.record(loop.time() - enqueued_at)
+        _maybe_raise_granular_exception(result)
+        return result
 
     def _has_processing_capacity(self):
         """This function checks if we have processing capacity for one more request or not.
@@ -288,8 +553,6 @@ class _LoadBalancer(LightningWork):
     def run(self):
         logger.info(f"servers: {self.servers}")
 
-        self._iter = cycle(self.servers)
-
         fastapi_app = _create_fastapi("Load Balancer")
         fastapi_app.SEND_TASK = None
         self._fastapi_app = fastapi_app
@@ -314,8 +577,10 @@ class _LoadBalancer(LightningWork):
             fastapi_app.SEND_TASK = asyncio.create_task(self.consumer())
 
         @fastapi_app.on_event("shutdown")
-        def shutdown_event():
+        async def shutdown_event():
             fastapi_app.SEND_TASK.cancel()
+            for server_url in list(self._server_sessions):
+                await self._close_session(server_url)
 
         @fastapi_app.get("/system/info", response_model=_SysInfo)
         async def sys_info():
@@ -327,22 +592,13 @@ class _LoadBalancer(LightningWork):
                 global_request_count=fastapi_app.global_request_count,
             )
 
+        @fastapi_app.get("/system/metrics", response_model=_LoadBalancerMetricsModel)
+        async def metrics():
+            return self._metrics.summary(self.servers)
+
         @fastapi_app.put("/system/update-servers")
         async def update_servers(servers: List[str]):
-            self.servers = servers
-            self._iter = cycle(self.servers)
-            updated_servers = set()
-            # do not try to loop over the dict keys as the dict might change from other places
-            existing_servers = list(self._server_status.keys())
-            for server in servers:
-                updated_servers.add(server)
-                if server not in existing_servers:
-                    self._server_status[server] = True
-                    logger.info(f"Registering server {server}", self._server_status)
-            for existing in existing_servers:
-                if existing not in updated_servers:
-                    logger.info(f"De-Registering server {existing}", self._server_status)
-                    del self._server_status[existing]
+            await self._update_servers(servers)
 
         @fastapi_app.post(self.endpoint, response_model=self._output_type)
         async def balance_api(inputs: input_type):
@@ -480,6 +736,12 @@ class AutoScaler(LightningFlow):
         input_type: Input type.
         output_type: Output type.
         cold_start_proxy: If provided, the proxy will be used while the worker machines are warming up.
+        target_latency: If provided, the default scaling logic keeps the rolling p95 latency of the requests, in
+            seconds, around this target.
+        target_utilization: If provided, the default scaling logic keeps the average utilization of the servers,
+            between 0 and 1, around this target.
+        hysteresis: The relative margin around the targets within which the number of replicas doesn't change, so it
+            doesn't flap as the metrics fluctuate. The scale intervals act as cooldown periods after each change.
 
     .. testcode::
 
@@ -527,6 +789,16 @@ class AutoScaler(LightningFlow):
                 timeout_batching=1,  # for auto batching
             )
         )
+
+        # Example 3: Scaling to keep the p95 latency under 200ms
+        app = L.LightningApp(
+            L.app.components.AutoScaler(
+                MyPythonServer,
+                min_replicas=1,
+                max_replicas=8,
+                target_latency=0.2,
+            )
+        )
     """
 
     def __init__(
@@ -543,6 +815,9 @@ class AutoScaler(LightningFlow):
         output_type: Type[BaseModel] = Dict,
         cold_start_proxy: Union[ColdStartProxy, str, None] = None,
         *work_args: Any,
+        target_latency: Optional[float] = None,
+        target_utilization: Optional[float] = None,
+        hysteresis: float = 0.2,
         **work_kwargs: Any,
     ) -> None:
         super().__init__()
@@ -559,6 +834,14 @@ class AutoScaler(LightningFlow):
         self.scale_in_interval = scale_in_interval
         self.max_batch_size = max_batch_size
 
+        if target_utilization is not None and not 0 < target_utilization <= 1:
+            raise ValueError(f"`target_utilization={target_utilization}` must be between 0 and 1.")
+        if not 0 <= hysteresis < 1:
+            raise ValueError(f"`hysteresis={hysteresis}` must be between 0 and 1.")
+        self.target_latency = target_latency
+        self.target_utilization = target_utilization
+        self.hysteresis = hysteresis
+
         if max_replicas < min_replicas:
             raise ValueError(
                 f"`max_replicas={max_replicas}` must be less than or equal to `min_replicas={min_replicas}`."
@@ -639,15 +922,28 @@ class AutoScaler(LightningFlow):
     def scale(self, replicas: int, metrics: dict) -> int:
         """The default scaling logic that users can override.
 
+        If ``target_latency`` or ``target_utilization`` is set, the number of works is adjusted to keep the rolling
+        metrics of the load balancer around these targets, otherwise it is based on the number of pending requests.
+
         Args:
             replicas: The number of running works.
             metrics: ``metrics['pending_requests']`` is the total number of requests that are currently pending.
                 ``metrics['pending_works']`` is the number of pending works.
+                When ``target_latency`` or ``target_utilization`` is set or this method is overridden, the load
+                balancer metrics are also provided when available: ``requests_per_second``, ``latency_p50``,
+                ``latency_p95``, ``latency_p99``, ``queue_wait_p50``, ``queue_wait_p95``, ``queue_wait_p99`` (in
+                seconds), ``batch_fill_ratio``, ``utilization`` and the per server ``server_throughput`` and
+                ``server_utilization``.
 
         Returns:
             The target number of running works. The value will be adjusted after this method runs
             so that it satisfies ``min_replicas<=replicas<=max_replicas``.
         """
+        if self.target_latency is not None or self.target_utilization is not None:
+            target = self._scale_to_targets(replicas, metrics)
+            if target is not None:
+                return target
+
         pending_requests = metrics["pending_requests"]
         active_or_pending_works = replicas + metrics["pending_works"]
 
@@ -668,16 +964,69 @@ class AutoScaler(LightningFlow):
 
         return replicas
 
+    def _scale_to_targets(self, replicas: int, metrics: dict) -> Optional[int]:
+        """Scales proportionally to the ratio between the load balancer metrics and their targets.
+
+        Returns ``None`` when the load balancer didn't report any metric yet.
+        """
+        ratios = []
+        if self.target_latency is not None and metrics.get("latency_p95") is not None:
+            ratios.append(metrics["latency_p95"] / self.target_latency)
+        if self.target_utilization is not None and metrics.get("utilization") is not None:
+            ratios.append(metrics["utilization"] / self.target_utilization)
+        if not ratios:
+            # no request was processed over the metrics window
+            idle = metrics.get("requests_per_second") == 0 and not metrics["pending_requests"]
+            return replicas - 1 if idle else None
+
+        load = max(ratios)
+        active_or_pending_works = replicas + metrics["pending_works"]
+        if active_or_pending_works == 0:
+            return 1
+
+        # scale out, the metrics are produced by the running works and the pending ones will add to their capacity
+        if load > 1 + self.hysteresis:
+            return replicas + max(math.ceil(replicas * load) - active_or_pending_works, 0)
+
+        # scale in one work at a time, only if the remaining ones would stay under the target
+        if load < 1 - self.hysteresis and replicas > 1 and load * replicas / (replicas - 1) < 1:
+            return replicas - 1
+
+        return replicas
+
     @property
     def num_pending_requests(self) -> int:
         """Fetches the number of pending requests via load balancer."""
         try:
             load_balancer_url = self.load_balancer.get_internal_url()
         except ValueError:
-            logger.warn("Cannot update servers as internal_url is not set")
+            logger.warning("Cannot update servers as internal_url is not set")
             return 0
         return int(requests.get(f"{load_balancer_url}/num-requests").json())
 
+    @property
+    def load_balancer_metrics(self) -> Dict[str, Any]:
+        """Fetches the rolling latency, throughput and utilization metrics of the load balancer."""
+        try:
+            load_balancer_url = self.load_balancer.get_internal_url()
+        except ValueError:
+            return {}
+        try:
+            response = requests.get(f"{load_balancer_url}/system/metrics", timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as ex:
+            logger.warning(f"Cannot fetch the load balancer metrics: {ex}")
+            return {}
+        return response.json()
+
+    def _uses_load_balancer_metrics(self) -> bool:
+        # the metrics are only fetched when a scaling logic might use them
+        return (
+            self.target_latency is not None
+            or self.target_utilization is not None
+            or is_overridden("scale", self, AutoScaler)
+        )
+
     @property
     def num_pending_works(self) -> int:
         """The number of pending works."""
@@ -686,6 +1035,7 @@ class AutoScaler(LightningFlow):
     def autoscale(self) -> None:
         """Adjust the number of works based on the target number returned by ``self.scale``."""
         metrics = {
+            **(self.load_balancer_metrics if self._uses_load_balancer_metrics() else {}),
             "pending_requests": self.num_pending_requests,
             "pending_works": self.num_pending_works,
         }
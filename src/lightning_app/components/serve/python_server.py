@@ -1,12 +1,14 @@
 import abc
+import asyncio
 import base64
 import os
 import platform
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import requests
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from lightning_utilities.core.imports import compare_version, module_available
 from pydantic import BaseModel
 
@@ -39,6 +41,104 @@ def _get_device():
         return torch.device(f"cuda:{local_rank}" if torch.cuda.is_available() else "cpu")
 
 
+class _DynamicBatcher:
+    def __init__(
+        self,
+        predict_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        timeout_batching: float,
+        max_queue_size: Optional[int] = None,
+        timeout_request: Optional[float] = None,
+    ) -> None:
+        """The ``_DynamicBatcher`` groups the concurrent requests into batches processed by a single call to
+        ``predict_batch``.
+
+        A batch is processed as soon as it holds ``max_batch_size`` requests or its oldest request waited for
+        ``timeout_batching`` seconds. The predictions run in a dedicated thread, so the next batch is collected
+        meanwhile.
+
+        Arguments:
+            predict_batch: Returns one output per request of the batch it receives.
+            max_batch_size: The maximum number of requests processed at once.
+            timeout_batching: The number of seconds a request waits for other requests to be batched with.
+            max_queue_size: The number of waiting requests above which the new ones are rejected with a 503 status.
+            timeout_request: The number of seconds after which a request fails with a 408 status.
+        """
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.timeout_batching = timeout_batching
+        self.max_queue_size = max_queue_size
+        self.timeout_request = timeout_request
+        self._pending: List[Tuple[float, Any, asyncio.Future]] = []
+        self._event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def start(self) -> None:
+        # the event is created within the event loop of the server.
+        self._event = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def submit(self, request: Any) -> Any:
+        if self.max_queue_size is not None and len(self._pending) >= self.max_queue_size:
+            raise HTTPException(503, "The server is overloaded, try again in a few seconds")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((loop.time(), request, future))
+        self._event.set()
+        try:
+            # the future gets cancelled on timeout, so the request is skipped if it wasn't processed yet
+            return await asyncio.wait_for(future, self.timeout_request)
+        except asyncio.TimeoutError as ex:
+            raise HTTPException(408, "Request timed out") from ex
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._pending:
+                self._event.clear()
+                await self._event.wait()
+                continue
+
+            # wait until the batch is full or the deadline of its oldest request is reached
+            deadline = self._pending[0][0] + self.timeout_batching
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._event.clear()
+                try:
+                    await asyncio.wait_for(self._event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            batch = [(request, future) for _, request, future in self._pending[: self.max_batch_size]]
+            self._pending = self._pending[self.max_batch_size :]
+            batch = [(request, future) for request, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                outputs = await loop.run_in_executor(self._executor, self.predict_batch, [b[0] for b in batch])
+                if len(outputs) != len(batch):
+                    raise RuntimeError(f"The batch has {len(batch)} requests but {len(outputs)} outputs were returned.")
+            except Exception as ex:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(ex)
+                continue
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+
 class _DefaultInputData(BaseModel):
     payload: str
 
@@ -149,6 +249,10 @@ class PythonServer(LightningWork, abc.ABC):
         self,
         input_type: type = _DefaultInputData,
         output_type: type = _DefaultOutputData,
+        max_batch_size: int = 1,
+        timeout_batching: float = 0.01,
+        max_queue_size: Optional[int] = None,
+        timeout_request: Optional[float] = None,
         **kwargs,
     ):
         """The PythonServer Class enables to easily get your machine learning server up and running.
@@ -182,6 +286,14 @@ class PythonServer(LightningWork, abc.ABC):
                 and this can be accessed as `response.json()["prediction"]` in the client if
                 you are using requests library
 
+            max_batch_size: If greater than 1, the concurrent requests are grouped into batches of up to
+                ``max_batch_size`` requests. The `predict` method then receives the batch returned by `collate` and
+                its output is split into one response per request by `uncollate`.
+            timeout_batching: The number of seconds a request waits for other requests to be batched with.
+            max_queue_size: The number of requests waiting to be batched above which the new requests are rejected
+                with a 503 status code, so the clients back off instead of piling up.
+            timeout_request: The number of seconds after which a batched request fails with a 408 status code.
+
         Example:
 
             >>> from lightning_app.components.serve.python_server import PythonServer
@@ -196,14 +308,29 @@ class PythonServer(LightningWork, abc.ABC):
             ...         return {"prediction": self._model(request.image)}
             ...
             >>> app = LightningApp(SimpleServer())
+
+            With dynamic batching, ``predict`` receives the list of requests of the batch:
+
+            >>> class BatchedServer(PythonServer):
+            ...
+            ...     def predict(self, requests):
+            ...         return [{"prediction": request.payload} for request in requests]
+            ...
+            >>> app = LightningApp(BatchedServer(max_batch_size=8, timeout_batching=0.01))
         """
         super().__init__(parallel=True, **kwargs)
         if not issubclass(input_type, BaseModel):
             raise TypeError("input_type must be a pydantic BaseModel class")
         if not issubclass(output_type, BaseModel):
             raise TypeError("output_type must be a pydantic BaseModel class")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be greater than 0. Found {max_batch_size}.")
         self._input_type = input_type
         self._output_type = output_type
+        self._max_batch_size = max_batch_size
+        self._timeout_batching = timeout_batching
+        self._max_queue_size = max_queue_size
+        self._timeout_request = timeout_request
 
         self.ready = False
 
@@ -222,6 +349,22 @@ class PythonServer(LightningWork, abc.ABC):
     def configure_output_type(self) -> type:
         return self._output_type
 
+    def collate(self, requests: List[Any]) -> Any:
+        """This method combines the requests of a batch into the input of `predict` when `max_batch_size` is
+        greater than 1.
+
+        Override this to e.g. pad and stack the inputs into a tensor. By default, the list of requests is returned.
+        """
+        return requests
+
+    def uncollate(self, predictions: Any) -> List[Any]:
+        """This method splits the output of `predict` into one response per request of the batch when
+        `max_batch_size` is greater than 1.
+
+        By default, the output is expected to be a sequence with one element per request.
+        """
+        return list(predictions)
+
     @abc.abstractmethod
     def predict(self, request: Any) -> Any:
         """This method is called when a request is made to the server.
@@ -260,6 +403,28 @@ class PythonServer(LightningWork, abc.ABC):
         device = _get_device()
         context = no_grad if device.type == "mps" else inference_mode
 
+        if self._max_batch_size > 1:
+
+            def predict_batch(requests: List[Any]) -> List[Any]:
+                with context():
+                    return self.uncollate(self.predict(self.collate(requests)))
+
+            batcher = _DynamicBatcher(
+                predict_batch,
+                max_batch_size=self._max_batch_size,
+                timeout_batching=self._timeout_batching,
+                max_queue_size=self._max_queue_size,
+                timeout_request=self._timeout_request,
+            )
+            fastapi_app.on_event("startup")(batcher.start)
+            fastapi_app.on_event("shutdown")(batcher.stop)
+
+            async def batched_predict_fn(request: input_type):  # type: ignore
+                return await batcher.submit(request)
+
+            fastapi_app.post("/predict", response_model=output_type)(batched_predict_fn)
+            return
+
         def predict_fn(request: input_type):  # type: ignore
             with context():
                 return self.predict(request)
@@ -10,7 +10,8 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from threading import Event, Lock, Thread
 from time import sleep
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
+from uuid import uuid4
 
 import uvicorn
 from deepdiff import DeepDiff, Delta
@@ -32,6 +33,7 @@ from lightning_app.core.constants import (
     ENABLE_UPLOAD_ENDPOINT,
     FRONTEND_DIR,
     get_cloud_queue_type,
+    QUEUE_BATCH_SIZE,
 )
 from lightning_app.core.queues import QueuingSystem
 from lightning_app.storage import Drive
@@ -53,6 +55,9 @@ else:
 # TODO: fixed uuid for now, it will come from the FastAPI session
 TEST_SESSION_UUID = "1234"
 
+# Identifies this server within the ETag of the states, so the versions of a restarted server aren't mistaken.
+STATE_ETAG_PREFIX = uuid4().hex[:8]
+
 STATE_EVENT = "State changed"
 
 frontend_static_dir = os.path.join(FRONTEND_DIR, "static")
@@ -77,6 +82,52 @@ responses_store = {}
 
 logger = Logger(__name__)
 
+
+class _StatePublisher:
+    """The ``_StatePublisher`` notifies the websocket clients of the app state changes.
+
+    The ``UIRefresher`` thread publishes the new versions of the state and all the clients awaiting a change on the
+    event loop of the server are woken up at once, instead of each of them polling the state store.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+
+    def attach(self) -> None:
+        """Binds the publisher to the running event loop of the server."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._event = asyncio.Event()
+
+    def publish(self, version: int) -> None:
+        """Publishes a new version of the state.
+
+        This is thread safe and is called from the ``UIRefresher`` thread.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._notify(version)
+            return
+        self._loop.call_soon_threadsafe(self._notify, version)
+
+    def _notify(self, version: int) -> None:
+        self.version = version
+        if self._event is not None:
+            event, self._event = self._event, asyncio.Event()
+            event.set()
+
+    async def wait_for_change(self, version: int) -> int:
+        """Waits until a version newer than the provided one is published and returns it."""
+        self.attach()
+        while self.version <= version:
+            await self._event.wait()
+        return self.version
+
+
+state_publisher = _StatePublisher()
+
 # This can be replaced with a consumer that publishes states in a kv-store
 # in a serverless architecture
 
@@ -99,24 +150,31 @@ class UIRefresher(Thread):
         # TODO: Investigate the use of `parallel=True`
         try:
             while not self._exit_event.is_set():
-                self.run_once()
-                # Note: Sleep to reduce queue calls.
-                sleep(self.refresh_interval)
+                # Note: Sleep to reduce queue calls, only when there was nothing to process.
+                if not self.run_once():
+                    sleep(self.refresh_interval)
         except Exception as e:
             logger.error(traceback.print_exc())
             raise e
 
-    def run_once(self):
+    def run_once(self) -> bool:
+        """Processes the published states and the API responses and returns whether any was received."""
+        received = False
         try:
             global app_status
-            state, app_status = self.api_publish_state_queue.get(timeout=0)
+            # only the latest of the states published in the meantime needs to be served.
+            state, app_status = self.api_publish_state_queue.get_many(QUEUE_BATCH_SIZE, timeout=0)[-1]
+            received = True
             with lock:
                 global_app_state_store.set_app_state(TEST_SESSION_UUID, state)
+                version = global_app_state_store.counter
+            state_publisher.publish(version)
         except queue.Empty:
             pass
 
         try:
             responses = self.api_response_queue.get(timeout=0)
+            received = True
             with lock:
                 # TODO: Abstract the responses store to support horizontal scaling.
                 global responses_store
@@ -124,6 +182,7 @@ class UIRefresher(Thread):
                     responses_store[response["id"]] = response["response"]
         except queue.Empty:
             pass
+        return received
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
@@ -179,12 +238,19 @@ if _is_starsessions_available():
 # Before the above happens, we need to refactor App so that it doesn't
 # rely on timeouts, but on sequences of updates (and alignments between
 # ranks)
+#
+# The state is versioned: its version is returned within the `ETag` of the response (`"<server id>-<version>"`), so a
+# client passing it within the `If-None-Match` header gets an empty `304 Not Modified` response if the state didn't
+# change. With `?since=<version>`, `{"version": ..., "patch": [...]}` holding the JSON Patch from that version to the
+# current state is returned, or `{"version": ..., "state": {...}}` if the patch isn't known.
 @fastapi_service.get("/api/v1/state", response_class=JSONResponse)
 async def get_state(
     response: Response,
+    since: Optional[int] = None,
     x_lightning_type: Optional[str] = Header(None),
     x_lightning_session_uuid: Optional[str] = Header(None),
     x_lightning_session_id: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
 ) -> Mapping:
     if x_lightning_session_uuid is None:
         raise Exception("Missing X-Lightning-Session-UUID header")
@@ -199,7 +265,25 @@ async def get_state(
         x_lightning_session_uuid = TEST_SESSION_UUID
         state = global_app_state_store.get_app_state(x_lightning_session_uuid)
         global_app_state_store.set_served_state(x_lightning_session_uuid, state)
-        return state
+        version = global_app_state_store.get_app_state_version(x_lightning_session_uuid)
+        if version is None:
+            return state
+
+        etag = f'"{STATE_ETAG_PREFIX}-{version}"'
+        tags = [] if if_none_match is None else [tag.strip().lstrip("W/") for tag in if_none_match.split(",")]
+        if etag in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        if since is None:
+            return state
+
+        # the version can't be trusted if it was served by another server.
+        patch = None
+        if not tags or any(tag.startswith(f'"{STATE_ETAG_PREFIX}-') for tag in tags):
+            patch = global_app_state_store.get_app_state_patch(x_lightning_session_uuid, since)
+        if patch is None:
+            return {"version": version, "state": state}
+        return {"version": version, "patch": patch}
 
 
 def _get_component_by_name(component_name: str, state):
@@ -377,25 +461,52 @@ async def healthz(response: Response):
 
 # Creates session websocket connection to notify client about any state changes
 # The websocket instance needs to be stored based on session id so it is accessible in the api layer
+# By default, the version of the state is sent on every change. With `?patch=1`, a JSON message holding the version and
+# the JSON Patch from the previously sent version (or the full state if the patch isn't available) is sent instead.
 @fastapi_service.websocket("/api/v1/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     if not ENABLE_STATE_WEBSOCKET:
         await websocket.close()
         return
+    send_patch = websocket.query_params.get("patch", "0").lower() in ("1", "true")
+    if send_patch:
+        # the patches are computed by the state store while such a client is connected
+        global_app_state_store.num_patch_subscribers += 1
     try:
-        counter = global_app_state_store.counter
+        version = global_app_state_store.counter
         while True:
-            if global_app_state_store.counter != counter:
-                await websocket.send_text(f"{global_app_state_store.counter}")
-                counter = global_app_state_store.counter
-                logger.debug("Updated websocket.")
-            await asyncio.sleep(0.01)
+            sent_version = version
+            version = await state_publisher.wait_for_change(version)
+            if send_patch:
+                message = _get_state_message(sent_version)
+                version = message["version"]
+                await websocket.send_text(json.dumps(message))
+            else:
+                await websocket.send_text(f"{version}")
+            logger.debug("Updated websocket.")
     except ConnectionClosed:
         logger.debug("Websocket connection closed")
+    finally:
+        if send_patch:
+            global_app_state_store.num_patch_subscribers -= 1
     await websocket.close()
 
 
+def _get_state_message(since: int) -> Dict[str, Any]:
+    """Returns the JSON Patch from the provided version to the current state, or the full state if the patch isn't
+    known."""
+    with lock:
+        patch = global_app_state_store.get_app_state_patch(TEST_SESSION_UUID, since)
+        if patch is not None:
+            return {"version": global_app_state_store.get_app_state_version(TEST_SESSION_UUID), "patch": patch}
+        # the state store might already hold a version which isn't published yet.
+        return {
+            "version": global_app_state_store.counter,
+            "state": global_app_state_store.get_app_state(TEST_SESSION_UUID),
+        }
+
+
 async def api_catch_all(request: Request, full_path: str):
     raise HTTPException(status_code=404, detail="Not found")
 
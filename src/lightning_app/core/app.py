@@ -19,6 +19,7 @@ from lightning_app.core.constants import (
     FLOW_DURATION_SAMPLES,
     FLOW_DURATION_THRESHOLD,
     FRONTEND_DIR,
+    QUEUE_BATCH_SIZE,
     STATE_ACCUMULATE_WAIT,
 )
 from lightning_app.core.queues import BaseQueue
@@ -43,6 +44,7 @@ from lightning_app.utilities.exceptions import CacheMissException, ExitAppExcept
 from lightning_app.utilities.layout import _collect_layout
 from lightning_app.utilities.proxies import ComponentDelta
 from lightning_app.utilities.scheduler import SchedulerThread
+from lightning_app.utilities.state_tracker import _StateTracker
 from lightning_app.utilities.tree import breadth_first
 from lightning_app.utilities.warnings import LightningFlowWarning
 
@@ -131,6 +133,12 @@ class LightningApp:
         self.should_publish_changes_to_api = False
         self.component_affiliation = None
         self.backend: Optional["Backend"] = None
+        # records the state attributes assigned on the components to compute the state changes incrementally.
+        self._state_tracker = _StateTracker()
+        # when enabled, the incrementally computed changes are verified against a full diff of the state.
+        self._verify_state_changes: bool = False
+        # whether the last collection of the deltas processed API or command requests, which may change the state.
+        self._has_processed_requests: bool = False
         _LightningAppRef.connect(self)
         self.processes: Dict[str, "WorkManager"] = {}
         self.frontends: Dict[str, Frontend] = {}
@@ -175,6 +183,7 @@ class LightningApp:
             if not DEBUG_ENABLED:
                 os.environ["LIGHTNING_DEBUG"] = "2"
             _console.setLevel(logging.DEBUG)
+            self._verify_state_changes = True
 
         logger.debug(f"ENV: {os.environ}")
 
@@ -243,7 +252,8 @@ class LightningApp:
     def set_state(self, state):
         """Method to set a new app state set to the application."""
         self.set_last_state(state)
-        self.root.set_state(state)
+        with self._state_tracker.paused():
+            self.root.set_state(state)
         self.stage = AppStage(state["app_state"]["stage"])
 
     @property
@@ -269,6 +279,7 @@ class LightningApp:
 
     def set_last_state(self, state):
         self._last_state = self.remove_changes(state)
+        self._state_tracker.reset(self.root, self._last_state)
 
     @staticmethod
     def populate_changes(last_state, new_state):
@@ -303,6 +314,13 @@ class LightningApp:
         except queue.Empty:
             return None
 
+    @staticmethod
+    def get_states_changed_from_queue(q: BaseQueue, max_items: int, timeout: Optional[int] = None) -> List:
+        try:
+            return q.get_many(max_items, timeout=timeout or q.default_timeout)
+        except queue.Empty:
+            return []
+
     def check_error_queue(self) -> None:
         exception: Exception = self.get_state_changed_from_queue(self.error_queue)
         if isinstance(exception, Exception):
@@ -336,11 +354,14 @@ class LightningApp:
 
         while (time() - t0) < self.state_accumulate_wait:
 
-            # TODO: Fetch all available deltas at once to reduce queue calls.
-            delta: Optional[
+            # Fetch all the available deltas at once to reduce queue calls.
+            received: List[
                 Union[_DeltaRequest, _APIRequest, _CommandRequest, ComponentDelta]
-            ] = self.get_state_changed_from_queue(self.delta_queue)
-            if delta:
+            ] = self.get_states_changed_from_queue(self.delta_queue, QUEUE_BATCH_SIZE)
+            if not received:
+                break
+
+            for delta in received:
                 if isinstance(delta, _DeltaRequest):
                     deltas.append(delta.delta)
                 elif isinstance(delta, ComponentDelta):
@@ -356,9 +377,8 @@ class LightningApp:
                         deltas.append(delta)
                 else:
                     api_or_command_request_deltas.append(delta)
-            else:
-                break
 
+        self._has_processed_requests = bool(api_or_command_request_deltas)
         if api_or_command_request_deltas:
             _process_requests(self, api_or_command_request_deltas)
 
@@ -376,7 +396,11 @@ class LightningApp:
     def maybe_apply_changes(self) -> None:
         """Get the deltas from both the flow queue and the work queue, merge the two deltas and update the
         state."""
-        self._send_flow_to_work_deltas(self.state)
+        changes = self._state_tracker.collect_changes()
+        if changes is None:
+            self._send_flow_to_work_deltas(self.state)
+        else:
+            self._send_flow_to_work_deltas(None, changes=changes)
 
         if not self.collect_changes:
             return None
@@ -384,17 +408,31 @@ class LightningApp:
         deltas = self._collect_deltas_from_ui_and_work_queues()
 
         if not deltas:
-            # Path and Drive aren't processed by DeepDiff, so we need to convert them to dict.
-            last_state = apply_to_collection(self.last_state, (Path, Drive), lambda x: x.to_dict())
-            state = apply_to_collection(self.state, (Path, Drive), lambda x: x.to_dict())
             # When no deltas are received from the Rest API or work queues,
             # we need to check if the flow modified the state and populate changes.
-            deep_diff = DeepDiff(last_state, state, verbose_level=2)
-            if deep_diff:
-                # TODO: Resolve changes with ``CacheMissException``.
-                # new_state = self.populate_changes(self.last_state, self.state)
-                self.set_last_state(self.state)
-                self._has_updated = True
+            # TODO: Resolve changes with ``CacheMissException``.
+            # new_state = self.populate_changes(self.last_state, self.state)
+            if self._has_processed_requests:
+                # the changes collected above don't include the ones made by the requests
+                changes = self._state_tracker.collect_changes()
+            if changes is None:
+                if self._has_state_changed():
+                    self.set_last_state(self.state)
+                    self._has_updated = True
+                else:
+                    self._state_tracker.reset(self.root, self._last_state)
+            else:
+                stage_changed = self._last_state["app_state"]["stage"] != self.stage.value
+                if changes or stage_changed:
+                    self._state_tracker.commit(changes)
+                    self._last_state["app_state"] = {"stage": self.stage.value}
+                    self._has_updated = True
+                if self._verify_state_changes and self._has_state_changed():
+                    logger.warning(
+                        "The incrementally computed state changes didn't match the full state of the app."
+                    )
+                    self.set_last_state(self.state)
+                    self._has_updated = True
             return False
 
         logger.debug(f"Received {[d.to_dict() for d in deltas]}")
@@ -413,6 +451,12 @@ class LightningApp:
         self.set_state(state)
         self._has_updated = True
 
+    def _has_state_changed(self) -> bool:
+        # Path and Drive aren't processed by DeepDiff, so we need to convert them to dict.
+        last_state = apply_to_collection(self.last_state, (Path, Drive), lambda x: x.to_dict())
+        state = apply_to_collection(self.state, (Path, Drive), lambda x: x.to_dict())
+        return bool(DeepDiff(last_state, state, verbose_level=2))
+
     def run_once(self):
         """Method used to collect changes and run the root Flow once."""
         done = False
@@ -672,10 +716,14 @@ class LightningApp:
             else:
                 return None
 
+        return LightningApp._filter_vars_sent_to_work(child["vars"])
+
+    @staticmethod
+    def _filter_vars_sent_to_work(vars: Dict) -> Dict:
         # Filter private keys and drives
         return {
             k: v
-            for k, v in child["vars"].items()
+            for k, v in vars.items()
             if (
                 not k.startswith("_")
                 and not (isinstance(v, dict) and v.get("type", None) == "__drive__")
@@ -683,7 +731,14 @@ class LightningApp:
             )
         }
 
-    def _send_flow_to_work_deltas(self, state) -> None:
+    def _send_flow_to_work_deltas(self, state, changes: Optional[Dict[str, Dict]] = None) -> None:
+        """Send the changes made by the flow on the works variables.
+
+        Arguments:
+            state: The current state of the app. Only used if ``changes`` aren't provided.
+            changes: The changes per component collected by the state tracker. When provided, only the works with
+                changed variables are diffed.
+        """
         if not self.flow_to_work_delta_queues:
             return
 
@@ -695,8 +750,15 @@ class LightningApp:
             if w.run.has_sent:
                 continue
 
-            state_work = self._extract_vars_from_component_name(w.name, state)
-            last_state_work = self._extract_vars_from_component_name(w.name, self._last_state)
+            if changes is None:
+                state_work = self._extract_vars_from_component_name(w.name, state)
+                last_state_work = self._extract_vars_from_component_name(w.name, self._last_state)
+            elif "vars" in changes.get(w.name, {}):
+                last_vars = self._state_tracker.last_vars(w.name)
+                state_work = self._filter_vars_sent_to_work({**last_vars, **changes[w.name]["vars"]})
+                last_state_work = self._filter_vars_sent_to_work(last_vars)
+            else:
+                continue
 
             # Note: The work was dynamically created or deleted.
             if state_work is None or last_state_work is None:
@@ -25,8 +25,15 @@ APP_SERVER_PORT = 7501
 APP_STATE_MAX_SIZE_BYTES = 1024 * 1024  # 1 MB
 
 WARNING_QUEUE_SIZE = 1000
+# Maximum number of elements fetched from a queue within a single call.
+QUEUE_BATCH_SIZE = int(os.getenv("LIGHTNING_QUEUE_BATCH_SIZE", "100"))
 # different flag because queue debug can be very noisy, and almost always not useful unless debugging the queue itself.
 QUEUE_DEBUG_ENABLED = bool(int(os.getenv("LIGHTNING_QUEUE_DEBUG_ENABLED", "0")))
+# Serializer used by the queues to encode their elements, either ``pickle`` or ``fast``.
+QUEUE_SERIALIZER = os.getenv("LIGHTNING_QUEUE_SERIALIZER", "pickle")
+# Compression applied by the ``fast`` serializer to the large elements, either ``zstd``, ``lz4`` or empty to disable it.
+QUEUE_COMPRESSION = os.getenv("LIGHTNING_QUEUE_COMPRESSION", "")
+QUEUE_COMPRESSION_THRESHOLD = int(os.getenv("LIGHTNING_QUEUE_COMPRESSION_THRESHOLD", str(64 * 1024)))
 
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
@@ -36,6 +43,12 @@ REDIS_QUEUES_READ_DEFAULT_TIMEOUT = 0.005
 HTTP_QUEUE_URL = os.getenv("LIGHTNING_HTTP_QUEUE_URL", "http://localhost:9801")
 HTTP_QUEUE_REFRESH_INTERVAL = float(os.getenv("LIGHTNING_HTTP_QUEUE_REFRESH_INTERVAL", "1"))
 HTTP_QUEUE_TOKEN = os.getenv("LIGHTNING_HTTP_QUEUE_TOKEN", None)
+# Whether the HTTP queue server supports long polling and batched push/pop requests.
+ENABLE_HTTP_QUEUE_LONG_POLLING = bool(int(os.getenv("ENABLE_HTTP_QUEUE_LONG_POLLING", "0")))
+# Maximum duration in seconds the HTTP queue server holds a pop request, it must be lower than the request timeout.
+HTTP_QUEUE_LONG_POLLING_MAX_WAIT = float(os.getenv("LIGHTNING_HTTP_QUEUE_LONG_POLLING_MAX_WAIT", "20"))
+# Number of pushes between two checks of the HTTP queue length when long polling isn't enabled.
+HTTP_QUEUE_LENGTH_CHECK_INTERVAL = int(os.getenv("LIGHTNING_HTTP_QUEUE_LENGTH_CHECK_INTERVAL", "100"))
 
 USER_ID = os.getenv("USER_ID", "1234")
 FRONTEND_DIR = str(Path(__file__).parent.parent / "ui")
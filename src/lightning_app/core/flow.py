@@ -15,6 +15,7 @@ from lightning_app.utilities.component import _sanitize_state
 from lightning_app.utilities.exceptions import ExitAppException
 from lightning_app.utilities.introspection import _is_init_context, _is_run_context
 from lightning_app.utilities.packaging.cloud_compute import _maybe_create_cloud_compute, CloudCompute
+from lightning_app.utilities.state_tracker import _track_setattr, _track_structure_change
 
 
 class LightningFlow:
@@ -222,6 +223,12 @@ class LightningFlow:
 
         super().__setattr__(name, value)
 
+        if self._is_state_attribute(name):
+            if name in self._state:
+                _track_setattr(self, name, value)
+            else:
+                _track_structure_change()
+
     @staticmethod
     def _attach_backend(flow: "LightningFlow", backend):
         """Attach the backend to all flows and its children."""
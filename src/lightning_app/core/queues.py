@@ -1,14 +1,17 @@
 import multiprocessing
-import pickle
 import queue  # needed as import instead from/import for mocking in tests
+import struct
 import time
 import warnings
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from lightning_app.core.constants import (
+    ENABLE_HTTP_QUEUE_LONG_POLLING,
+    HTTP_QUEUE_LENGTH_CHECK_INTERVAL,
+    HTTP_QUEUE_LONG_POLLING_MAX_WAIT,
     HTTP_QUEUE_REFRESH_INTERVAL,
     HTTP_QUEUE_TOKEN,
     HTTP_QUEUE_URL,
@@ -21,6 +24,7 @@ from lightning_app.core.constants import (
     STATE_UPDATE_TIMEOUT,
     WARNING_QUEUE_SIZE,
 )
+from lightning_app.core.serializers import _get_queue_serializer, PickleQueueSerializer, QueueSerializer
 from lightning_app.utilities.app_helpers import Logger
 from lightning_app.utilities.imports import _is_redis_available, requires
 from lightning_app.utilities.network import HTTPClient
@@ -144,12 +148,17 @@ class QueuingSystem(Enum):
 
 
 class BaseQueue(ABC):
-    """Base Queue class that has a similar API to the Queue class in python."""
+    """Base Queue class that has a similar API to the Queue class in python.
+
+    The elements are encoded by the ``serializer`` of the queue, which defaults to the one selected with the
+    ``LIGHTNING_QUEUE_SERIALIZER`` environment variable.
+    """
 
     @abstractmethod
-    def __init__(self, name: str, default_timeout: float):
+    def __init__(self, name: str, default_timeout: float, serializer: Optional[QueueSerializer] = None):
         self.name = name
         self.default_timeout = default_timeout
+        self.serializer = serializer or _get_queue_serializer()
 
     @abstractmethod
     def put(self, item):
@@ -167,6 +176,43 @@ class BaseQueue(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_nowait(self) -> Any:
+        """Returns the left most element of the queue if it is already available, otherwise raises
+        ``queue.Empty``."""
+        pass
+
+    def put_many(self, items: List[Any]) -> None:
+        """Puts the items at the end of the queue.
+
+        Child classes should override this method to push all the items at once.
+        """
+        for item in items:
+            self.put(item)
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        """Returns up to ``max_items`` left most elements of the queue.
+
+        This blocks as :meth:`get` until the first element is available, the following ones are returned only if
+        they are already available, with :meth:`get_nowait`. Child classes should override this method to fetch all
+        the elements at once.
+
+        Parameters
+        ----------
+        max_items:
+            The maximum number of elements to return.
+        timeout:
+            Read timeout in seconds for the first element, in case of input timeout is 0, the `self.default_timeout`
+            is used. A timeout of None can be used to block indefinitely.
+        """
+        items = [self.get(timeout)]
+        while len(items) < max_items:
+            try:
+                items.append(self.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
     @property
     def is_running(self) -> bool:
         """Returns True if the queue is running, False otherwise.
@@ -177,19 +223,28 @@ class BaseQueue(ABC):
 
 
 class MultiProcessQueue(BaseQueue):
-    def __init__(self, name: str, default_timeout: float):
+    def __init__(self, name: str, default_timeout: float, serializer: Optional[QueueSerializer] = None):
         self.name = name
         self.default_timeout = default_timeout
+        self.serializer = serializer or _get_queue_serializer()
+        # The multiprocessing queue already pickles the elements, they are only encoded by the other serializers.
+        self._encode = not isinstance(self.serializer, PickleQueueSerializer)
         context = multiprocessing.get_context("spawn")
         self.queue = context.Queue()
 
     def put(self, item):
-        self.queue.put(item)
+        self.queue.put(self.serializer.dumps(item) if self._encode else item)
 
     def get(self, timeout: int = None):
         if timeout == 0:
             timeout = self.default_timeout
-        return self.queue.get(timeout=timeout, block=(timeout is None))
+        return self._decode(self.queue.get(timeout=timeout, block=(timeout is None)))
+
+    def get_nowait(self) -> Any:
+        return self._decode(self.queue.get_nowait())
+
+    def _decode(self, value: Any) -> Any:
+        return self.serializer.loads(value) if self._encode else value
 
 
 class RedisQueue(BaseQueue):
@@ -201,6 +256,7 @@ class RedisQueue(BaseQueue):
         host: str = None,
         port: int = None,
         password: str = None,
+        serializer: Optional[QueueSerializer] = None,
     ):
         """
         Parameters
@@ -215,6 +271,8 @@ class RedisQueue(BaseQueue):
             The port of the redis server
         password:
             Redis password
+        serializer:
+            The serializer encoding the elements of the queue
         """
         if name is None:
             raise ValueError("You must specify a name for the queue")
@@ -223,9 +281,38 @@ class RedisQueue(BaseQueue):
         self.password = password or REDIS_PASSWORD
         self.name = name
         self.default_timeout = default_timeout
+        self.serializer = serializer or _get_queue_serializer()
         self.redis = redis.Redis(host=self.host, port=self.port, password=self.password)
+        # `LPOP` supports the `count` argument from Redis 6.2
+        self._lpop_count_supported = True
 
     def put(self, item: Any) -> None:
+        self.put_many([item])
+
+    def put_many(self, items: List[Any]) -> None:
+        if not items:
+            # RPUSH requires at least one value
+            return
+        values = [self._dumps(item) for item in items]
+        try:
+            # RPUSH returns the length of the list after the push, no need for an extra LLEN round-trip.
+            queue_len = self.redis.rpush(self.name, *values)
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+
+        if isinstance(queue_len, int) and queue_len >= WARNING_QUEUE_SIZE:
+            warnings.warn(
+                f"The Redis Queue {self.name} length is larger than the "
+                f"recommended length of {WARNING_QUEUE_SIZE}. "
+                f"Found {queue_len}. This might cause your application to crash, "
+                "please investigate this."
+            )
+
+    def _dumps(self, item: Any) -> bytes:
         from lightning_app import LightningWork
 
         is_work = isinstance(item, LightningWork)
@@ -238,27 +325,12 @@ class RedisQueue(BaseQueue):
             backend = item._backend
             item._backend = None
 
-        value = pickle.dumps(item)
-        queue_len = self.length()
-        if queue_len >= WARNING_QUEUE_SIZE:
-            warnings.warn(
-                f"The Redis Queue {self.name} length is larger than the "
-                f"recommended length of {WARNING_QUEUE_SIZE}. "
-                f"Found {queue_len}. This might cause your application to crash, "
-                "please investigate this."
-            )
-        try:
-            self.redis.rpush(self.name, value)
-        except redis.exceptions.ConnectionError:
-            raise ConnectionError(
-                "Your app failed because it couldn't connect to Redis. "
-                "Please try running your app again. "
-                "If the issue persists, please contact support@lightning.ai"
-            )
+        value = self.serializer.dumps(item)
 
         # The backend isn't pickable.
         if is_work:
             item._backend = backend
+        return value
 
     def get(self, timeout: int = None):
         """Returns the left most element of the redis queue.
@@ -287,7 +359,62 @@ class RedisQueue(BaseQueue):
 
         if out is None:
             raise queue.Empty
-        return pickle.loads(out[1])
+        return self.serializer.loads(out[1])
+
+    def get_nowait(self) -> Any:
+        try:
+            out = self.redis.lpop(self.name)
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+
+        if out is None:
+            raise queue.Empty
+        return self.serializer.loads(out)
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        """Returns up to ``max_items`` left most elements of the redis queue.
+
+        The following elements are popped at once after the blocking pop of the first one, with ``LPOP`` on Redis
+        >= 6.2 and ``LRANGE`` and ``LTRIM`` within a transaction on the older versions.
+
+        Parameters
+        ----------
+        max_items:
+            The maximum number of elements to return.
+        timeout:
+            Read timeout in seconds, in case of input timeout is 0, the `self.default_timeout` is used.
+            A timeout of None can be used to block indefinitely.
+        """
+        # the following elements are only popped once the first one is, so none is lost if the first pop times out
+        first = self.get(timeout)
+        if max_items <= 1:
+            return [first]
+
+        try:
+            others = self._pop_available(max_items - 1)
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+        return [first] + [self.serializer.loads(value) for value in others]
+
+    def _pop_available(self, count: int) -> List[bytes]:
+        if self._lpop_count_supported:
+            try:
+                return self.redis.lpop(self.name, count) or []
+            except redis.exceptions.ResponseError:
+                self._lpop_count_supported = False
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.lrange(self.name, 0, count - 1)
+        pipe.ltrim(self.name, count, -1)
+        values, _ = pipe.execute()
+        return values
 
     def clear(self) -> None:
         """Clear all elements in the queue."""
@@ -328,7 +455,7 @@ class RedisQueue(BaseQueue):
 
 
 class HTTPQueue(BaseQueue):
-    def __init__(self, name: str, default_timeout: float):
+    def __init__(self, name: str, default_timeout: float, serializer: Optional[QueueSerializer] = None):
         """
         Parameters
         ----------
@@ -338,18 +465,25 @@ class HTTPQueue(BaseQueue):
             the `name` argument.
         default_timeout:
             Default timeout for redis read
+        serializer:
+            The serializer encoding the elements of the queue
         """
         if name is None:
             raise ValueError("You must specify a name for the queue")
         self.app_id, self._name_suffix = self._split_app_id_and_queue_name(name)
         self.name = name  # keeping the name for debugging
         self.default_timeout = default_timeout
+        self.serializer = serializer or _get_queue_serializer()
         self.client = HTTPClient(base_url=HTTP_QUEUE_URL, auth_token=HTTP_QUEUE_TOKEN, log_callback=debug_log_callback)
+        self._num_puts = 0
 
     def get(self, timeout: int = None) -> Any:
         if not self.app_id:
             raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
 
+        if ENABLE_HTTP_QUEUE_LONG_POLLING:
+            return self._get_long_polling(1, timeout)[0]
+
         # it's a blocking call, we need to loop and call the backend to mimic this behavior
         if timeout is None:
             while True:
@@ -377,26 +511,94 @@ class HTTPQueue(BaseQueue):
                     time.sleep(0.05)
                 pass
 
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        if not ENABLE_HTTP_QUEUE_LONG_POLLING:
+            return super().get_many(max_items, timeout=timeout)
+
+        if not self.app_id:
+            raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
+        return self._get_long_polling(max_items, timeout)
+
+    def get_nowait(self) -> Any:
+        if not self.app_id:
+            raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
+
+        if ENABLE_HTTP_QUEUE_LONG_POLLING:
+            return self._pop_batch(1, wait=0)[0]
+        return self._get()
+
     def _get(self):
         resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", query_params={"action": "pop"})
         if resp.status_code == 204:
             raise queue.Empty
-        return pickle.loads(resp.content)
+        return self.serializer.loads(resp.content)
+
+    def _get_long_polling(self, max_items: int, timeout: Optional[float]) -> List[Any]:
+        # the server holds the request until an element is available or the wait duration is reached,
+        # so there is no need to sleep between the requests.
+        if timeout == 0:
+            return self._pop_batch(max_items, wait=0)
+
+        start_time = time.time()
+        while True:
+            wait = HTTP_QUEUE_LONG_POLLING_MAX_WAIT
+            if timeout is not None:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    raise queue.Empty
+                wait = min(wait, remaining)
+            try:
+                return self._pop_batch(max_items, wait=wait)
+            except queue.Empty:
+                pass
+
+    def _pop_batch(self, count: int, wait: float) -> List[Any]:
+        resp = self.client.post(
+            f"v1/{self.app_id}/{self._name_suffix}",
+            query_params={"action": "pop_batch", "count": count, "wait": wait},
+        )
+        if resp.status_code == 204:
+            raise queue.Empty
+        return [self.serializer.loads(value) for value in _decode_batch(resp.content)]
 
     def put(self, item: Any) -> None:
         if not self.app_id:
             raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
 
-        value = pickle.dumps(item)
-        queue_len = self.length()
+        if ENABLE_HTTP_QUEUE_LONG_POLLING:
+            return self.put_many([item])
+
+        value = self.serializer.dumps(item)
+        # the length is only sampled as it requires an extra request.
+        if self._num_puts % HTTP_QUEUE_LENGTH_CHECK_INTERVAL == 0:
+            self._warn_if_too_long(self.length())
+        self._num_puts += 1
+        resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "push"})
+        if resp.status_code != 201:
+            raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
+
+    def put_many(self, items: List[Any]) -> None:
+        if not ENABLE_HTTP_QUEUE_LONG_POLLING:
+            return super().put_many(items)
+
+        if not self.app_id:
+            raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
+
+        data = _encode_batch([self.serializer.dumps(item) for item in items])
+        resp = self.client.post(
+            f"v1/{self.app_id}/{self._name_suffix}", data=data, query_params={"action": "push_batch"}
+        )
+        if resp.status_code != 201:
+            raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
+        # the server responds with the length of the queue after the push.
+        self._warn_if_too_long(int(resp.text))
+
+    def _warn_if_too_long(self, queue_len: int) -> None:
         if queue_len >= WARNING_QUEUE_SIZE:
             warnings.warn(
                 f"The Queue {self._name_suffix} length is larger than the recommended length of {WARNING_QUEUE_SIZE}. "
                 f"Found {queue_len}. This might cause your application to crash, please investigate this."
             )
-        resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "push"})
-        if resp.status_code != 201:
-            raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
 
     def length(self):
         if not self.app_id:
@@ -429,6 +631,23 @@ class HTTPQueue(BaseQueue):
         return cls(**state)
 
 
+def _encode_batch(values: List[bytes]) -> bytes:
+    """Frames the serialized elements of a batch, each of them being prefixed with its size."""
+    return b"".join(struct.pack(">Q", len(value)) + value for value in values)
+
+
+def _decode_batch(data: bytes) -> List[bytes]:
+    """Splits the framed elements of a batch encoded with ``_encode_batch``."""
+    values = []
+    offset = 0
+    while offset < len(data):
+        (size,) = struct.unpack_from(">Q", data, offset)
+        offset += 8
+        values.append(data[offset : offset + size])
+        offset += size
+    return values
+
+
 def debug_log_callback(message: str, *args: Any, **kwargs: Any) -> None:
     if QUEUE_DEBUG_ENABLED or (Path(LIGHTNING_DIR) / "QUEUE_DEBUG_ENABLED").exists():
         logger.info(message, *args, **kwargs)
@@ -0,0 +1,192 @@
+"""Serializers used by the queues to encode the elements they transport."""
+import io
+import pickle
+import struct
+import sys
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from deepdiff import Delta
+
+from lightning_app.core.constants import QUEUE_COMPRESSION, QUEUE_COMPRESSION_THRESHOLD, QUEUE_SERIALIZER
+from lightning_app.utilities.imports import _is_lz4_available, _is_zstandard_available
+
+if _is_zstandard_available():
+    import zstandard
+
+if _is_lz4_available():
+    import lz4.frame
+
+# The payloads of the ``FastQueueSerializer`` start with this magic byte. It can't be mistaken for a plain pickle
+# payload as these start with the ``PROTO`` opcode (``0x80``).
+_MAGIC = b"\xfe"
+_COMPRESSIONS = ("zstd", "lz4")
+# Flags of the compact encoding of the ``Delta`` objects, only the ones set to a non default value are encoded.
+_DELTA_MUTATE = 1
+_DELTA_VERIFY_SYMMETRY = 2
+_DELTA_RAISE_ERRORS = 4
+_DELTA_NO_LOG_ERRORS = 8
+
+
+class QueueSerializer(ABC):
+    """Base class of the serializers encoding the elements of the queues.
+
+    The payloads are self-describing, so any serializer can decode the elements encoded by the others.
+    """
+
+    @abstractmethod
+    def dumps(self, item: Any) -> bytes:
+        pass
+
+    def loads(self, data: bytes) -> Any:
+        return _loads(data)
+
+
+class PickleQueueSerializer(QueueSerializer):
+    """Encodes the elements with :func:`pickle.dumps` and its default protocol."""
+
+    def dumps(self, item: Any) -> bytes:
+        return pickle.dumps(item)
+
+
+class FastQueueSerializer(QueueSerializer):
+    def __init__(self, compression: Optional[str] = None, compression_threshold: int = QUEUE_COMPRESSION_THRESHOLD):
+        """The ``FastQueueSerializer`` relies on the pickle protocol 5 to reduce the size of the payloads and the
+        time spent to decode them.
+
+        - The contiguous tensors and arrays are transported as out-of-band buffers instead of being copied within the
+          pickle stream.
+        - The ``Delta`` and ``ComponentDelta`` objects are reduced to their diff and their non default flags.
+        - The payloads larger than ``compression_threshold`` bytes are compressed if ``compression`` is provided.
+
+        Arguments:
+            compression: Either ``"zstd"`` or ``"lz4"``. Requires the ``zstandard`` or ``lz4`` package respectively.
+            compression_threshold: The size in bytes above which the payloads get compressed.
+        """
+        if compression and compression not in _COMPRESSIONS:
+            raise ValueError(f"The compression should be one of {_COMPRESSIONS}. Found {compression}.")
+        if compression == "zstd" and not _is_zstandard_available():
+            raise ModuleNotFoundError("The zstd compression requires `zstandard`. Please run: pip install zstandard")
+        if compression == "lz4" and not _is_lz4_available():
+            raise ModuleNotFoundError("The lz4 compression requires `lz4`. Please run: pip install lz4")
+        self.compression = compression or None
+        self.compression_threshold = compression_threshold
+
+    def dumps(self, item: Any) -> bytes:
+        buffers: List[pickle.PickleBuffer] = []
+        file = io.BytesIO()
+        _CompactPickler(file, protocol=5, buffer_callback=buffers.append).dump(item)
+        frames = [file.getbuffer()] + [buffer.raw() for buffer in buffers]
+        body = b"".join(frame for value in frames for frame in (struct.pack(">Q", value.nbytes), value))
+
+        codec = 0
+        if self.compression is not None and len(body) > self.compression_threshold:
+            codec = _COMPRESSIONS.index(self.compression) + 1
+            body = _compress(self.compression, body)
+        return _MAGIC + bytes([codec]) + body
+
+
+def _loads(data: bytes) -> Any:
+    if data[:1] != _MAGIC:
+        return pickle.loads(data)
+
+    codec = data[1]
+    body = memoryview(data)[2:] if codec == 0 else _decompress(_COMPRESSIONS[codec - 1], data[2:])
+    # the buffers are copied once so the decoded arrays are writable as with the in-band pickling.
+    body = memoryview(bytearray(body))
+    frames = []
+    offset = 0
+    while offset < len(body):
+        (size,) = struct.unpack_from(">Q", body, offset)
+        offset += 8
+        frames.append(body[offset : offset + size])
+        offset += size
+    return pickle.loads(frames[0], buffers=frames[1:])
+
+
+def _compress(compression: str, data: bytes) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return lz4.frame.compress(data)
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    if compression == "zstd":
+        if not _is_zstandard_available():
+            raise ModuleNotFoundError("The queue element is compressed with zstd. Please run: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if not _is_lz4_available():
+        raise ModuleNotFoundError("The queue element is compressed with lz4. Please run: pip install lz4")
+    return lz4.frame.decompress(data)
+
+
+@lru_cache(1)
+def _component_delta_cls() -> type:
+    # imported lazily as the proxies depend on the queues.
+    from lightning_app.utilities.proxies import ComponentDelta
+
+    return ComponentDelta
+
+
+class _CompactPickler(pickle.Pickler):
+    def reducer_override(self, obj: Any) -> Any:
+        obj_type = type(obj)
+        if obj_type is Delta:
+            return _reduce_delta(obj)
+        if obj_type is _component_delta_cls():
+            return obj_type, (obj.id, obj.delta)
+        torch = sys.modules.get("torch")
+        if torch is not None and obj_type is torch.Tensor:
+            return _reduce_tensor(obj)
+        return NotImplemented
+
+
+def _reduce_delta(delta: Delta) -> Tuple:
+    # The serializer and deserializer functions of the delta aren't transported, the default ones are used.
+    diff = delta.diff
+    if delta._numpy_paths:
+        diff = {**diff, "_numpy_paths": delta._numpy_paths}
+    flags = (
+        delta.mutate * _DELTA_MUTATE
+        | delta.verify_symmetry * _DELTA_VERIFY_SYMMETRY
+        | delta.raise_errors * _DELTA_RAISE_ERRORS
+        | (not delta.log_errors) * _DELTA_NO_LOG_ERRORS
+    )
+    return _rebuild_delta, ((diff, flags) if flags else (diff,))
+
+
+def _rebuild_delta(diff: Dict[str, Any], flags: int = 0) -> Delta:
+    return Delta(
+        diff,
+        mutate=bool(flags & _DELTA_MUTATE),
+        verify_symmetry=bool(flags & _DELTA_VERIFY_SYMMETRY),
+        raise_errors=bool(flags & _DELTA_RAISE_ERRORS),
+        log_errors=not flags & _DELTA_NO_LOG_ERRORS,
+    )
+
+
+def _reduce_tensor(tensor: Any) -> Any:
+    # Only the plain CPU tensors sharing their memory with a numpy array can be sent as out-of-band buffers.
+    if tensor.device.type != "cpu" or tensor.requires_grad or tensor.is_sparse or tensor.is_quantized:
+        return NotImplemented
+    try:
+        array = tensor.numpy()
+    except (RuntimeError, TypeError):
+        # e.g. the bfloat16 tensors have no numpy equivalent.
+        return NotImplemented
+    return _rebuild_tensor, (array,)
+
+
+def _rebuild_tensor(array: Any) -> Any:
+    import torch
+
+    return torch.from_numpy(array)
+
+
+def _get_queue_serializer(name: str = QUEUE_SERIALIZER) -> QueueSerializer:
+    if name == "pickle":
+        return PickleQueueSerializer()
+    if name == "fast":
+        return FastQueueSerializer(compression=QUEUE_COMPRESSION)
+    raise ValueError(f"The queue serializer should be either `pickle` or `fast`. Found {name}.")
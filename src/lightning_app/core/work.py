@@ -32,6 +32,7 @@ from lightning_app.utilities.packaging.cloud_compute import (
     CloudCompute,
 )
 from lightning_app.utilities.proxies import Action, LightningWorkSetAttrProxy, ProxyWorkRun, unwrap, WorkRunExecutor
+from lightning_app.utilities.state_tracker import _track_setattr
 
 if TYPE_CHECKING:
     from lightning_app.frontend import Frontend
@@ -466,6 +467,9 @@ class LightningWork:
 
         super().__setattr__(name, value)
 
+        if self._is_state_attribute(name) and name in self._state:
+            _track_setattr(self, name, value)
+
     def __getattribute__(self, name):
         try:
             attr = object.__getattribute__(self, name)
@@ -1,6 +1,7 @@
 import typing as t
 
 from lightning_app.utilities.app_helpers import _LightningAppRef, _set_child_name
+from lightning_app.utilities.state_tracker import _track_structure_change
 
 T = t.TypeVar("T")
 
@@ -72,6 +73,7 @@ class Dict(t.Dict[str, T]):
                 self._backend._wrap_run_method(_LightningAppRef().get_current(), v)
         v._name = f"{self.name}.{k}"
         super().__setitem__(k, v)
+        _track_structure_change()
 
     @property
     def works(self):
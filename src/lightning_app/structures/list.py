@@ -1,6 +1,7 @@
 import typing as t
 
 from lightning_app.utilities.app_helpers import _LightningAppRef, _set_child_name
+from lightning_app.utilities.state_tracker import _track_structure_change
 
 T = t.TypeVar("T")
 
@@ -66,6 +67,7 @@ class List(t.List[T]):
         v._name = f"{self.name}.{self._last_index}"
         self._last_index += 1
         super().append(v)
+        _track_structure_change()
 
     @property
     def name(self):
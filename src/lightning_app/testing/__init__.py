@@ -1,4 +1,5 @@
 from lightning_app.testing.helpers import EmptyFlow, EmptyWork
+from lightning_app.testing.http_queue import HTTPQueueServer
 from lightning_app.testing.testing import (
     application_testing,
     delete_cloud_lightning_apps,
@@ -17,4 +18,5 @@ __all__ = [
     "wait_for",
     "EmptyFlow",
     "EmptyWork",
+    "HTTPQueueServer",
 ]
@@ -123,6 +123,9 @@ class _MockQueue(BaseQueue):
         self._queue.append(item)
 
     def get(self, timeout: int = 0):
+        return self.get_nowait()
+
+    def get_nowait(self):
         if not self._queue:
             raise Empty()
         return self._queue.pop(0)
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import defaultdict, deque
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from lightning_app.core.queues import _decode_batch, _encode_batch
+from lightning_app.utilities.network import find_free_network_port
+
+
+class HTTPQueueServer:
+    def __init__(self, host: str = "127.0.0.1", port: Optional[int] = None) -> None:
+        """The HTTPQueueServer is a local stand-in for the server behind the
+        :class:`~lightning_app.core.queues.HTTPQueue`, e.g. to test or benchmark the queues without any cloud access.
+
+        It implements the ``push`` and ``pop`` requests, their batched ``push_batch`` and ``pop_batch`` variants and
+        holds the pop requests up to their ``wait`` duration until an element is available (long polling).
+
+        Example:
+
+            >>> from lightning_app.testing.http_queue import HTTPQueueServer
+            >>> with HTTPQueueServer() as server:
+            ...     url = server.url  # set it as ``LIGHTNING_HTTP_QUEUE_URL`` for the ``HTTPQueue`` to use it.
+
+        Arguments:
+            host: The host to bind the server to.
+            port: The port to bind the server to. A free port is used if not provided.
+        """
+        self.host = host
+        self.port = port or find_free_network_port()
+        self.queues: Dict[str, Deque[bytes]] = defaultdict(deque)
+        self.num_requests = 0
+        self._condition = threading.Condition()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+
+    def __enter__(self) -> "HTTPQueueServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def push(self, name: str, *values: bytes) -> int:
+        with self._condition:
+            self.queues[name].extend(values)
+            self._condition.notify_all()
+            return len(self.queues[name])
+
+    def pop(self, name: str, count: int, wait: float) -> list:
+        deadline = time.monotonic() + wait
+        with self._condition:
+            while not self.queues[name]:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+            values = []
+            while self.queues[name] and len(values) < count:
+                values.append(self.queues[name].popleft())
+            return values
+
+
+def _make_handler(server: HTTPQueueServer):
+    class _HTTPQueueRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            server.num_requests += 1
+            path = urlparse(self.path).path.strip("/")
+            if not path.endswith("/length"):
+                return self._respond(HTTPStatus.NOT_FOUND)
+            name = path[: -len("/length")]
+            self._respond(HTTPStatus.OK, str(len(server.queues[name])).encode())
+
+        def do_POST(self) -> None:
+            server.num_requests += 1
+            url = urlparse(self.path)
+            name = url.path.strip("/")
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            action = params.get("action")
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            if action == "push":
+                server.push(name, body)
+                return self._respond(HTTPStatus.CREATED, b"data pushed")
+
+            if action == "push_batch":
+                length = server.push(name, *_decode_batch(body))
+                return self._respond(HTTPStatus.CREATED, str(length).encode())
+
+            if action in ("pop", "pop_batch"):
+                count = int(params.get("count", 1)) if action == "pop_batch" else 1
+                values = server.pop(name, count, float(params.get("wait", 0)))
+                if not values:
+                    return self._respond(HTTPStatus.NO_CONTENT)
+                return self._respond(HTTPStatus.OK, values[0] if action == "pop" else _encode_batch(values))
+
+            self._respond(HTTPStatus.BAD_REQUEST)
+
+        def _respond(self, status: HTTPStatus, content: bytes = b"") -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return _HTTPQueueRequestHandler
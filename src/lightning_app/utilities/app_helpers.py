@@ -11,10 +11,11 @@ import sys
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, Generator, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import websockets
@@ -23,6 +24,7 @@ from lightning_cloud.openapi import AppinstancesIdBody, Externalv1LightningappIn
 
 import lightning_app
 from lightning_app.utilities.exceptions import LightningAppStateException
+from lightning_app.utilities.json_patch import _make_json_patch
 from lightning_app.utilities.tree import breadth_first
 
 if TYPE_CHECKING:
@@ -40,12 +42,18 @@ class StateEntry:
     app_state: Mapping = field(default_factory=dict)
     served_state: Mapping = field(default_factory=dict)
     session_id: Optional[str] = None
+    version: int = 0
+    # the JSON Patch of the recent versions of the app state along the version they apply to.
+    patches: Deque[Tuple[int, int, List[Dict]]] = field(default_factory=deque)
 
 
 class StateStore(ABC):
     """Base class of State store that provides simple key, value store to keep track of app state, served app
     state."""
 
+    # the number of the connected clients which are sent the JSON Patch of the app state changes
+    num_patch_subscribers: int = 0
+
     @abstractmethod
     def __init__(self):
         pass
@@ -90,13 +98,31 @@ class StateStore(ABC):
         """sets the session id for state of a key 'k'."""
         pass
 
+    def get_app_state_version(self, k: str) -> Optional[int]:
+        """returns the version of the app state for an input key 'k', None if the store doesn't version the
+        states."""
+        return None
+
+    def get_app_state_patch(self, k: str, since: int) -> Optional[List[Dict]]:
+        """returns the JSON Patch from the version 'since' to the current app state for an input key 'k', None if
+        it isn't known."""
+        return None
+
 
 class InMemoryStateStore(StateStore):
-    """In memory simple store to keep track of state through the app REST API."""
+    """In memory simple store to keep track of state through the app REST API.
 
-    def __init__(self):
+    The JSON Patch between the versions of the app state are only computed while they are requested: while
+    ``num_patch_subscribers`` clients are subscribed to them, or within ``patch_request_timeout`` seconds of the last
+    request.
+    """
+
+    def __init__(self, max_patches: int = 100, patch_request_timeout: float = 60.0):
         self.store = {}
         self.counter = 0
+        self.max_patches = max_patches
+        self.patch_request_timeout = patch_request_timeout
+        self._patch_requested_at = -float("inf")
 
     def add(self, k):
         self.store[k] = StateEntry()
@@ -120,8 +146,19 @@ class InMemoryStateStore(StateStore):
                 f"App state size is {state_size} bytes, which is larger than the recommended size "
                 f"of {lightning_app.core.constants.APP_STATE_MAX_SIZE_BYTES}. Please investigate this."
             )
-        self.store[k].app_state = deepcopy(v)
+        entry = self.store[k]
+        app_state = deepcopy(v)
         self.counter += 1
+        # the versions are shared across the keys so a version is never re-used once a key is removed.
+        if self.num_patch_subscribers or time.monotonic() - self._patch_requested_at < self.patch_request_timeout:
+            entry.patches.append((entry.version, self.counter, _make_json_patch(entry.app_state, app_state)))
+            if len(entry.patches) > self.max_patches:
+                entry.patches.popleft()
+        else:
+            # the clients get the full state on their next request
+            entry.patches.clear()
+        entry.app_state = app_state
+        entry.version = self.counter
 
     def set_served_state(self, k, v):
         self.store[k].served_state = deepcopy(v)
@@ -129,6 +166,20 @@ class InMemoryStateStore(StateStore):
     def set_served_session_id(self, k, v):
         self.store[k].session_id = v
 
+    def get_app_state_version(self, k):
+        return self.store[k].version
+
+    def get_app_state_patch(self, k, since):
+        self._patch_requested_at = time.monotonic()
+        entry = self.store[k]
+        patch = []
+        version = since
+        for from_version, to_version, version_patch in entry.patches:
+            if from_version == version:
+                patch.extend(version_patch)
+                version = to_version
+        return patch if version == entry.version else None
+
 
 class _LightningAppRef:
     _app_instance: Optional["LightningApp"] = None
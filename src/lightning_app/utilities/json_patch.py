@@ -0,0 +1,68 @@
+"""Minimal `JSON Patch <https://www.rfc-editor.org/rfc/rfc6902>`_ implementation used to send the app state changes
+to the clients instead of the full state."""
+from copy import deepcopy
+from typing import Any, Dict, List
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _make_json_patch(src: Any, dst: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Returns the JSON Patch operations transforming ``src`` into ``dst``.
+
+    The dictionaries and the lists of the same length are compared recursively, any other change is described as a
+    replacement of the value.
+    """
+    if src is dst:
+        return []
+    if isinstance(src, dict) and isinstance(dst, dict):
+        patch = []
+        for key in src:
+            if key not in dst:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in dst.items():
+            if key not in src:
+                patch.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": deepcopy(value)})
+            else:
+                patch.extend(_make_json_patch(src[key], value, f"{path}/{_escape(key)}"))
+        return patch
+    if isinstance(src, list) and isinstance(dst, list) and len(src) == len(dst):
+        patch = []
+        for index, (src_value, dst_value) in enumerate(zip(src, dst)):
+            patch.extend(_make_json_patch(src_value, dst_value, f"{path}/{index}"))
+        return patch
+    if type(src) is type(dst) and src == dst:
+        return []
+    return [{"op": "replace", "path": path, "value": deepcopy(dst)}]
+
+
+def _apply_json_patch(doc: Any, patch: List[Dict[str, Any]]) -> Any:
+    """Applies in place the ``add``, ``remove`` and ``replace`` operations of a JSON Patch and returns the patched
+    document."""
+    for operation in patch:
+        tokens = [_unescape(token) for token in operation["path"].split("/")[1:]]
+        if not tokens:
+            # the whole document is replaced
+            doc = deepcopy(operation["value"])
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        key = tokens[-1]
+        if isinstance(parent, list):
+            key = len(parent) if key == "-" else int(key)
+        op = operation["op"]
+        if op == "remove":
+            del parent[key]
+        elif op == "add" and isinstance(parent, list):
+            parent.insert(key, deepcopy(operation["value"]))
+        elif op in ("add", "replace"):
+            parent[key] = deepcopy(operation["value"])
+        else:
+            raise ValueError(f"The JSON Patch operation `{op}` isn't supported.")
+    return doc
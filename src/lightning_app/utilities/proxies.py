@@ -12,11 +12,12 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import partial
 from threading import Event, Thread
-from typing import Any, Callable, Dict, Generator, Optional, Set, Tuple, Type, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, Type, TYPE_CHECKING, Union
 
 from deepdiff import DeepDiff, Delta
 from lightning_utilities.core.apply_func import apply_to_collection
 
+from lightning_app.core.constants import QUEUE_BATCH_SIZE
 from lightning_app.core.queues import MultiProcessQueue
 from lightning_app.storage import Path
 from lightning_app.storage.copier import _Copier, _copy_files
@@ -264,6 +265,13 @@ class WorkStateObserver(Thread):
         except queue.Empty:
             return None
 
+    @staticmethod
+    def get_states_changed_from_queue(q: "BaseQueue", timeout: Optional[int] = None) -> List:
+        try:
+            return q.get_many(QUEUE_BATCH_SIZE, timeout=timeout or q.default_timeout)
+        except queue.Empty:
+            return []
+
     def run_once(self) -> None:
         with _state_observer_lock:
             # Add all deltas the LightningWorkSetAttrProxy has processed and sent to the Flow already while
@@ -281,16 +289,20 @@ class WorkStateObserver(Thread):
 
         if self._flow_to_work_delta_queue:
             while True:
-                deep_diff = self.get_state_changed_from_queue(self._flow_to_work_delta_queue)
-                if not isinstance(deep_diff, dict):
+                deep_diffs = self.get_states_changed_from_queue(self._flow_to_work_delta_queue)
+                if not deep_diffs:
                     break
-                try:
-                    with _state_observer_lock:
-                        self._work.apply_flow_delta(Delta(deep_diff, raise_errors=True))
-                except Exception as e:
-                    print(traceback.print_exc())
-                    self._error_queue.put(e)
-                    raise e
+                for deep_diff in deep_diffs:
+                    # the other elements of the batch are still applied
+                    if not isinstance(deep_diff, dict):
+                        continue
+                    try:
+                        with _state_observer_lock:
+                            self._work.apply_flow_delta(Delta(deep_diff, raise_errors=True))
+                    except Exception as e:
+                        print(traceback.print_exc())
+                        self._error_queue.put(e)
+                        raise e
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
@@ -12,6 +12,7 @@ from requests.exceptions import ConnectionError
 from lightning_app.core.constants import APP_SERVER_HOST, APP_SERVER_PORT
 from lightning_app.storage.drive import _maybe_create_drive
 from lightning_app.utilities.app_helpers import AppStatePlugin, BaseStatePlugin, Logger
+from lightning_app.utilities.json_patch import _apply_json_patch
 from lightning_app.utilities.network import _configure_session
 
 logger = Logger(__name__)
@@ -19,6 +20,8 @@ logger = Logger(__name__)
 # GLOBAL APP STATE
 _LAST_STATE = None
 _STATE = None
+# The last state served by each app REST API along its version, so only its changes need to be fetched afterwards.
+_SERVED_STATES: Dict[str, Tuple[str, Dict[str, Any]]] = {}
 
 
 class AppStateType(enum.Enum):
@@ -43,6 +46,7 @@ class AppState:
         "_url",
         "_port",
         "_request_state",
+        "_fetch_state",
         "_store_state",
         "_send_state",
         "_my_affiliation",
@@ -150,25 +154,57 @@ class AppState:
         app_url = f"{self._url}/api/v1/state"
         headers = headers_for(self._plugin.get_context()) if self._plugin else {}
 
-        response_json = {}
-
         # Sometimes the state URL can return an empty JSON when things are being set-up,
         # so we wait for it to be ready here.
-        while response_json == {}:
-            sleep(0.5)
-            try:
-                response = self._session.get(app_url, headers=headers, timeout=1)
-            except ConnectionError as e:
-                raise AttributeError("Failed to connect and fetch the app state. Is the app running?") from e
-
-            self._authorized = response.status_code
-            if self._authorized != 200:
+        while True:
+            state = self._fetch_state(app_url, headers)
+            if state is None:
                 return
+            if state != {}:
+                break
+            sleep(0.5)
 
-            response_json = response.json()
-
-        logger.debug(f"GET STATE {response} {response_json}")
-        self._store_state(response_json)
+        logger.debug(f"GET STATE {state}")
+        self._store_state(state)
+
+    def _fetch_state(self, app_url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Fetches the state from the app REST API, only requesting the changes since the last served state if it
+        is known."""
+        served = _SERVED_STATES.get(app_url)
+        params = {}
+        if served is not None:
+            etag, _ = served
+            headers = {**headers, "If-None-Match": etag}
+            # the ETag is formatted as `"<server id>-<version>"`
+            params["since"] = etag.lstrip("W/").strip('"').rsplit("-", 1)[-1]
+
+        try:
+            response = self._session.get(app_url, headers=headers, params=params, timeout=1)
+        except ConnectionError as e:
+            raise AttributeError("Failed to connect and fetch the app state. Is the app running?") from e
+
+        if served is not None and response.status_code == 304:
+            self._authorized = 200
+            return deepcopy(served[1])
+
+        self._authorized = response.status_code
+        if self._authorized != 200:
+            return None
+
+        response_json = response.json()
+        etag = response.headers.get("ETag")
+        if etag is None:
+            # the app REST API doesn't version the state.
+            return response_json
+
+        if served is None:
+            state = response_json
+        elif "patch" in response_json:
+            state = _apply_json_patch(deepcopy(served[1]), response_json["patch"])
+        else:
+            state = response_json["state"]
+        _SERVED_STATES[app_url] = (etag, deepcopy(state))
+        return state
 
     def __getattr__(self, name: str) -> Union[Any, "AppState"]:
         if name in self._APP_PRIVATE_KEYS:
@@ -0,0 +1,191 @@
+"""Utilities to compute the state changes of an app incrementally instead of diffing its full state."""
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Any, Dict, Generator, Optional, Set, TYPE_CHECKING
+
+from lightning_utilities.core.apply_func import apply_to_collection
+
+from lightning_app.utilities.app_helpers import _LightningAppRef
+from lightning_app.utilities.component import _sanitize_state
+from lightning_app.utilities.tree import breadth_first
+
+if TYPE_CHECKING:
+    from lightning_app.utilities.types import Component
+
+# Values of these types can't be mutated in place, so they only need to be compared when they are re-assigned.
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+
+def _find_component_state(component_name: str, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Returns the sub-state of the component with the given name within the provided app state."""
+    child = state
+    for child_name in component_name.split(".")[1:]:
+        if child_name in child.get("flows", {}):
+            child = child["flows"][child_name]
+        elif child_name in child.get("structures", {}):
+            child = child["structures"][child_name]
+        elif child_name in child.get("works", {}):
+            child = child["works"][child_name]
+        else:
+            return None
+    return child
+
+
+def _to_comparable(value: Any) -> Any:
+    from lightning_app.storage import Drive, Path
+    from lightning_app.storage.payload import _BasePayload
+
+    # Path, Drive and Payload don't implement a value based equality, compare their serialized form instead.
+    return apply_to_collection(value, (Path, Drive, _BasePayload), lambda x: x.to_dict())
+
+
+def _has_changed(old: Any, new: Any) -> bool:
+    if old is new:
+        return False
+    try:
+        if old == new:
+            return False
+    except Exception:
+        pass
+    return _to_comparable(old) != _to_comparable(new)
+
+
+class _StateTracker:
+    """The ``_StateTracker`` records the state attributes assigned on the components of an app.
+
+    Once synced with the last state of the app, it computes the components state changes by only comparing the
+    attributes which were re-assigned, the attributes holding values which can be mutated in place (lists, dicts, paths,
+    etc.) and the calls, instead of converting and diffing the full state tree.
+
+    The in-place mutations of the values aren't recorded, so the attributes holding mutable values are compared at
+    every collection: its cost grows with the size of these values rather than with the number of changes.
+
+    Adding or removing components invalidates the tracker, which needs to be synced again from a full state.
+    """
+
+    def __init__(self) -> None:
+        self._components: Optional[Dict[str, "Component"]] = None
+        self._component_names: Dict[int, str] = {}
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Dict[str, Set[str]] = {}
+        self._volatile: Dict[str, Set[str]] = {}
+        self._paused = False
+
+    @property
+    def is_synced(self) -> bool:
+        return self._components is not None
+
+    def reset(self, root: "Component", last_state: Dict[str, Any]) -> None:
+        """Index the components of the tree along their sub-state within the provided last state of the app."""
+        from lightning_app import LightningFlow, LightningWork
+
+        self._components = {}
+        self._component_names = {}
+        self._states = {}
+        self._dirty = {}
+        self._volatile = {}
+        for component in breadth_first(root, types=(LightningFlow, LightningWork)):
+            component_state = _find_component_state(component.name, last_state)
+            if component_state is None:
+                self.invalidate()
+                return
+            self._components[component.name] = component
+            self._component_names[id(component)] = component.name
+            self._states[component.name] = component_state
+            self._volatile[component.name] = {
+                name for name in component._state if not isinstance(getattr(component, name), _IMMUTABLE_TYPES)
+            }
+
+    def invalidate(self) -> None:
+        """Mark the tracker as out of sync, e.g. when the structure of the tree has changed."""
+        self._components = None
+        self._component_names = {}
+        self._states = {}
+        self._dirty = {}
+        self._volatile = {}
+
+    @contextmanager
+    def paused(self) -> Generator:
+        """Disable the recording of the re-assigned attributes, e.g. while the state is being restored."""
+        paused = self._paused
+        self._paused = True
+        try:
+            yield
+        finally:
+            self._paused = paused
+
+    def on_setattr(self, component: "Component", name: str, value: Any) -> None:
+        # the components are looked up by identity as their name might not be set yet, e.g. within their ``__init__``.
+        component_name = self._component_names.get(id(component))
+        if component_name is None:
+            return
+        if isinstance(value, _IMMUTABLE_TYPES):
+            self._volatile[component_name].discard(name)
+        else:
+            self._volatile[component_name].add(name)
+        if not self._paused:
+            self._dirty.setdefault(component_name, set()).add(name)
+
+    def collect_changes(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Returns the changed ``vars`` and ``calls`` of each component compared to the last state.
+
+        ``None`` is returned when the changes can't be computed incrementally.
+        """
+        if self._components is None:
+            return None
+
+        changes = {}
+        for component_name, component in self._components.items():
+            component_state = self._states[component_name]
+            last_vars = component_state["vars"]
+
+            # A variable was added or removed, the structure of the state has changed.
+            if len(component._state) != len(last_vars):
+                return None
+
+            names = self._volatile[component_name].union(self._dirty.get(component_name, ()))
+            component_vars = _sanitize_state({name: getattr(component, name) for name in names})
+
+            changed_vars = {}
+            for name, value in component_vars.items():
+                if name not in last_vars:
+                    return None
+                if _has_changed(last_vars[name], value):
+                    changed_vars[name] = value
+
+            component_changes = {}
+            if changed_vars:
+                component_changes["vars"] = changed_vars
+            if _has_changed(component_state["calls"], component._calls):
+                component_changes["calls"] = component._calls.copy()
+            if component_changes:
+                changes[component_name] = component_changes
+        return changes
+
+    def commit(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """Apply the collected changes onto the last state of the app."""
+        for component_name, component_changes in changes.items():
+            component_state = self._states[component_name]
+            component_state["vars"].update(deepcopy(component_changes.get("vars", {})))
+            if "calls" in component_changes:
+                component_state["calls"] = deepcopy(component_changes["calls"])
+        self._dirty = {}
+
+    def last_vars(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """Returns the ``vars`` of the component within the last state of the app."""
+        component_state = self._states.get(component_name)
+        return None if component_state is None else component_state["vars"]
+
+
+def _track_setattr(component: "Component", name: str, value: Any) -> None:
+    """Notify the current app that a state attribute of the component was assigned."""
+    app = _LightningAppRef().get_current()
+    if app is not None:
+        app._state_tracker.on_setattr(component, name, value)
+
+
+def _track_structure_change() -> None:
+    """Notify the current app that components were added to or removed from the tree."""
+    app = _LightningAppRef().get_current()
+    if app is not None:
+        app._state_tracker.invalidate()
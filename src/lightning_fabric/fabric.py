@@ -279,7 +279,11 @@ class Fabric:
         return optimizers[0] if len(optimizers) == 1 else tuple(optimizers)
 
     def setup_dataloaders(
-        self, *dataloaders: DataLoader, replace_sampler: bool = True, move_to_device: bool = True
+        self,
+        *dataloaders: DataLoader,
+        replace_sampler: bool = True,
+        move_to_device: bool = True,
+        coalesce: bool = False,
     ) -> Union[DataLoader, List[DataLoader]]:
         """Set up one or multiple dataloaders for accelerated training. If you need different settings for each
         dataloader, call this method individually for each one.
@@ -291,20 +295,24 @@ class Fabric:
             move_to_device: If set ``True`` (default), moves the data returned by the dataloader(s) automatically to
                 the correct device. Set this to ``False`` and alternatively use :meth:`to_device` manually on the
                 returned data.
+            coalesce: If set ``True``, the small CPU tensors of each batch are copied to the CUDA device at once,
+                through a pinned staging buffer. The tensors moved together then share one device allocation.
 
         Returns:
             The wrapped dataloaders, in the same order they were passed in.
         """
         self._validate_setup_dataloaders(dataloaders)
         dataloaders = [
-            self._setup_dataloader(dataloader, replace_sampler=replace_sampler, move_to_device=move_to_device)
+            self._setup_dataloader(
+                dataloader, replace_sampler=replace_sampler, move_to_device=move_to_device, coalesce=coalesce
+            )
             for dataloader in dataloaders
         ]
         dataloaders = dataloaders[0] if len(dataloaders) == 1 else dataloaders
         return dataloaders  # type: ignore[return-value]
 
     def _setup_dataloader(
-        self, dataloader: DataLoader, replace_sampler: bool = True, move_to_device: bool = True
+        self, dataloader: DataLoader, replace_sampler: bool = True, move_to_device: bool = True, coalesce: bool = False
     ) -> DataLoader:
         """Set up a single dataloader for accelerated training.
 
@@ -315,6 +323,7 @@ class Fabric:
             move_to_device: If set ``True`` (default), moves the data returned by the dataloader automatically to
                 the correct device. Set this to ``False`` and alternatively use :meth:`to_device` manually on the
                 returned data.
+            coalesce: If set ``True``, the small CPU tensors of each batch are copied to the CUDA device at once.
 
         Returns:
             The wrapped dataloader.
@@ -331,7 +340,7 @@ class Fabric:
 
         dataloader = self._strategy.process_dataloader(dataloader)
         device = self.device if move_to_device and not isinstance(self._strategy, XLAStrategy) else None
-        lite_dataloader = _FabricDataLoader(dataloader=dataloader, device=device)
+        lite_dataloader = _FabricDataLoader(dataloader=dataloader, device=device, coalesce=coalesce)
         lite_dataloader = cast(DataLoader, lite_dataloader)
         return lite_dataloader
 
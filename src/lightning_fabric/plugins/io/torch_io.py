@@ -16,7 +16,7 @@ import os
 from typing import Any, Callable, Dict, Optional
 
 from lightning_fabric.plugins.io.checkpoint_io import CheckpointIO
-from lightning_fabric.utilities.cloud_io import _atomic_save
+from lightning_fabric.utilities.cloud_io import _atomic_save, _SAVE_BUFFER_SIZE
 from lightning_fabric.utilities.cloud_io import _load as pl_load
 from lightning_fabric.utilities.cloud_io import get_filesystem
 from lightning_fabric.utilities.rank_zero import rank_zero_warn
@@ -27,7 +27,20 @@ log = logging.getLogger(__name__)
 
 class TorchCheckpointIO(CheckpointIO):
     """CheckpointIO that utilizes :func:`torch.save` and :func:`torch.load` to save and load checkpoints
-    respectively, common for most use cases."""
+    respectively, common for most use cases.
+
+    Args:
+        buffer_size: The size in bytes of the buffer through which the checkpoints are streamed to the files. This
+            bounds the memory used on top of the checkpoint itself while saving it.
+    """
+
+    # the default of the subclasses which don't call `super().__init__()`
+    buffer_size: int = _SAVE_BUFFER_SIZE
+
+    def __init__(self, buffer_size: int = _SAVE_BUFFER_SIZE) -> None:
+        if buffer_size <= 0:
+            raise ValueError(f"`buffer_size` should be a positive number of bytes. Found {buffer_size}.")
+        self.buffer_size = buffer_size
 
     def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
         """Save model/training states as a checkpoint file through state-dump and file-write.
@@ -51,7 +64,7 @@ class TorchCheckpointIO(CheckpointIO):
         fs.makedirs(os.path.dirname(path), exist_ok=True)
         try:
             # write the checkpoint dictionary on the file
-            _atomic_save(checkpoint, path)
+            _atomic_save(checkpoint, path, buffer_size=self.buffer_size)
         except AttributeError as err:
             # todo: is this try catch necessary still?
             # https://github.com/Lightning-AI/lightning/pull/431
@@ -59,10 +72,10 @@ class TorchCheckpointIO(CheckpointIO):
             key = "hyper_parameters"
             checkpoint.pop(key, None)
             rank_zero_warn(f"Warning, `{key}` dropped from checkpoint. An attribute is not picklable: {err}")
-            _atomic_save(checkpoint, path)
+            _atomic_save(checkpoint, path, buffer_size=self.buffer_size)
 
     def load_checkpoint(
-        self, path: _PATH, map_location: Optional[Callable] = lambda storage, loc: storage
+        self, path: _PATH, map_location: Optional[Callable] = lambda storage, loc: storage, lazy: bool = False
     ) -> Dict[str, Any]:
         """Loads checkpoint using :func:`torch.load`, with additional handling for ``fsspec`` remote loading of
         files.
@@ -71,6 +84,9 @@ class TorchCheckpointIO(CheckpointIO):
             path: Path to checkpoint
             map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
                 locations.
+            lazy: Whether to read the data of the tensors only once they are used. The tensors are returned as
+                placeholders which get loaded by any torch operation involving them, or by
+                :func:`~lightning_fabric.utilities.load._materialize_tensors`.
 
         Returns: The loaded checkpoint.
 
@@ -83,7 +99,7 @@ class TorchCheckpointIO(CheckpointIO):
         if not fs.exists(path):
             raise FileNotFoundError(f"Checkpoint at {path} not found. Aborting training.")
 
-        return pl_load(path, map_location=map_location)
+        return pl_load(path, map_location=map_location, lazy=lazy)
 
     def remove_checkpoint(self, path: _PATH) -> None:
         """Remove checkpoint file from the filesystem.
@@ -13,8 +13,8 @@
 # limitations under the License.
 """Utilities used for collections."""
 from abc import ABC
-from functools import partial
-from typing import Any, Callable, List, Tuple, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterator, List, Tuple, Union
 
 import numpy as np
 import torch
@@ -66,7 +66,7 @@ class _TransferableDataType(ABC):
         return NotImplemented
 
 
-def move_data_to_device(batch: Any, device: _DEVICE) -> Any:
+def move_data_to_device(batch: Any, device: _DEVICE, coalesce: bool = False) -> Any:
     """Transfers a collection of data to the given device. Any object that defines a method ``to(device)`` will be
     moved and all other objects in the collection will be left untouched.
 
@@ -74,6 +74,7 @@ def move_data_to_device(batch: Any, device: _DEVICE) -> Any:
         batch: A tensor or collection of tensors or anything that has a method ``.to(...)``.
             See :func:`apply_to_collection` for a list of supported collection types.
         device: The device to which the data should be moved
+        coalesce: Whether to copy the small CPU tensors to a CUDA device at once, through a pinned staging buffer.
 
     Return:
         the same collection but with all contained tensors residing on the new device.
@@ -86,11 +87,32 @@ def move_data_to_device(batch: Any, device: _DEVICE) -> Any:
     if isinstance(device, str):
         device = torch.device(device)
 
+    # Don't issue non-blocking transfers to CPU
+    # Same with MPS due to a race condition bug: https://github.com/pytorch/pytorch/issues/83015
+    non_blocking = isinstance(device, torch.device) and device.type not in _BLOCKING_DEVICE_TYPES
+
+    # performance: the collections made of dicts, lists and tuples are flattened and rebuilt by a cached plan
+    leaves: List[Any] = []
+    try:
+        structure = _flatten(batch, leaves)
+    except _UnsupportedStructure:
+        pass
+    else:
+        tensors = [index for index, leaf in enumerate(leaves) if isinstance(leaf, Tensor)]
+        if coalesce and isinstance(device, torch.device) and device.type == "cuda":
+            coalesced = [index for index in tensors if _is_coalescable(leaves[index])]
+            if len(coalesced) > 1:
+                moved = _coalesced_to([leaves[index] for index in coalesced], device, pin_memory=True)
+                for index, tensor in zip(coalesced, moved):
+                    leaves[index] = tensor
+                tensors = sorted(set(tensors).difference(coalesced))
+        for index in tensors:
+            leaves[index] = leaves[index].to(device, non_blocking=non_blocking)
+        return _compile_transfer_plan(structure)(iter(leaves))
+
     def batch_to(data: Any) -> Any:
         kwargs = {}
-        # Don't issue non-blocking transfers to CPU
-        # Same with MPS due to a race condition bug: https://github.com/pytorch/pytorch/issues/83015
-        if isinstance(data, Tensor) and isinstance(device, torch.device) and device.type not in _BLOCKING_DEVICE_TYPES:
+        if isinstance(data, Tensor) and non_blocking:
             kwargs["non_blocking"] = True
         data_output = data.to(device, **kwargs)
         if data_output is not None:
@@ -101,6 +123,87 @@ def move_data_to_device(batch: Any, device: _DEVICE) -> Any:
     return apply_to_collection(batch, dtype=_TransferableDataType, function=batch_to)
 
 
+# the types left untouched by `move_data_to_device`, which don't need to be checked against `_TransferableDataType`
+_ATOMIC_TYPES = (bool, int, float, complex, str, type(None), np.ndarray)
+# the size in bytes up to which the CPU tensors are coalesced into the staging buffer
+_COALESCE_MAX_BYTES = 64 * 1024
+
+
+class _UnsupportedStructure(Exception):
+    """Raised by :func:`_flatten` for the collections rebuilt with :func:`apply_to_collection` instead."""
+
+
+def _flatten(data: Any, leaves: List[Any]) -> Any:
+    """Appends the leaves of the collection to ``leaves`` and returns its structure, which is hashable."""
+    if isinstance(data, Tensor) or type(data) in _ATOMIC_TYPES:
+        leaves.append(data)
+        return None
+    elem_type = type(data)
+    if elem_type is dict:
+        return dict, tuple(data), tuple(_flatten(value, leaves) for value in data.values())
+    if elem_type is list or elem_type is tuple or (isinstance(data, tuple) and hasattr(data, "_fields")):
+        return elem_type, None, tuple(_flatten(value, leaves) for value in data)
+    raise _UnsupportedStructure
+
+
+@lru_cache(maxsize=64)
+def _compile_transfer_plan(structure: Any) -> Callable[[Iterator[Any]], Any]:
+    """Returns the function rebuilding a collection of the given structure from an iterator over its leaves."""
+    if structure is None:
+        return next
+    elem_type, keys, children = structure
+    fns = tuple(_compile_transfer_plan(child) for child in children)
+    if elem_type is dict:
+        return lambda leaves: {key: fn(leaves) for key, fn in zip(keys, fns)}
+    if elem_type is list:
+        return lambda leaves: [fn(leaves) for fn in fns]
+    if elem_type is tuple:
+        return lambda leaves: tuple([fn(leaves) for fn in fns])
+    # a namedtuple
+    return lambda leaves: elem_type(*[fn(leaves) for fn in fns])
+
+
+def _is_coalescable(tensor: Tensor) -> bool:
+    return (
+        tensor.device.type == "cpu"
+        and tensor.layout == torch.strided
+        and not tensor.is_quantized
+        and not tensor.requires_grad
+        and tensor.numel() * tensor.element_size() <= _COALESCE_MAX_BYTES
+    )
+
+
+def _coalesced_to(tensors: List[Tensor], device: torch.device, pin_memory: bool) -> List[Tensor]:
+    """Copies the tensors to the device with a single transfer.
+
+    The tensors are packed into a staging buffer of bytes, aligned on the size of their elements, which is copied to
+    the device and sliced into views with the dtype and shape of each tensor.
+    """
+    # the larger elements first, so less padding is needed to align them
+    order = sorted(range(len(tensors)), key=lambda index: -tensors[index].element_size())
+    parts: List[Tensor] = []
+    offsets = [0] * len(tensors)
+    size = 0
+    for index in order:
+        tensor = tensors[index]
+        padding = -size % tensor.element_size()
+        if padding:
+            parts.append(torch.zeros(padding, dtype=torch.uint8))
+            size += padding
+        offsets[index] = size
+        data = tensor.reshape(-1).view(torch.uint8)
+        parts.append(data)
+        size += data.numel()
+
+    staging = torch.empty(size, dtype=torch.uint8, pin_memory=pin_memory)
+    torch.cat(parts, out=staging)
+    buffer = staging.to(device, non_blocking=pin_memory)
+    return [
+        buffer[offset : offset + tensor.numel() * tensor.element_size()].view(tensor.dtype).view(tensor.shape)
+        for offset, tensor in zip(offsets, tensors)
+    ]
+
+
 def convert_to_tensors(data: Any, device: _DEVICE) -> Any:
     # convert non-tensors
     for src_dtype, conversion_func in CONVERSION_DTYPES:
@@ -13,27 +13,37 @@
 # limitations under the License.
 """Utilities related to data saving/loading."""
 
-import io
+import os
+import zipfile
 from pathlib import Path
 from typing import Any, Dict, IO, Union
+from uuid import uuid4
 
-import fsspec
 import torch
 from fsspec.core import url_to_fs
-from fsspec.implementations.local import AbstractFileSystem
+from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
 
+from lightning_fabric.utilities.imports import _TORCH_GREATER_EQUAL_1_12
+from lightning_fabric.utilities.load import _lazy_load
 from lightning_fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
 
+# The size of the buffer through which the checkpoints are written to the files.
+_SAVE_BUFFER_SIZE = 8 * 1024 * 1024
+
 
 def _load(
     path_or_url: Union[IO, _PATH],
     map_location: _MAP_LOCATION_TYPE = None,
+    lazy: bool = False,
 ) -> Any:
     """Loads a checkpoint.
 
     Args:
         path_or_url: Path or URL of the checkpoint.
         map_location: a function, ``torch.device``, string or a dict specifying how to remap storage locations.
+        lazy: Whether to read the data of the tensors only once they are used, see
+            :func:`~lightning_fabric.utilities.load._lazy_load`. Only the local checkpoints saved in the zip format of
+            :func:`torch.save` can be loaded lazily with PyTorch v1.12.0 onwards, the others are loaded entirely.
     """
     if not isinstance(path_or_url, (str, Path)):
         # any sort of BytesIO or similar
@@ -44,6 +54,8 @@ def _load(
             map_location=map_location,  # type: ignore[arg-type] # upstream annotation is not correct
         )
     fs = get_filesystem(path_or_url)
+    if lazy and _TORCH_GREATER_EQUAL_1_12 and isinstance(fs, LocalFileSystem) and zipfile.is_zipfile(path_or_url):
+        return _lazy_load(fs._strip_protocol(str(path_or_url)), map_location=map_location)
     with fs.open(path_or_url, "rb") as f:
         return torch.load(f, map_location=map_location)
 
@@ -53,17 +65,43 @@ def get_filesystem(path: _PATH, **kwargs: Any) -> AbstractFileSystem:
     return fs
 
 
-def _atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None:
+def _atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path], buffer_size: int = _SAVE_BUFFER_SIZE) -> None:
     """Saves a checkpoint atomically, avoiding the creation of incomplete checkpoints.
 
+    The checkpoint is streamed to the file instead of being serialized in memory first. Locally, it is written to a
+    temporary file next to ``filepath`` which is then renamed. On the remote filesystems, the file is only committed
+    once it is complete. It is committed on its own rather than within a transaction of the filesystem, as the
+    instances of the filesystems are cached and shared by the concurrent saves.
+
     Args:
         checkpoint: The object to save.
             Built to be used with the ``dump_checkpoint`` method, but can deal with anything which ``torch.save``
             accepts.
         filepath: The path to which the checkpoint will be saved.
             This points to the file that the checkpoint will be stored in.
+        buffer_size: The size in bytes of the buffer through which the checkpoint is written to the file.
     """
-    bytesbuffer = io.BytesIO()
-    torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+    fs = get_filesystem(filepath)
+    if not isinstance(fs, LocalFileSystem):
+        f = fs.open(str(filepath), "wb", block_size=buffer_size, autocommit=False)
+        try:
+            with f:
+                torch.save(checkpoint, f)
+        except BaseException:
+            f.discard()
+            raise
+        f.commit()
+        return
+
+    filepath = os.path.abspath(fs._strip_protocol(str(filepath)))
+    dirname, basename = os.path.split(filepath)
+    tmp_filepath = os.path.join(dirname, f".{basename}.{uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_filepath, "wb", buffering=buffer_size) as f:
+            torch.save(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, filepath)
+    finally:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, Iterable, Iterator, List, Optional, Sized, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Sized, Tuple, Union
 
 import torch
 import torch.nn.functional as F
@@ -23,7 +23,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-def _gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tensor]:
+def _gather_all_tensors(result: Tensor, group: Optional[Any] = None, padding: bool = True) -> List[Tensor]:
     """Function to gather all tensors from several DDP processes onto a list that is broadcasted to all processes.
 
     Works on tensors that have the same number of dimensions, but where each dimension may differ. In this case
@@ -32,11 +32,17 @@ def _gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Ten
     Args:
         result: The value to sync
         group: The process group to gather results from. Defaults to all processes (world)
+        padding: Whether the tensors of different shapes are padded to the same shape to be gathered. If ``False``,
+            they are gathered with the exact number of elements of each process, see
+            :func:`_gather_all_tensors_batched`.
 
     Return:
         gathered_result: List with size equal to the process group where
             gathered_result[i] corresponds to result tensor from process i
     """
+    if not padding:
+        return _gather_all_tensors_batched([result], group=group)[0]
+
     if group is None:
         group = torch.distributed.group.WORLD
 
@@ -82,6 +88,75 @@ def _simple_gather_all_tensors(result: Tensor, group: Any, world_size: int) -> L
     return gathered_result
 
 
+def _gather_all_tensors_batched(tensors: Sequence[Tensor], group: Optional[Any] = None) -> List[List[Tensor]]:
+    """Function to gather several tensors from several DDP processes, without padding them.
+
+    The shapes of all the tensors are exchanged at once. The tensors of the same dtype are then flattened into a
+    single buffer gathered with the exact number of elements of each process, using ``all_to_all`` when the numbers
+    differ, and the tensors are rebuilt from it. The processes must provide the same number of tensors, with the
+    same number of dimensions and dtype, but where each dimension may differ.
+
+    Args:
+        tensors: The values to sync
+        group: The process group to gather results from. Defaults to all processes (world)
+
+    Return:
+        gathered_result: List with one entry per tensor where gathered_result[j][i] corresponds to the tensor j from
+            process i
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+    if not tensors:
+        return []
+
+    world_size = torch.distributed.get_world_size(group)
+    device = tensors[0].device
+
+    # 1. Gather the shapes of all the tensors at once
+    local_shapes = torch.tensor([dim for tensor in tensors for dim in tensor.shape], dtype=torch.long, device=device)
+    shapes: List[List[Tuple[int, ...]]] = [[tuple(tensor.shape) for tensor in tensors] for _ in range(world_size)]
+    if local_shapes.numel():
+        all_shapes = torch.empty(world_size * local_shapes.numel(), dtype=torch.long, device=device)
+        torch.distributed.all_gather(list(all_shapes.chunk(world_size)), local_shapes, group=group)
+        shapes = [_split_shapes(dims, tensors) for dims in all_shapes.view(world_size, -1).tolist()]
+
+    # 2. Gather the flattened tensors of each dtype with the exact number of elements of each process
+    result: List[List[Tensor]] = [[] for _ in tensors]
+    by_dtype: Dict[torch.dtype, List[int]] = {}
+    for index, tensor in enumerate(tensors):
+        by_dtype.setdefault(tensor.dtype, []).append(index)
+    for dtype, indices in by_dtype.items():
+        flat = torch.cat([tensors[index].reshape(-1) for index in indices])
+        numels = [[torch.Size(rank_shapes[index]).numel() for index in indices] for rank_shapes in shapes]
+        counts = [sum(rank_numels) for rank_numels in numels]
+        gathered = torch.empty(sum(counts), dtype=dtype, device=device)
+        if all(count == counts[0] for count in counts):
+            torch.distributed.all_gather(list(gathered.chunk(world_size)), flat, group=group)
+        else:
+            torch.distributed.all_to_all_single(
+                gathered,
+                flat.repeat(world_size),
+                output_split_sizes=counts,
+                input_split_sizes=[flat.numel()] * world_size,
+                group=group,
+            )
+
+        # 3. Rebuild the tensors from the gathered buffer
+        for rank, rank_buffer in enumerate(gathered.split(counts)):
+            for index, value in zip(indices, rank_buffer.split(numels[rank])):
+                result[index].append(value.view(shapes[rank][index]))
+    return result
+
+
+def _split_shapes(dims: List[int], tensors: Sequence[Tensor]) -> List[Tuple[int, ...]]:
+    shapes = []
+    offset = 0
+    for tensor in tensors:
+        shapes.append(tuple(dims[offset : offset + tensor.ndim]))
+        offset += tensor.ndim
+    return shapes
+
+
 def _distributed_available() -> bool:
     from lightning_fabric.accelerators.tpu import _tpu_distributed
 
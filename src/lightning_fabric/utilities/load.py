@@ -0,0 +1,254 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazy loading of the checkpoints saved with :func:`torch.save`.
+
+The tensors of the checkpoint are unpickled as :class:`_NotYetLoadedTensor` placeholders, and their data is only read
+from the file when they are used by a torch operation or explicitly materialized with :func:`_materialize_tensors`.
+"""
+import io
+import pickle
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import torch
+from lightning_utilities.core.apply_func import apply_to_collection
+from torch import Tensor
+
+from lightning_fabric.utilities.imports import (
+    _TORCH_GREATER_EQUAL_1_12,
+    _TORCH_GREATER_EQUAL_1_13,
+    _TORCH_GREATER_EQUAL_2_0,
+)
+from lightning_fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
+
+
+class _LazyStorage:
+    """A storage of the checkpoint, read from the file on the first call to :meth:`load`."""
+
+    def __init__(
+        self,
+        file_reader: "torch._C.PyTorchFileReader",
+        key: str,
+        dtype: torch.dtype,
+        numel: int,
+        location: str,
+        restore_location: Callable,
+    ) -> None:
+        self.file_reader = file_reader
+        self.key = key
+        self.dtype = dtype
+        self.numel = numel
+        self.location = location
+        self.restore_location = restore_location
+        self._storage: Optional[Any] = None
+
+    def load(self) -> Any:
+        if self._storage is None:
+            nbytes = self.numel * torch._utils._element_size(self.dtype)
+            name = f"data/{self.key}"
+            # mirrors the loading of the storages in `torch.serialization._load`, whose API changed across versions
+            if _TORCH_GREATER_EQUAL_2_0:
+                storage = self.file_reader.get_storage_from_record(name, nbytes, torch.UntypedStorage)
+                self._storage = torch.storage.TypedStorage(
+                    wrap_storage=self.restore_location(storage._typed_storage()._untyped_storage, self.location),
+                    dtype=self.dtype,
+                    _internal=True,
+                )
+            elif _TORCH_GREATER_EQUAL_1_13:
+                storage = self.file_reader.get_storage_from_record(name, nbytes, torch.UntypedStorage)
+                self._storage = torch.storage.TypedStorage(
+                    wrap_storage=self.restore_location(storage.storage().untyped(), self.location), dtype=self.dtype
+                )
+            else:
+                storage = self.file_reader.get_storage_from_record(name, nbytes, torch._UntypedStorage)
+                self._storage = torch.storage._TypedStorage(
+                    wrap_storage=self.restore_location(storage.storage()._untyped(), self.location), dtype=self.dtype
+                )
+        return self._storage
+
+
+class _NotYetLoadedTensor:
+    """Placeholder of a tensor of the checkpoint whose data wasn't read yet.
+
+    The metadata of the tensor, e.g. its shape and dtype, is available without reading its data. Any torch operation
+    involving the placeholder loads the tensor first.
+    """
+
+    def __init__(
+        self,
+        storage: _LazyStorage,
+        storage_offset: int,
+        size: Tuple[int, ...],
+        stride: Tuple[int, ...],
+        requires_grad: bool,
+        backward_hooks: Dict,
+        metadata: Any = None,
+    ) -> None:
+        self._storage = storage
+        self._rebuild_args = (storage_offset, size, stride, requires_grad, backward_hooks, metadata)
+        self.requires_grad = requires_grad
+        # the steps of the unpickling applied on the loaded tensor, e.g. to turn it into a parameter
+        self._rebuild_steps: List[Callable[[Tensor], Tensor]] = []
+
+    @property
+    def dtype(self) -> torch.dtype:
+        return self._storage.dtype
+
+    @property
+    def shape(self) -> torch.Size:
+        return torch.Size(self._rebuild_args[1])
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def size(self, dim: Optional[int] = None) -> Any:
+        return self.shape if dim is None else self.shape[dim]
+
+    def dim(self) -> int:
+        return self.ndim
+
+    def numel(self) -> int:
+        return self.shape.numel()
+
+    def _load_tensor(self) -> Tensor:
+        tensor = torch._utils._rebuild_tensor_v2(self._storage.load(), *self._rebuild_args)
+        for step in self._rebuild_steps:
+            tensor = step(tensor)
+        return tensor
+
+    @classmethod
+    def __torch_function__(
+        cls, func: Callable, types: Any, args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        args, kwargs = _materialize_tensors((args, kwargs or {}))
+        return func(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(shape={tuple(self.shape)}, dtype={self.dtype})"
+
+
+def _rebuild_tensor_v2(storage: Any, *args: Any) -> Any:
+    if isinstance(storage, _LazyStorage):
+        return _NotYetLoadedTensor(storage, *args)
+    return torch._utils._rebuild_tensor_v2(storage, *args)
+
+
+def _rebuild_parameter(data: Any, requires_grad: bool, *args: Any) -> Any:
+    if isinstance(data, _NotYetLoadedTensor):
+        data.requires_grad = requires_grad
+        data._rebuild_steps.append(lambda tensor: torch._utils._rebuild_parameter(tensor, requires_grad, *args))
+        return data
+    return torch._utils._rebuild_parameter(data, requires_grad, *args)
+
+
+def _rebuild_parameter_with_state(data: Any, requires_grad: bool, *args: Any) -> Any:
+    if isinstance(data, _NotYetLoadedTensor):
+        data.requires_grad = requires_grad
+        data._rebuild_steps.append(
+            lambda tensor: torch._utils._rebuild_parameter_with_state(tensor, requires_grad, *args)
+        )
+        return data
+    return torch._utils._rebuild_parameter_with_state(data, requires_grad, *args)
+
+
+def _rebuild_from_type_v2(func: Callable, new_type: type, args: Tuple, state: Any) -> Any:
+    data = func(*args)
+    if isinstance(data, _NotYetLoadedTensor):
+        data._rebuild_steps.append(
+            lambda tensor: torch._tensor._rebuild_from_type_v2(lambda: tensor, new_type, (), state)
+        )
+        return data
+    return torch._tensor._rebuild_from_type_v2(lambda: data, new_type, (), state)
+
+
+_LAZY_REBUILDS = {
+    ("torch._utils", "_rebuild_tensor_v2"): _rebuild_tensor_v2,
+    ("torch._utils", "_rebuild_parameter"): _rebuild_parameter,
+    ("torch._tensor", "_rebuild_from_type_v2"): _rebuild_from_type_v2,
+}
+if hasattr(torch._utils, "_rebuild_parameter_with_state"):
+    _LAZY_REBUILDS[("torch._utils", "_rebuild_parameter_with_state")] = _rebuild_parameter_with_state
+
+
+def _eager_rebuild(func: Callable, *args: Any) -> Any:
+    # the other tensor types, e.g. the sparse or quantized tensors, are loaded right away
+    args = apply_to_collection(args, _LazyStorage, lambda storage: storage.load())
+    return func(*_materialize_tensors(args))
+
+
+class _LazyLoadingUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, file_reader: "torch._C.PyTorchFileReader", restore_location: Callable):
+        super().__init__(file)
+        self.file_reader = file_reader
+        self.restore_location = restore_location
+        self.storages: Dict[str, _LazyStorage] = {}
+
+    def find_class(self, module: str, name: str) -> Any:
+        from torch.serialization import StorageType
+
+        if "Storage" in name:
+            try:
+                return StorageType(name)
+            except KeyError:
+                pass
+        # see https://github.com/pytorch/pytorch/pull/51633
+        module = "torch._tensor" if module == "torch.tensor" else module
+        if (module, name) in _LAZY_REBUILDS:
+            return _LAZY_REBUILDS[(module, name)]
+        cls = super().find_class(module, name)
+        if module in ("torch._utils", "torch._tensor") and name.startswith("_rebuild"):
+            return partial(_eager_rebuild, cls)
+        return cls
+
+    def persistent_load(self, saved_id: Tuple) -> _LazyStorage:
+        from torch.serialization import _maybe_decode_ascii
+
+        typename, storage_type, key, location, numel = saved_id
+        if _maybe_decode_ascii(typename) != "storage":
+            raise pickle.UnpicklingError(f"Unknown typename for persistent_load, expected 'storage' but got {typename}")
+        if key not in self.storages:
+            untyped_storage_type = torch.UntypedStorage if _TORCH_GREATER_EQUAL_1_13 else torch._UntypedStorage
+            dtype = torch.uint8 if storage_type is untyped_storage_type else storage_type.dtype
+            self.storages[key] = _LazyStorage(
+                self.file_reader, key, dtype, numel, _maybe_decode_ascii(location), self.restore_location
+            )
+        return self.storages[key]
+
+
+def _lazy_load(filename: _PATH, map_location: _MAP_LOCATION_TYPE = None) -> Any:
+    """Loads a checkpoint saved with :func:`torch.save` without reading the data of its tensors.
+
+    Args:
+        filename: Path of the checkpoint. It has to be a local file saved in the zip format of :func:`torch.save`.
+        map_location: a function, ``torch.device``, string or a dict specifying how to remap storage locations.
+            It is applied when the tensors get loaded.
+
+    Raises:
+        NotImplementedError:
+            If the installed PyTorch version is older than 1.12.0.
+    """
+    if not _TORCH_GREATER_EQUAL_1_12:
+        raise NotImplementedError("The lazy loading of the checkpoints is supported from PyTorch v1.12.0 onwards.")
+    # the internals of the serialization are only imported on the supported versions
+    from torch.serialization import _get_restore_location
+
+    file_reader = torch._C.PyTorchFileReader(str(filename))
+    with io.BytesIO(file_reader.get_record("data.pkl")) as f:
+        return _LazyLoadingUnpickler(f, file_reader, _get_restore_location(map_location)).load()
+
+
+def _materialize_tensors(collection: Any) -> Any:
+    """Loads the :class:`_NotYetLoadedTensor` placeholders found in the collection."""
+    return apply_to_collection(collection, _NotYetLoadedTensor, lambda tensor: tensor._load_tensor())
@@ -146,7 +146,7 @@ class _FabricModule(_DeviceDtypeModuleMixin):
 
 
 class _FabricDataLoader:
-    def __init__(self, dataloader: DataLoader, device: Optional[torch.device] = None) -> None:
+    def __init__(self, dataloader: DataLoader, device: Optional[torch.device] = None, coalesce: bool = False) -> None:
         """The FabricDataLoader is a wrapper for the :class:`~torch.utils.data.DataLoader`. It moves the data to
         the device automatically if the device is specified.
 
@@ -154,10 +154,12 @@ class _FabricDataLoader:
             dataloader: The dataloader to wrap
             device: The device to which the data should be moved. By default the device is `None` and no data
                 transfers will be made (identical behavior as :class:`~torch.utils.data.DataLoader`).
+            coalesce: Whether to copy the small CPU tensors of each batch to the CUDA device at once.
         """
         self.__dict__.update(dataloader.__dict__)
         self._dataloader = dataloader
         self._device = device
+        self._coalesce = coalesce
         self._num_iter_calls = 0
 
     @property
@@ -181,7 +183,7 @@ class _FabricDataLoader:
             return
 
         for item in iterator:
-            yield move_data_to_device(item, self._device)
+            yield move_data_to_device(item, self._device, coalesce=self._coalesce)
 
 
 def _process_optimizer_zero_grad_kwargs(optimizer: Optimizer, kwargs: Dict[str, Any]) -> Dict[str, Any]:
@@ -647,6 +647,9 @@ class ModelCheckpoint(Checkpoint):
         # set the last model path before saving because it will be part of the state.
         previous, self.last_model_path = self.last_model_path, filepath
         self._save_checkpoint(trainer, filepath)
+        if self._checkpoint_dropped(trainer):
+            self.last_model_path = previous
+            return
         if previous and previous != filepath:
             self._remove_checkpoint(trainer, previous)
 
@@ -666,6 +669,9 @@ class ModelCheckpoint(Checkpoint):
         # set the best model path before saving because it will be part of the state.
         previous, self.best_model_path = self.best_model_path, filepath
         self._save_checkpoint(trainer, filepath)
+        if self._checkpoint_dropped(trainer):
+            self.best_model_path = previous
+            return
         if self.save_top_k == 1 and previous and previous != filepath:
             self._remove_checkpoint(trainer, previous)
 
@@ -673,6 +679,15 @@ class ModelCheckpoint(Checkpoint):
         self, current: Tensor, trainer: "pl.Trainer", monitor_candidates: Dict[str, Tensor]
     ) -> None:
         k = len(self.best_k_models) + 1 if self.save_top_k == -1 else self.save_top_k
+        # restored if the checkpoint isn't saved
+        previous_state = (
+            dict(self.best_k_models),
+            self.kth_best_model_path,
+            self.kth_value,
+            self.best_model_path,
+            self.best_model_score,
+            self.current_score,
+        )
 
         del_filepath = None
         if len(self.best_k_models) == k and k > 0:
@@ -707,6 +722,16 @@ class ModelCheckpoint(Checkpoint):
                 f" (best {self.best_model_score:0.5f}), saving model to {filepath!r} as top {k}"
             )
         self._save_checkpoint(trainer, filepath)
+        if self._checkpoint_dropped(trainer):
+            (
+                self.best_k_models,
+                self.kth_best_model_path,
+                self.kth_value,
+                self.best_model_path,
+                self.best_model_score,
+                self.current_score,
+            ) = previous_state
+            return
 
         if del_filepath is not None and filepath != del_filepath:
             self._remove_checkpoint(trainer, del_filepath)
@@ -727,6 +752,20 @@ class ModelCheckpoint(Checkpoint):
         exists = self._fs.exists(filepath)
         return trainer.strategy.broadcast(exists)
 
+    @staticmethod
+    def _checkpoint_dropped(trainer: "pl.Trainer") -> bool:
+        """Whether the last checkpoint was dropped by the ``AsyncCheckpointIO`` instead of being saved, in which case
+        the previous checkpoints are kept.
+
+        Only rank 0 saves the checkpoints, so its result is broadcast to all other ranks, keeping their state in sync.
+        """
+        from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
+
+        checkpoint_io = trainer.strategy.checkpoint_io
+        if not isinstance(checkpoint_io, AsyncCheckpointIO):
+            return False
+        return trainer.strategy.broadcast(checkpoint_io.last_save_dropped)
+
     def _remove_checkpoint(self, trainer: "pl.Trainer", filepath: str) -> None:
         """Calls the strategy to remove the checkpoint file."""
         trainer.strategy.remove_checkpoint(filepath)
@@ -31,6 +31,7 @@ from typing_extensions import Self
 import pytorch_lightning as pl
 from lightning_fabric.utilities.cloud_io import _load as pl_load
 from lightning_fabric.utilities.cloud_io import get_filesystem
+from lightning_fabric.utilities.load import _materialize_tensors
 from lightning_fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
 from pytorch_lightning.utilities import _OMEGACONF_AVAILABLE
 from pytorch_lightning.utilities.migration import pl_legacy_patch
@@ -63,6 +64,7 @@ class ModelIO:
         map_location: _MAP_LOCATION_TYPE = None,
         hparams_file: Optional[_PATH] = None,
         strict: bool = True,
+        lazy: bool = False,
         **kwargs: Any,
     ) -> Self:  # type: ignore[valid-type]
         r"""
@@ -96,6 +98,10 @@ class ModelIO:
                 ``hparams`` as :class:`~dict`.
             strict: Whether to strictly enforce that the keys in :attr:`checkpoint_path` match the keys
                 returned by this module's state dict.
+            lazy: Whether to load the checkpoint lazily, reading only the tensors of the state dict of the model
+                (or of the datamodule) from the file. The other tensors, e.g. the optimizer states, are left as
+                placeholders which get loaded if they are used by a torch operation. Only the local checkpoints
+                saved in the zip format of :func:`torch.save` are loaded lazily.
             \**kwargs: Any extra keyword args needed to init the model. Can also be used to override saved
                 hyperparameter values.
 
@@ -142,6 +148,7 @@ class ModelIO:
             map_location,
             hparams_file,
             strict,
+            lazy,
             **kwargs,
         )
 
@@ -152,12 +159,13 @@ def _load_from_checkpoint(
     map_location: _MAP_LOCATION_TYPE = None,
     hparams_file: Optional[_PATH] = None,
     strict: Optional[bool] = None,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> Union["pl.LightningModule", "pl.LightningDataModule"]:
     if map_location is None:
         map_location = cast(_MAP_LOCATION_TYPE, lambda storage, loc: storage)
     with pl_legacy_patch():
-        checkpoint = pl_load(checkpoint_path, map_location=map_location)
+        checkpoint = pl_load(checkpoint_path, map_location=map_location, lazy=lazy)
 
     # convert legacy checkpoints to the new format
     checkpoint = _pl_migrate_checkpoint(
@@ -182,6 +190,13 @@ def _load_from_checkpoint(
     # override the hparams with values that were passed in
     checkpoint[cls.CHECKPOINT_HYPER_PARAMS_KEY].update(kwargs)
 
+    if lazy:
+        # only the states loaded into the new instance are read from the file
+        state_key = "state_dict" if issubclass(cls, pl.LightningModule) else cls.__qualname__
+        for key in (cls.CHECKPOINT_HYPER_PARAMS_KEY, state_key):
+            if key in checkpoint:
+                checkpoint[key] = _materialize_tensors(checkpoint[key])
+
     if issubclass(cls, pl.LightningDataModule):
         return _load_state(cls, checkpoint, **kwargs)
     if issubclass(cls, pl.LightningModule):
@@ -42,6 +42,9 @@ class ExperimentWriter:
     Currently supports to log hyperparameters and metrics in YAML and CSV
     format, respectively.
 
+    The metrics are appended to the CSV file as they are saved and only the rows which weren't saved yet are kept in
+    memory. The file is only rewritten when new metric keys are logged, to add their columns to the header.
+
     Args:
         log_dir: Directory for the experiment logs
     """
@@ -52,6 +55,8 @@ class ExperimentWriter:
     def __init__(self, log_dir: str) -> None:
         self.hparams: Dict[str, Any] = {}
         self.metrics: List[Dict[str, float]] = []
+        self.metrics_keys: List[str] = []
+        self._num_logged_rows = 0
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir) and os.listdir(self.log_dir):
@@ -76,11 +81,12 @@ class ExperimentWriter:
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_logged_rows
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics["step"] = step
         self.metrics.append(metrics)
+        self._num_logged_rows += 1
 
     def save(self) -> None:
         """Save recorded hparams and metrics into files."""
@@ -90,15 +96,30 @@ class ExperimentWriter:
         if not self.metrics:
             return
 
-        last_m = {}
+        new_keys = {}
         for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
-
-        with open(self.metrics_file_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=metrics_keys)
-            writer.writeheader()
-            writer.writerows(self.metrics)
+            new_keys.update(dict.fromkeys(k for k in m if k not in self.metrics_keys))
+
+        if not self.metrics_keys:
+            # the first save overwrites the file of a previous run
+            self.metrics_keys = list(new_keys)
+            self._write_metrics("w", self.metrics)
+        elif new_keys:
+            # the header needs the new columns, the saved rows are read back to rewrite the file
+            with open(self.metrics_file_path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.metrics_keys.extend(new_keys)
+            self._write_metrics("w", rows + self.metrics)
+        else:
+            self._write_metrics("a", self.metrics)
+        self.metrics = []
+
+    def _write_metrics(self, mode: str, rows: List[Dict[str, Any]]) -> None:
+        with open(self.metrics_file_path, mode, newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+            if mode == "w":
+                writer.writeheader()
+            writer.writerows(rows)
 
 
 class CSVLogger(Logger):
@@ -119,7 +140,8 @@ class CSVLogger(Logger):
         version: Experiment version. If version is not specified the logger inspects the save
             directory for existing versions, then automatically assigns the next available version.
         prefix: A string to put at the beginning of metric keys.
-        flush_logs_every_n_steps: How often to flush logs to disk (defaults to every 100 steps).
+        flush_logs_every_n_steps: How often to flush logs to disk (defaults to every 100 steps). The logs are also
+            flushed once this number of rows is waiting to be saved, e.g. when they are logged without a step.
     """
 
     LOGGER_JOIN_CHAR = "-"
@@ -199,7 +221,8 @@ class CSVLogger(Logger):
     def log_metrics(self, metrics: Dict[str, Union[Tensor, float]], step: Optional[int] = None) -> None:
         metrics = _add_prefix(metrics, self._prefix, self.LOGGER_JOIN_CHAR)
         self.experiment.log_metrics(metrics, step)
-        if step is not None and (step + 1) % self._flush_logs_every_n_steps == 0:
+        flush_step = step is not None and (step + 1) % self._flush_logs_every_n_steps == 0
+        if flush_step or len(self.experiment.metrics) >= self._flush_logs_every_n_steps:
             self.save()
 
     @rank_zero_only
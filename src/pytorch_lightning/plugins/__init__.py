@@ -3,6 +3,8 @@ from typing import Union
 from lightning_fabric.plugins import CheckpointIO, ClusterEnvironment, TorchCheckpointIO, XLACheckpointIO
 from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
 from pytorch_lightning.plugins.io.hpu_plugin import HPUCheckpointIO
+from pytorch_lightning.plugins.io.incremental_plugin import IncrementalCheckpointIO
+from pytorch_lightning.plugins.io.sharded_plugin import ShardedCheckpointIO
 from pytorch_lightning.plugins.layer_sync import LayerSync, NativeSyncBatchNorm
 from pytorch_lightning.plugins.precision.apex_amp import ApexMixedPrecisionPlugin
 from pytorch_lightning.plugins.precision.colossalai import ColossalAIPrecisionPlugin
@@ -27,6 +29,8 @@ __all__ = [
     "TorchCheckpointIO",
     "XLACheckpointIO",
     "HPUCheckpointIO",
+    "IncrementalCheckpointIO",
+    "ShardedCheckpointIO",
     "ApexMixedPrecisionPlugin",
     "ColossalAIPrecisionPlugin",
     "DeepSpeedPrecisionPlugin",
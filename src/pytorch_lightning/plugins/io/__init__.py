@@ -14,5 +14,15 @@
 from lightning_fabric.plugins import CheckpointIO, TorchCheckpointIO, XLACheckpointIO
 from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
 from pytorch_lightning.plugins.io.hpu_plugin import HPUCheckpointIO
+from pytorch_lightning.plugins.io.incremental_plugin import IncrementalCheckpointIO
+from pytorch_lightning.plugins.io.sharded_plugin import ShardedCheckpointIO
 
-__all__ = ["AsyncCheckpointIO", "CheckpointIO", "HPUCheckpointIO", "TorchCheckpointIO", "XLACheckpointIO"]
+__all__ = [
+    "AsyncCheckpointIO",
+    "CheckpointIO",
+    "HPUCheckpointIO",
+    "IncrementalCheckpointIO",
+    "ShardedCheckpointIO",
+    "TorchCheckpointIO",
+    "XLACheckpointIO",
+]
@@ -11,52 +11,193 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock, Semaphore
+from typing import Any, Dict, List, Optional, Tuple
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+import torch
+from lightning_utilities.core.apply_func import apply_to_collection
+from torch import Tensor
 
 from lightning_fabric.plugins import CheckpointIO
+from lightning_fabric.utilities.types import _PATH
 from pytorch_lightning.plugins.io.wrapper import _WrappingCheckpointIO
+from pytorch_lightning.utilities.rank_zero import rank_zero_warn
+
+_POLICIES = ("block", "drop")
 
 
 class AsyncCheckpointIO(_WrappingCheckpointIO):
     """``AsyncCheckpointIO`` enables saving the checkpoints asynchronously in a thread.
 
+    The tensors of the checkpoint are copied to CPU buffers before the save is submitted, so the training can go on
+    updating them. The buffers are reused by the next saves. An error raised while saving a checkpoint is raised at
+    the next training step, or by the next call to the plugin. Whether the last checkpoint was dropped under the
+    ``"drop"`` policy is available as ``last_save_dropped``, the
+    :class:`~pytorch_lightning.callbacks.model_checkpoint.ModelCheckpoint` then keeps its previous checkpoints.
+
     .. warning::
 
         This is currently an experimental plugin/feature and API changes are to be expected.
 
     Args:
         checkpoint_io: A checkpoint IO plugin that is used as the basis for async checkpointing.
+        max_workers: The number of threads saving the checkpoints.
+        max_pending: The maximum number of checkpoints being saved at the same time, whose buffers are held in
+            memory.
+        policy: What to do with a new checkpoint when ``max_pending`` checkpoints are being saved. Either
+            ``"block"`` to wait until one of them is saved, or ``"drop"`` to skip saving the new checkpoint.
+        pin_memory: Whether to copy the CUDA tensors to pinned memory buffers, for the copies to be faster.
     """
 
-    def __init__(self, checkpoint_io: Optional["CheckpointIO"] = None) -> None:
+    def __init__(
+        self,
+        checkpoint_io: Optional["CheckpointIO"] = None,
+        max_workers: int = 1,
+        max_pending: int = 2,
+        policy: str = "block",
+        pin_memory: bool = True,
+    ) -> None:
         super().__init__(checkpoint_io)
+        if policy not in _POLICIES:
+            raise ValueError(f"`policy` should be one of {_POLICIES}. Found {policy!r}.")
+        if max_pending < 1:
+            raise ValueError(f"`max_pending` should be at least 1. Found {max_pending}.")
 
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.policy = policy
+        self.pin_memory = pin_memory
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = Semaphore(max_pending)
+        self._lock = Lock()
+        # the saves not completed yet, per path
+        self._futures: Dict[str, Future] = {}
+        # the CPU buffers not used by any pending save, by shape, dtype and pinning
+        self._buffers: Dict[Tuple, List[Tensor]] = defaultdict(list)
         self._error: Optional[BaseException] = None
+        self._num_pending = 0
+        self._num_saved = 0
+        self._num_dropped = 0
+        self._snapshot_time = 0.0
+        self._last_save_time = 0.0
+        self._total_save_time = 0.0
+        self._max_save_time = 0.0
+        self.last_save_dropped = False
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """The statistics of the saves: the number of checkpoints saved, dropped and pending, the duration of the
+        last snapshot of the tensors blocking the training, and the last, mean and max durations of the saves."""
+        with self._lock:
+            return {
+                "saved": self._num_saved,
+                "dropped": self._num_dropped,
+                "pending": self._num_pending,
+                "snapshot_time": self._snapshot_time,
+                "last_save_time": self._last_save_time,
+                "mean_save_time": self._total_save_time / max(self._num_saved, 1),
+                "max_save_time": self._max_save_time,
+            }
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Snapshots the tensors of the checkpoint and uses the ``ThreadPoolExecutor`` to save it using the base
+        ``checkpoint_io``."""
+        self._raise_error()
+        self.last_save_dropped = not self._pending.acquire(blocking=self.policy == "block")
+        if self.last_save_dropped:
+            with self._lock:
+                self._num_dropped += 1
+            rank_zero_warn(
+                f"The checkpoint {path} was dropped as the previous ones are still being saved. Consider increasing"
+                f" `{type(self).__name__}(max_pending=...)` or setting `policy='block'`."
+            )
+            return
+
+        start = time.monotonic()
+        buffers: List[Tensor] = []
+        checkpoint = apply_to_collection(checkpoint, Tensor, self._snapshot, buffers)
+        if any(buffer.is_pinned() for buffer in buffers):
+            # the copies to the pinned buffers are asynchronous
+            torch.cuda.synchronize()
+        snapshot_time = time.monotonic() - start
+
+        key = str(path)
+        with self._lock:
+            self._snapshot_time = snapshot_time
+            self._num_pending += 1
+            previous = self._futures.get(key)
+            future = self._executor.submit(self._save_checkpoint, previous, checkpoint, path, storage_options)
+            self._futures[key] = future
+        future.add_done_callback(lambda f: self._on_saved(f, key, buffers))
+
+    def _snapshot(self, tensor: Tensor, buffers: List[Tensor]) -> Tensor:
+        if tensor.layout != torch.strided or tensor.is_quantized:
+            return tensor.detach().cpu().clone()
+        pin_memory = self.pin_memory and tensor.is_cuda
+        key = (tensor.shape, tensor.dtype, pin_memory)
+        with self._lock:
+            buffer = self._buffers[key].pop() if self._buffers[key] else None
+        if buffer is None:
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=pin_memory)
+        buffer.copy_(tensor.detach(), non_blocking=pin_memory)
+        buffers.append(buffer)
+        return buffer
+
+    def _save_checkpoint(self, previous: Optional[Future], *args: Any) -> None:
+        # the saves to the same path are applied in order
+        if previous is not None:
+            wait([previous])
+        start = time.monotonic()
+        assert self.checkpoint_io is not None
+        self.checkpoint_io.save_checkpoint(*args)
+        duration = time.monotonic() - start
+        with self._lock:
+            self._num_saved += 1
+            self._last_save_time = duration
+            self._total_save_time += duration
+            self._max_save_time = max(self._max_save_time, duration)
+
+    def _on_saved(self, future: Future, key: str, buffers: List[Tensor]) -> None:
+        with self._lock:
+            self._num_pending -= 1
+            if self._futures.get(key) is future:
+                del self._futures[key]
+            for buffer in buffers:
+                self._buffers[(buffer.shape, buffer.dtype, buffer.is_pinned())].append(buffer)
+            if future.exception() is not None and self._error is None:
+                self._error = future.exception()
+        self._pending.release()
 
-    def save_checkpoint(self, *args: Any, **kwargs: Any) -> None:
-        """Uses the ``ThreadPoolExecutor`` to save the checkpoints using the base ``checkpoint_io``."""
+    def _wait(self, path: _PATH) -> None:
+        with self._lock:
+            future = self._futures.get(str(path))
+        if future is not None:
+            wait([future])
 
-        def _save_checkpoint(*args: Any, **kwargs: Any) -> None:
-            try:
-                assert self.checkpoint_io is not None
-                self.checkpoint_io.save_checkpoint(*args, **kwargs)
-            except BaseException as e:
-                self._error = e
+    def _raise_error(self) -> None:
+        """Raises the error raised while saving a checkpoint since the last call, if any."""
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
 
-        self._executor.submit(_save_checkpoint, *args, **kwargs)
+    def remove_checkpoint(self, path: _PATH) -> None:
+        """Removes the checkpoint once it is saved, if it is being saved."""
+        self._raise_error()
+        self._wait(path)
+        super().remove_checkpoint(path)
 
-        # if an error was raised between the previous time `save_checkpoint`` was called and now,
-        # because `executor.submit` is not blocking
-        if self._error:
-            raise self._error
+    def load_checkpoint(self, path: _PATH, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Loads the checkpoint once it is saved, if it is being saved."""
+        self._raise_error()
+        self._wait(path)
+        return super().load_checkpoint(path, *args, **kwargs)
 
     def teardown(self) -> None:
         """This method is called to close the threads."""
         self._executor.shutdown(wait=True)
+        self._buffers.clear()
 
         # if an error was raised anytime in any of the `executor.submit` calls
-        if self._error:
-            raise self._error
+        self._raise_error()
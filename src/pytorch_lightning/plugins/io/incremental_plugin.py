@@ -0,0 +1,268 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+import torch
+from fsspec.implementations.local import AbstractFileSystem
+from lightning_utilities.core.apply_func import apply_to_collection
+from torch import Tensor
+
+from lightning_fabric.plugins import TorchCheckpointIO
+from lightning_fabric.utilities.cloud_io import _atomic_save
+from lightning_fabric.utilities.cloud_io import _load as pl_load
+from lightning_fabric.utilities.cloud_io import _SAVE_BUFFER_SIZE, get_filesystem
+from lightning_fabric.utilities.imports import _TORCH_GREATER_EQUAL_1_13, _TORCH_GREATER_EQUAL_2_0
+from lightning_fabric.utilities.types import _PATH
+
+log = logging.getLogger(__name__)
+
+_INDEX_NAME = "index.json"
+_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class _BlobReference:
+    """Replaces a tensor of the checkpoint stored as a blob."""
+
+    digest: str
+
+
+class IncrementalCheckpointIO(TorchCheckpointIO):
+    """``IncrementalCheckpointIO`` stores the large tensors of the checkpoints in a content-addressed store shared
+    by the checkpoints of the same directory, so the tensors which didn't change since a previous checkpoint, e.g. a
+    frozen backbone, aren't written again.
+
+    The checkpoint files reference the tensors by the hash of their content. The store holds an index of the blobs
+    referenced by each checkpoint, and a blob is deleted once no checkpoint references it anymore. The checkpoints
+    need to be loaded with this plugin. The saves and removals of the checkpoints are serialized, e.g. when they run
+    in the workers of :class:`~pytorch_lightning.plugins.io.AsyncCheckpointIO`, so the index and the blobs stay
+    consistent.
+
+    .. warning::
+
+        This is currently an experimental plugin/feature and API changes are to be expected.
+
+    Args:
+        min_blob_size: The size in bytes from which the tensors are stored as blobs. The smaller ones are saved in
+            the checkpoint file.
+        store_dirname: The name of the directory holding the blobs, next to the checkpoints.
+        max_workers: The number of threads hashing and writing the tensors. Defaults to the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default.
+        buffer_size: The size in bytes of the buffer through which the files are written.
+    """
+
+    # guards the stores across the saves and removals, which may run concurrently in several threads and instances
+    _store_lock = Lock()
+
+    def __init__(
+        self,
+        min_blob_size: int = 1024 * 1024,
+        store_dirname: str = ".blobs",
+        max_workers: Optional[int] = None,
+        buffer_size: int = _SAVE_BUFFER_SIZE,
+    ) -> None:
+        super().__init__(buffer_size=buffer_size)
+        self.min_blob_size = min_blob_size
+        self.store_dirname = store_dirname
+        self.max_workers = max_workers
+        self._lock = Lock()
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Save model/training states as a checkpoint file referencing the blobs of its large tensors.
+
+        Args:
+            checkpoint: dict containing model and trainer state
+            path: write-target path
+            storage_options: not used in ``IncrementalCheckpointIO.save_checkpoint``
+
+        Raises:
+            TypeError:
+                If ``storage_options`` arg is passed in
+        """
+        if storage_options is not None:
+            raise TypeError(
+                "`Trainer.save_checkpoint(..., storage_options=...)` with `storage_options` arg"
+                f" is not supported for `{self.__class__.__name__}`. Please implement your custom `CheckpointIO`"
+                " to define how you'd like to use `storage_options`."
+            )
+        fs = get_filesystem(path)
+        store = self._store(path)
+        fs.makedirs(store, exist_ok=True)
+        # the blobs known to the index mustn't be collected by another save or removal before this one is indexed
+        with self._store_lock:
+            self._save_checkpoint(checkpoint, path, fs, store)
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, fs: AbstractFileSystem, store: str) -> None:
+        index = self._read_index(fs, store)
+        known = {digest for digests in index.values() for digest in digests}
+
+        tensors: Dict[int, Tensor] = {}
+        apply_to_collection(checkpoint, Tensor, lambda t: tensors.setdefault(id(t), t))
+        tensors = {key: t for key, t in tensors.items() if self._is_blob(t)}
+        written: Set[str] = set()
+
+        def store_tensor(tensor: Tensor) -> str:
+            return self._store_tensor(fs, store, tensor, known, written)
+
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            references = dict(zip(tensors, map(_BlobReference, executor.map(store_tensor, tensors.values()))))
+        _atomic_save(
+            apply_to_collection(checkpoint, Tensor, lambda t: references.get(id(t), t)),
+            path,
+            buffer_size=self.buffer_size,
+        )
+
+        name = os.path.basename(path)
+        previous = index.get(name, [])
+        index[name] = sorted({reference.digest for reference in references.values()})
+        self._write_index(fs, store, index)
+        self._collect_garbage(fs, store, index, previous)
+        log.debug(
+            f"Saved the checkpoint {path}: {len(written)} blobs written, {len(index[name]) - len(written)} reused."
+        )
+
+    def load_checkpoint(
+        self, path: _PATH, map_location: Optional[Callable] = lambda storage, loc: storage, lazy: bool = False
+    ) -> Dict[str, Any]:
+        """Loads a checkpoint along with the blobs it references.
+
+        Args:
+            path: Path to checkpoint
+            map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
+                locations.
+            lazy: Whether to read the data of the tensors only once they are used.
+
+        Returns: The loaded checkpoint.
+
+        Raises:
+            FileNotFoundError: If ``path`` is not found by the ``fsspec`` filesystem
+        """
+        checkpoint = super().load_checkpoint(path, map_location=map_location, lazy=lazy)
+        store = self._store(path)
+        digests: Set[str] = set()
+        apply_to_collection(checkpoint, _BlobReference, lambda reference: digests.add(reference.digest))
+
+        def load_blob(digest: str) -> Any:
+            return pl_load(self._blob_path(store, digest), map_location=map_location, lazy=lazy)
+
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            blobs = dict(zip(digests, executor.map(load_blob, digests)))
+        return apply_to_collection(checkpoint, _BlobReference, lambda reference: blobs[reference.digest])
+
+    def remove_checkpoint(self, path: _PATH) -> None:
+        """Remove checkpoint file from the filesystem, along with the blobs no other checkpoint references.
+
+        Args:
+            path: Path to checkpoint
+        """
+        super().remove_checkpoint(path)
+        fs = get_filesystem(path)
+        store = self._store(path)
+        with self._store_lock:
+            index = self._read_index(fs, store)
+            previous = index.pop(os.path.basename(path), None)
+            if previous is None:
+                return
+            self._write_index(fs, store, index)
+            self._collect_garbage(fs, store, index, previous)
+
+    def _store(self, path: _PATH) -> str:
+        return os.path.join(os.path.dirname(str(path)), self.store_dirname)
+
+    @staticmethod
+    def _blob_path(store: str, digest: str) -> str:
+        return os.path.join(store, digest[:2], f"{digest}.pt")
+
+    def _is_blob(self, tensor: Tensor) -> bool:
+        size = tensor.numel() * tensor.element_size()
+        return size >= self.min_blob_size and tensor.layout == torch.strided and not tensor.is_quantized
+
+    def _store_tensor(
+        self, fs: AbstractFileSystem, store: str, tensor: Tensor, known: Set[str], written: Set[str]
+    ) -> str:
+        data = tensor.detach().cpu().contiguous()
+        digest = _digest(data)
+        blob_path = self._blob_path(store, digest)
+        with self._lock:
+            # the tensors with the same content are written once
+            write = digest not in known and digest not in written and not fs.exists(blob_path)
+            if write:
+                written.add(digest)
+        if write:
+            fs.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            # a view would otherwise be saved along with its whole storage
+            if _storage_nbytes(data) != data.numel() * data.element_size():
+                data = data.clone()
+            _atomic_save(data, blob_path, buffer_size=self.buffer_size)
+        return digest
+
+    @staticmethod
+    def _read_index(fs: AbstractFileSystem, store: str) -> Dict[str, List[str]]:
+        index_path = os.path.join(store, _INDEX_NAME)
+        if not fs.exists(index_path):
+            return {}
+        with fs.open(index_path, "r") as f:
+            content = json.load(f)
+        if content.get("version") != _INDEX_VERSION:
+            raise RuntimeError(f"The version {content.get('version')} of the checkpoint store {store} isn't supported.")
+        return content["checkpoints"]
+
+    @staticmethod
+    def _write_index(fs: AbstractFileSystem, store: str, index: Dict[str, List[str]]) -> None:
+        with fs.open(os.path.join(store, _INDEX_NAME), "w") as f:
+            json.dump({"version": _INDEX_VERSION, "checkpoints": index}, f)
+
+    def _collect_garbage(
+        self, fs: AbstractFileSystem, store: str, index: Dict[str, List[str]], candidates: Iterable[str]
+    ) -> None:
+        referenced = {digest for digests in index.values() for digest in digests}
+        for digest in set(candidates) - referenced:
+            blob_path = self._blob_path(store, digest)
+            if fs.exists(blob_path):
+                fs.rm(blob_path)
+                log.debug(f"Removed the unreferenced blob: {blob_path}")
+
+
+def _digest(tensor: Tensor) -> str:
+    # the metadata is part of the digest, the blob being restored as a tensor of this shape and dtype
+    checksum = hashlib.sha256(f"{tensor.dtype}{tuple(tensor.shape)}".encode())
+    checksum.update(_as_bytes(tensor))
+    return checksum.hexdigest()
+
+
+def _storage_nbytes(tensor: Tensor) -> int:
+    if _TORCH_GREATER_EQUAL_2_0:
+        return tensor.untyped_storage().nbytes()
+    return tensor.storage().size() * tensor.element_size()
+
+
+def _as_bytes(tensor: Tensor) -> np.ndarray:
+    """Returns the bytes of a contiguous CPU tensor without copying them."""
+    if _TORCH_GREATER_EQUAL_1_13 and not tensor.is_complex():
+        return tensor.reshape(-1).view(torch.uint8).numpy()
+    # the older versions can't view a tensor as a dtype of another size, its NumPy array is viewed instead
+    if tensor.is_complex():
+        tensor = torch.view_as_real(tensor)
+    if tensor.dtype == torch.bfloat16:
+        # NumPy has no bfloat16
+        tensor = tensor.view(torch.int16)
+    return tensor.reshape(-1).numpy().view(np.uint8)
@@ -0,0 +1,227 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+from uuid import uuid4
+
+import torch
+from fsspec.implementations.local import AbstractFileSystem
+
+from lightning_fabric.plugins import TorchCheckpointIO
+from lightning_fabric.utilities.cloud_io import _load as pl_load
+from lightning_fabric.utilities.cloud_io import _SAVE_BUFFER_SIZE, get_filesystem
+from lightning_fabric.utilities.types import _PATH
+
+log = logging.getLogger(__name__)
+
+_MANIFEST_NAME = "manifest.json"
+_MANIFEST_VERSION = 1
+# the entries of the checkpoint saved as their own shard, the lists get one shard per element
+_SHARDED_KEYS = ("state_dict", "loops", "callbacks")
+_SHARDED_LIST_KEYS = ("optimizer_states",)
+
+
+class ShardedCheckpointIO(TorchCheckpointIO):
+    """``ShardedCheckpointIO`` saves the checkpoints as directories holding one file per shard, written and read in
+    parallel by a pool of threads.
+
+    The model ``state_dict``, each of the optimizer states, the loops and the callbacks states are saved as separate
+    shards, the rest of the checkpoint as another one. A ``manifest.json`` file listing the shards along with their
+    size and checksum is written once all the shards are, so an interrupted save can't be loaded. The shards are
+    written to a temporary directory swapped in at the end, so an interrupted save keeps the previous checkpoint.
+
+    .. warning::
+
+        This is currently an experimental plugin/feature and API changes are to be expected.
+
+    Args:
+        max_workers: The number of threads writing and reading the shards. Defaults to the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default.
+        verify: Whether to verify the checksums of the shards when loading them. Their size is always verified.
+        buffer_size: The size in bytes of the buffer through which the shards are written to the files.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, verify: bool = True, buffer_size: int = _SAVE_BUFFER_SIZE
+    ) -> None:
+        super().__init__(buffer_size=buffer_size)
+        self.max_workers = max_workers
+        self.verify = verify
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Save model/training states as a directory of shards.
+
+        Args:
+            checkpoint: dict containing model and trainer state
+            path: write-target directory
+            storage_options: not used in ``ShardedCheckpointIO.save_checkpoint``
+
+        Raises:
+            TypeError:
+                If ``storage_options`` arg is passed in
+        """
+        if storage_options is not None:
+            raise TypeError(
+                "`Trainer.save_checkpoint(..., storage_options=...)` with `storage_options` arg"
+                f" is not supported for `{self.__class__.__name__}`. Please implement your custom `CheckpointIO`"
+                " to define how you'd like to use `storage_options`."
+            )
+        fs = get_filesystem(path)
+        path = str(path).rstrip("/")
+        dirname, basename = os.path.split(path)
+        # the shards are written next to the checkpoint and swapped in once complete, so the previous checkpoint is
+        # kept if the save is interrupted
+        tmp_path = os.path.join(dirname, f".{basename}.{uuid4().hex[:8]}.tmp")
+        try:
+            shards = self._save_shards(checkpoint, fs, tmp_path)
+            if fs.exists(path):
+                old_path = os.path.join(dirname, f".{basename}.{uuid4().hex[:8]}.old")
+                fs.mv(path, old_path, recursive=True)
+                fs.mv(tmp_path, path, recursive=True)
+                fs.rm(old_path, recursive=True)
+            else:
+                fs.mv(tmp_path, path, recursive=True)
+        finally:
+            if fs.exists(tmp_path):
+                fs.rm(tmp_path, recursive=True)
+        log.debug(f"Saved the checkpoint {path} in {len(shards)} shards.")
+
+    def _save_shards(
+        self, checkpoint: Dict[str, Any], fs: AbstractFileSystem, path: str
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        fs.makedirs(path, exist_ok=True)
+        shards = _split_checkpoint(checkpoint)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            futures = [
+                executor.submit(self._save_shard, fs, os.path.join(path, shard["file"]), obj) for shard, obj in shards
+            ]
+            for (shard, _), future in zip(shards, futures):
+                shard["size"], shard["sha256"] = future.result()
+
+        manifest = {"version": _MANIFEST_VERSION, "shards": [shard for shard, _ in shards]}
+        with fs.open(os.path.join(path, _MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return shards
+
+    def _save_shard(self, fs: AbstractFileSystem, filepath: str, obj: Any) -> Tuple[int, str]:
+        with fs.open(filepath, "wb", block_size=self.buffer_size) as f:
+            writer = _HashingWriter(f)
+            torch.save(obj, writer)
+        return writer.size, writer.hash.hexdigest()
+
+    def load_checkpoint(
+        self, path: _PATH, map_location: Optional[Callable] = lambda storage, loc: storage, lazy: bool = False
+    ) -> Dict[str, Any]:
+        """Loads a checkpoint saved as a directory of shards. The checkpoints saved as a single file are loaded as
+        with the :class:`~lightning_fabric.plugins.io.torch_io.TorchCheckpointIO`.
+
+        Args:
+            path: Path to checkpoint
+            map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
+                locations.
+            lazy: Whether to read the data of the tensors only once they are used. The checksums of the shards aren't
+                verified then.
+
+        Returns: The loaded checkpoint.
+
+        Raises:
+            FileNotFoundError: If ``path`` is not found by the ``fsspec`` filesystem
+            RuntimeError: If the manifest of the checkpoint is missing or a shard doesn't match it
+        """
+        fs = get_filesystem(path)
+        if not fs.isdir(path):
+            return super().load_checkpoint(path, map_location=map_location, lazy=lazy)
+
+        path = str(path)
+        manifest_path = os.path.join(path, _MANIFEST_NAME)
+        if not fs.exists(manifest_path):
+            raise RuntimeError(f"The checkpoint at {path} is incomplete, its `{_MANIFEST_NAME}` is missing.")
+        with fs.open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != _MANIFEST_VERSION:
+            raise RuntimeError(f"The version {manifest.get('version')} of the checkpoint at {path} isn't supported.")
+
+        load_shard = partial(self._load_shard, fs, path, map_location, lazy)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            objs = list(executor.map(load_shard, manifest["shards"]))
+        return _merge_shards(manifest["shards"], objs)
+
+    def _load_shard(
+        self, fs: AbstractFileSystem, path: str, map_location: Optional[Callable], lazy: bool, shard: Dict[str, Any]
+    ) -> Any:
+        filepath = os.path.join(path, shard["file"])
+        size = fs.size(filepath)
+        if size != shard["size"]:
+            raise RuntimeError(f"The shard {filepath} is corrupted: expected {shard['size']} bytes, found {size}.")
+        if self.verify and not lazy:
+            checksum = hashlib.sha256()
+            with fs.open(filepath, "rb") as f:
+                for chunk in iter(partial(f.read, self.buffer_size), b""):
+                    checksum.update(chunk)
+            if checksum.hexdigest() != shard["sha256"]:
+                raise RuntimeError(f"The shard {filepath} is corrupted: its checksum doesn't match the manifest.")
+        return pl_load(filepath, map_location=map_location, lazy=lazy)
+
+
+class _HashingWriter:
+    """Computes the checksum and the size of the data written to the wrapped file."""
+
+    def __init__(self, file: IO) -> None:
+        self.file = file
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: Any) -> int:
+        self.hash.update(data)
+        self.size += memoryview(data).nbytes
+        return self.file.write(data)
+
+    def flush(self) -> None:
+        self.file.flush()
+
+
+def _split_checkpoint(checkpoint: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Any]]:
+    """Returns the shards of the checkpoint along with their entry in the manifest."""
+    remainder = dict(checkpoint)
+    shards = []
+    for key in _SHARDED_KEYS:
+        if key in remainder:
+            shards.append(({"file": f"{key}.pt", "key": key}, remainder.pop(key)))
+    for key in _SHARDED_LIST_KEYS:
+        # the empty lists are kept in the remainder, so the key is restored
+        if remainder.get(key):
+            for index, obj in enumerate(remainder.pop(key)):
+                shards.append(({"file": f"{key}.{index}.pt", "key": key, "index": index}, obj))
+    shards.append(({"file": "checkpoint.pt"}, remainder))
+    return shards
+
+
+def _merge_shards(shards: List[Dict[str, Any]], objs: List[Any]) -> Dict[str, Any]:
+    checkpoint: Dict[str, Any] = {}
+    lists: Dict[str, Dict[int, Any]] = {}
+    for shard, obj in zip(shards, objs):
+        if "key" not in shard:
+            checkpoint.update(obj)
+        elif "index" in shard:
+            lists.setdefault(shard["key"], {})[shard["index"]] = obj
+        else:
+            checkpoint[shard["key"]] = obj
+    for key, elements in lists.items():
+        checkpoint[key] = [elements[index] for index in range(len(elements))]
+    return checkpoint
@@ -16,6 +16,7 @@ from pytorch_lightning.profilers.base import PassThroughProfiler
 from pytorch_lightning.profilers.profiler import Profiler
 from pytorch_lightning.profilers.pytorch import PyTorchProfiler
 from pytorch_lightning.profilers.simple import SimpleProfiler
+from pytorch_lightning.profilers.timeline import TimelineProfiler
 from pytorch_lightning.profilers.xla import XLAProfiler
 
 __all__ = [
@@ -24,5 +25,6 @@ __all__ = [
     "PassThroughProfiler",
     "PyTorchProfiler",
     "SimpleProfiler",
+    "TimelineProfiler",
     "XLAProfiler",
 ]
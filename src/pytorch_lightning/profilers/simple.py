@@ -13,6 +13,7 @@
 # limitations under the License.
 """Profiler to check if there are any bottlenecks in your code."""
 import logging
+import math
 import os
 import time
 from collections import defaultdict
@@ -21,6 +22,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from lightning_fabric.utilities.cloud_io import get_filesystem
 from pytorch_lightning.profilers.profiler import Profiler
 
 log = logging.getLogger(__name__)
@@ -30,6 +32,61 @@ _TABLE_DATA_EXTENDED = List[_TABLE_ROW_EXTENDED]
 _TABLE_ROW = Tuple[str, float, float]
 _TABLE_DATA = List[_TABLE_ROW]
 
+# the number of durations kept before being aggregated, and the size of the sample estimating the quantiles
+_BUFFER_SIZE = 1024
+_SAMPLE_SIZE = 1024
+_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class _StreamingStats:
+    """Aggregates the durations of an action in constant memory: their count, sum, sum of squares, min and max,
+    along with a fixed-size uniform sample of the durations estimating their quantiles."""
+
+    def __init__(self, rng: np.random.Generator) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._rng = rng
+        self._sample = np.empty(_SAMPLE_SIZE)
+
+    def update(self, values: np.ndarray) -> None:
+        num_values = len(values)
+        if num_values == 0:
+            return
+        self.total += float(values.sum())
+        self.total_squares += float(np.dot(values, values))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        # reservoir sampling of the durations, applied to the new ones at once
+        filled = min(self.count, _SAMPLE_SIZE)
+        num_copied = min(num_values, _SAMPLE_SIZE - filled)
+        self._sample[filled : filled + num_copied] = values[:num_copied]
+        if num_copied < num_values:
+            # the i-th duration replaces a random element of the sample with probability `_SAMPLE_SIZE / (i + 1)`
+            positions = np.arange(self.count + num_copied + 1, self.count + num_values + 1)
+            indices = (self._rng.random(len(positions)) * positions).astype(np.int64)
+            sampled = indices < _SAMPLE_SIZE
+            self._sample[indices[sampled]] = values[num_copied:][sampled]
+        self.count += num_values
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return math.nan
+        return math.sqrt(max(self.total_squares / self.count - self.mean**2, 0.0))
+
+    def quantiles(self) -> List[float]:
+        if not self.count:
+            return [math.nan] * len(_QUANTILES)
+        return [float(q) for q in np.quantile(self._sample[: min(self.count, _SAMPLE_SIZE)], _QUANTILES)]
+
 
 class SimpleProfiler(Profiler):
     """This profiler simply records the duration of actions (in seconds) and reports the mean duration of each
@@ -40,6 +97,8 @@ class SimpleProfiler(Profiler):
         dirpath: Optional[Union[str, Path]] = None,
         filename: Optional[str] = None,
         extended: bool = True,
+        streaming: bool = False,
+        summary_interval: Optional[float] = None,
     ) -> None:
         """
         Args:
@@ -53,6 +112,13 @@ class SimpleProfiler(Profiler):
             extended: If ``True``, adds extra columns representing number of calls and percentage of total time spent on
                 respective action.
 
+            streaming: If ``True``, the durations of each action are aggregated by batches instead of being all kept in
+                ``recorded_durations``, so the memory used doesn't grow with the length of the run. The extended report
+                then also shows the standard deviation, the min and max and estimates of the quantiles of the durations.
+
+            summary_interval: If set, the interval in seconds at which a summary of the durations recorded so far is
+                written to the ``interim`` file of the ``dirpath``, or logged when there is none.
+
         Raises:
             ValueError:
                 If you attempt to start an action which has already started, or
@@ -61,8 +127,13 @@ class SimpleProfiler(Profiler):
         super().__init__(dirpath=dirpath, filename=filename)
         self.current_actions: Dict[str, float] = {}
         self.recorded_durations: Dict = defaultdict(list)
+        self.recorded_stats: Dict[str, _StreamingStats] = {}
         self.extended = extended
+        self.streaming = streaming
+        self.summary_interval = summary_interval
         self.start_time = time.monotonic()
+        self._next_summary_time = self.start_time + (summary_interval or 0.0)
+        self._rng = np.random.default_rng(0)
 
     def start(self, action_name: str) -> None:
         if action_name in self.current_actions:
@@ -75,20 +146,58 @@ class SimpleProfiler(Profiler):
             raise ValueError(f"Attempting to stop recording an action ({action_name}) which was never started.")
         start_time = self.current_actions.pop(action_name)
         duration = end_time - start_time
-        self.recorded_durations[action_name].append(duration)
+        durations = self.recorded_durations[action_name]
+        durations.append(duration)
+        if self.streaming and len(durations) == _BUFFER_SIZE:
+            self._aggregate(action_name)
+        if self.summary_interval is not None and end_time >= self._next_summary_time:
+            self._next_summary_time = end_time + self.summary_interval
+            self._write_interim_summary()
+
+    def _write_interim_summary(self) -> None:
+        summary = self.summary()
+        if self.dirpath is None:
+            self._rank_zero_info(summary)
+            return
+        filepath = os.path.join(self.dirpath, self._prepare_filename(action_name="interim"))
+        fs = get_filesystem(filepath)
+        fs.makedirs(self.dirpath, exist_ok=True)
+        # the file holds the latest summary only
+        with fs.open(filepath, "w") as f:
+            f.write(summary)
+
+    def _aggregate(self, action_name: str) -> None:
+        """Aggregates the durations recorded for the action in its streaming statistics."""
+        stats = self.recorded_stats.get(action_name)
+        if stats is None:
+            stats = self.recorded_stats[action_name] = _StreamingStats(self._rng)
+        durations = self.recorded_durations[action_name]
+        stats.update(np.array(durations))
+        durations.clear()
+
+    def _aggregate_all(self) -> None:
+        for action_name in self.recorded_durations:
+            self._aggregate(action_name)
+
+    def _action_stats(self) -> Dict[str, Tuple[float, int, float]]:
+        """Returns the mean duration, the number of calls and the total duration of each action."""
+        if self.streaming:
+            self._aggregate_all()
+            return {a: (stats.mean, stats.count, stats.total) for a, stats in self.recorded_stats.items()}
+        return {a: (np.mean(d), len(d), np.sum(d)) for a, d in self.recorded_durations.items()}
 
     def _make_report_extended(self) -> Tuple[_TABLE_DATA_EXTENDED, float, float]:
         total_duration = time.monotonic() - self.start_time
         report = [
-            (a, np.mean(d), len(d), np.sum(d), 100.0 * np.sum(d) / total_duration)
-            for a, d in self.recorded_durations.items()
+            (a, mean, num_calls, total, 100.0 * total / total_duration)
+            for a, (mean, num_calls, total) in self._action_stats().items()
         ]
         report.sort(key=lambda x: x[4], reverse=True)
         total_calls = sum(x[2] for x in report)
         return report, total_calls, total_duration
 
     def _make_report(self) -> _TABLE_DATA:
-        report = [(action, np.mean(d), np.sum(d)) for action, d in self.recorded_durations.items()]
+        report = [(action, mean, total) for action, (mean, _, total) in self._action_stats().items()]
         report.sort(key=lambda x: x[1], reverse=True)
         return report
 
@@ -98,38 +207,54 @@ class SimpleProfiler(Profiler):
         if self._stage is not None:
             output_string += f"{self._stage.upper()} "
         output_string += f"Profiler Report{sep}"
+        if self.streaming:
+            self._aggregate_all()
+        actions = self.recorded_stats if self.streaming else self.recorded_durations
 
         if self.extended:
 
-            if len(self.recorded_durations) > 0:
-                max_key = max(len(k) for k in self.recorded_durations.keys())
+            if len(actions) > 0:
+                max_key = max(len(k) for k in actions.keys())
 
-                def log_row_extended(action: str, mean: str, num_calls: str, total: str, per: str) -> str:
-                    row = f"{sep}|  {action:<{max_key}s}\t|  {mean:<15}\t|"
-                    row += f"  {num_calls:<15}\t|  {total:<15}\t|  {per:<15}\t|"
-                    return row
+                def log_row_extended(action: str, *columns: str) -> str:
+                    return f"{sep}|  {action:<{max_key}s}\t|" + "".join(f"  {column:<15}\t|" for column in columns)
 
+                streaming_header = ("Std (s)", "Min (s)", *(f"P{q * 100:g} (s)" for q in _QUANTILES), "Max (s)")
                 header_string = log_row_extended(
-                    "Action", "Mean duration (s)", "Num calls", "Total time (s)", "Percentage %"
+                    "Action",
+                    "Mean duration (s)",
+                    *(streaming_header if self.streaming else ()),
+                    "Num calls",
+                    "Total time (s)",
+                    "Percentage %",
                 )
                 output_string_len = len(header_string.expandtabs())
                 sep_lines = f"{sep}{'-' * output_string_len}"
                 output_string += sep_lines + header_string + sep_lines
                 report_extended: _TABLE_DATA_EXTENDED
                 report_extended, total_calls, total_duration = self._make_report_extended()
-                output_string += log_row_extended("Total", "-", f"{total_calls:}", f"{total_duration:.5}", "100 %")
+                streaming_total = ("-",) * len(streaming_header) if self.streaming else ()
+                output_string += log_row_extended(
+                    "Total", "-", *streaming_total, f"{total_calls:}", f"{total_duration:.5}", "100 %"
+                )
                 output_string += sep_lines
                 for action, mean_duration, num_calls, total_duration, duration_per in report_extended:
+                    streaming_columns: Tuple[str, ...] = ()
+                    if self.streaming:
+                        stats = self.recorded_stats[action]
+                        values = (stats.std, stats.min, *stats.quantiles(), stats.max)
+                        streaming_columns = tuple(f"{value:.5}" for value in values)
                     output_string += log_row_extended(
                         action,
                         f"{mean_duration:.5}",
+                        *streaming_columns,
                         f"{num_calls}",
                         f"{total_duration:.5}",
                         f"{duration_per:.5}",
                     )
                 output_string += sep_lines
         else:
-            max_key = max(len(k) for k in self.recorded_durations)
+            max_key = max(len(k) for k in actions)
 
             def log_row(action: str, mean: str, total: str) -> str:
                 return f"{sep}|  {action:<{max_key}s}\t|  {mean:<15}\t|  {total:<15}\t|"
@@ -0,0 +1,178 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Profiler recording the timeline of the actions, exported in the Chrome trace format."""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from lightning_fabric.utilities.cloud_io import get_filesystem
+from lightning_fabric.utilities.types import _PATH
+from pytorch_lightning.profilers.profiler import Profiler
+from pytorch_lightning.utilities.rank_zero import rank_zero_only
+
+log = logging.getLogger(__name__)
+
+# the name of the action, the id of the thread, and the begin and end times in nanoseconds
+_EVENT = Tuple[str, int, int, int]
+
+
+class TimelineProfiler(Profiler):
+    """This profiler records when each action begins and ends, along with the thread and the rank running it, and
+    exports them as a `Chrome trace <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_
+    viewable in ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_.
+
+    The dataloader stalls, the overhead of the hooks or the pauses to save the checkpoints then show up on a single
+    timeline. The traces of the ranks share the same clock and can be merged with :meth:`merge`.
+    """
+
+    def __init__(
+        self,
+        dirpath: Optional[Union[str, Path]] = None,
+        filename: Optional[str] = None,
+        max_events: int = 1_000_000,
+    ) -> None:
+        """
+        Args:
+            dirpath: Directory path for the ``filename`` and the trace. If ``dirpath`` is ``None`` but ``filename``
+                is present, the ``trainer.log_dir`` (from
+                :class:`~pytorch_lightning.loggers.tensorboard.TensorBoardLogger`) will be used.
+
+            filename: If present, filename where the profiler results will be saved instead of printing to stdout.
+                The ``.txt`` extension will be used automatically. The trace is saved next to it with the ``.json``
+                extension.
+
+            max_events: The number of events kept. Once reached, the oldest events are dropped.
+
+        Raises:
+            ValueError:
+                If you attempt to start an action which has already started in the same thread, or
+                if you attempt to stop recording an action which was never started.
+        """
+        super().__init__(dirpath=dirpath, filename=filename)
+        if max_events < 1:
+            raise ValueError(f"`max_events` should be at least 1. Found {max_events}.")
+        self.max_events = max_events
+        self.current_actions: Dict[Tuple[int, str], int] = {}
+        self.recorded_events: Deque[_EVENT] = deque(maxlen=max_events)
+        self._num_events = 0
+        self._thread_names: Dict[int, str] = {}
+        self._rank = 0
+        # converts the monotonic clock of the events to the epoch, shared by the ranks
+        self._clock_offset = time.time_ns() - time.perf_counter_ns()
+
+    def setup(self, stage: str, local_rank: Optional[int] = None, log_dir: Optional[str] = None) -> None:
+        super().setup(stage=stage, local_rank=local_rank, log_dir=log_dir)
+        self._rank = getattr(rank_zero_only, "rank", 0)
+
+    def start(self, action_name: str) -> None:
+        thread_id = threading.get_ident()
+        key = (thread_id, action_name)
+        if key in self.current_actions:
+            raise ValueError(f"Attempted to start {action_name} which has already started.")
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self.current_actions[key] = time.perf_counter_ns()
+
+    def stop(self, action_name: str) -> None:
+        end_time = time.perf_counter_ns()
+        thread_id = threading.get_ident()
+        begin_time = self.current_actions.pop((thread_id, action_name), None)
+        if begin_time is None:
+            raise ValueError(f"Attempting to stop recording an action ({action_name}) which was never started.")
+        self.recorded_events.append((action_name, thread_id, begin_time, end_time))
+        self._num_events += 1
+
+    def trace(self) -> Dict[str, Any]:
+        """Returns the recorded events in the Chrome trace format, the rank being the process id."""
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self._rank, "args": {"name": f"rank {self._rank}"}},
+            {"name": "process_sort_index", "ph": "M", "pid": self._rank, "args": {"sort_index": self._rank}},
+        ]
+        for thread_id, thread_name in self._thread_names.items():
+            events.append(
+                {"name": "thread_name", "ph": "M", "pid": self._rank, "tid": thread_id, "args": {"name": thread_name}}
+            )
+        for action_name, thread_id, begin_time, end_time in self.recorded_events:
+            events.append(
+                {
+                    "name": action_name,
+                    "cat": _category(action_name),
+                    "ph": "X",
+                    "ts": (begin_time + self._clock_offset) / 1000,
+                    "dur": (end_time - begin_time) / 1000,
+                    "pid": self._rank,
+                    "tid": thread_id,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self) -> str:
+        if not self.recorded_events:
+            return ""
+        filename = self._prepare_trace_filename()
+        filepath = filename if self.dirpath is None else os.path.join(self.dirpath, filename)
+        fs = get_filesystem(filepath)
+        if self.dirpath is not None:
+            fs.makedirs(self.dirpath, exist_ok=True)
+        with fs.open(filepath, "w") as f:
+            json.dump(self.trace(), f)
+
+        num_dropped = self._num_events - len(self.recorded_events)
+        report = f"{len(self.recorded_events)} events exported to {filepath}"
+        if num_dropped:
+            report += f" ({num_dropped} older events were dropped, consider increasing `max_events`)"
+        return self._stats_to_str({"timeline": report})
+
+    def _prepare_trace_filename(self) -> str:
+        # the traces are named after the global rank, the local ranks of the nodes being the same
+        args = [arg for arg in (self._stage, self.filename) if arg]
+        if self._local_rank is not None:
+            args.append(str(self._rank))
+        return "-".join(args + ["trace"]) + ".json"
+
+    def teardown(self, stage: Optional[str]) -> None:
+        super().teardown(stage=stage)
+        self.current_actions.clear()
+        self.recorded_events.clear()
+        self._num_events = 0
+        self._thread_names.clear()
+
+    @staticmethod
+    def merge(filepaths: Iterable[_PATH], filepath: _PATH) -> None:
+        """Merges the traces exported by the ranks into a single trace.
+
+        Args:
+            filepaths: The paths of the traces to merge.
+            filepath: The path of the merged trace.
+        """
+        events: List[Dict[str, Any]] = []
+        for path in filepaths:
+            with get_filesystem(path).open(path, "r") as f:
+                events.extend(json.load(f)["traceEvents"])
+        with get_filesystem(filepath).open(filepath, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def _category(action_name: str) -> str:
+    # the hooks are named after their owner, e.g. `[Callback]ModelCheckpoint.on_train_epoch_end`
+    if action_name.startswith("["):
+        end = action_name.find("]")
+        if end > 0:
+            return action_name[1:end]
+    return "lightning"
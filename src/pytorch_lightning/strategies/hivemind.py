@@ -258,6 +258,7 @@ class HivemindStrategy(Strategy):
             )
 
     def on_train_batch_start(self, batch: Any, batch_idx: int, dataloader_idx: int = 0) -> None:
+        super().on_train_batch_start(batch, batch_idx)
         if not self._hivemind_initialized:
             self._hivemind_initialized = True
             # todo (sean): we could technically support a dynamic batch size by inferring each step
@@ -31,6 +31,7 @@ from lightning_fabric.utilities.optimizer import _optimizer_to_device, _optimize
 from lightning_fabric.utilities.types import _PATH
 from pytorch_lightning.core.optimizer import _init_optimizers_and_lr_schedulers, LightningOptimizer
 from pytorch_lightning.plugins import TorchCheckpointIO
+from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
 from pytorch_lightning.plugins.io.wrapper import _WrappingCheckpointIO
 from pytorch_lightning.plugins.precision import PrecisionPlugin
 from pytorch_lightning.trainer.states import TrainerFn
@@ -537,7 +538,12 @@ class Strategy(ABC):
 
     def on_train_batch_start(self, batch: Any, batch_idx: int) -> None:
         """Called in the training loop before anything happens for that batch."""
-        pass
+        # the errors raised while saving the checkpoints asynchronously are surfaced at the next training step
+        checkpoint_io = self._checkpoint_io
+        while isinstance(checkpoint_io, _WrappingCheckpointIO):
+            if isinstance(checkpoint_io, AsyncCheckpointIO):
+                checkpoint_io._raise_error()
+            checkpoint_io = checkpoint_io.checkpoint_io
 
     def dispatch(self, trainer: "pl.Trainer") -> None:
         """Hook to do something before the training/evaluation/prediction starts."""
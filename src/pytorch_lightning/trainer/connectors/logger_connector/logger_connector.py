@@ -184,12 +184,14 @@ class LoggerConnector:
 
     def on_batch_end(self) -> None:
         assert not self._epoch_end_reached
+        assert self.trainer._results is not None
+        # the values logged during the batch are accumulated at once
+        self.trainer._results.flush()
         metrics = self.metrics
         self._progress_bar_metrics.update(metrics["pbar"])
         self._callback_metrics.update(metrics["callback"])
         self._logged_metrics.update(metrics["log"])
 
-        assert self.trainer._results is not None
         # drop the reference to current batch and batch_size
         self.trainer._results.batch = None
         self.trainer._results.batch_size = None
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import defaultdict
 from dataclasses import asdict, dataclass, replace
 from functools import partial, wraps
 from typing import Any, Callable, cast, Dict, Generator, List, Optional, Tuple, Union
@@ -24,7 +25,7 @@ from typing_extensions import TypedDict
 from lightning_fabric.utilities import move_data_to_device
 from lightning_fabric.utilities.device_dtype_mixin import _DeviceDtypeModuleMixin
 from lightning_fabric.utilities.distributed import _distributed_available
-from pytorch_lightning.utilities.data import extract_batch_size
+from pytorch_lightning.utilities.data import _BatchSizeExtractor
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _fault_tolerant_training
 from pytorch_lightning.utilities.memory import recursive_detach
@@ -201,14 +202,132 @@ class _Metadata:
         return meta
 
 
+class _AccumulatedState:
+    """Descriptor of the states of the :class:`_ResultMetric`, which applies the pending updates of its
+    :class:`_FusedAccumulator` before they are read."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Optional["_ResultMetric"], objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        accumulator = obj.__dict__.get("_accumulator")
+        if accumulator is not None and accumulator.pending:
+            accumulator.flush()
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj: "_ResultMetric", value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+class _FusedAccumulator:
+    """Accumulates the scalar tensors logged on epoch level by the metrics of a :class:`_ResultCollection`.
+
+    The logged values are queued and applied together at the end of each batch, or once a state of the metrics is
+    read: the values of the metrics sharing the same reduction and dtypes are stacked and accumulated with a single
+    vectorized op, instead of a few ops per ``self.log`` call. The queue is flushed once ``max_pending`` values are
+    queued, so its size stays bounded when it isn't flushed by the loops.
+    """
+
+    max_pending = 1024
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple["_ResultMetric", Tensor, int]] = []
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    @staticmethod
+    def accepts(result_metric: "_ResultMetric", value: Tensor) -> bool:
+        meta = result_metric.meta
+        return (
+            meta.on_epoch
+            and not meta.enable_graph
+            and value.ndim == 0
+            and result_metric.__dict__["value"].ndim == 0
+            and not meta.is_custom_reduction
+        )
+
+    def append(self, result_metric: "_ResultMetric", value: Tensor, batch_size: int) -> None:
+        self._pending.append((result_metric, value, batch_size))
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """Applies the pending updates."""
+        pending, self._pending = self._pending, []
+        groups: Dict[Tuple, List[Tuple[_ResultMetric, Tensor, int]]] = defaultdict(list)
+        for result_metric, value, batch_size in pending:
+            meta = result_metric.meta
+            reduction = (meta.is_mean_reduction, meta.is_sum_reduction, meta.is_max_reduction)
+            state = result_metric.__dict__["value"]
+            groups[(reduction, state.dtype, state.device, value.dtype, value.device)].append(
+                (result_metric, value, batch_size)
+            )
+        for updates in groups.values():
+            self._apply(updates)
+
+    @staticmethod
+    def _apply(updates: List[Tuple["_ResultMetric", Tensor, int]]) -> None:
+        # the metrics can be updated several times, the index maps the updates to the unique metrics.
+        # performance: use the `id`s as `Metric.__hash__` reads the states
+        positions: Dict[int, int] = {}
+        result_metrics = []
+        index = []
+        for result_metric, _, _ in updates:
+            position = positions.setdefault(id(result_metric), len(result_metrics))
+            if position == len(result_metrics):
+                result_metrics.append(result_metric)
+            index.append(position)
+
+        meta = result_metrics[0].meta
+        states = torch.stack([result_metric.__dict__["value"] for result_metric in result_metrics])
+        device = states.device
+        values = torch.stack([value for _, value, _ in updates]).to(device)
+        index_t = torch.tensor(index, device=device)
+        # do not accumulate in the dtype of the states as `+` does type promotion
+        dtype = torch.promote_types(states.dtype, values.dtype)
+        states = states.to(dtype)
+
+        if meta.is_mean_reduction:
+            cumulated_batch_sizes = torch.stack(
+                [result_metric.__dict__["cumulated_batch_size"] for result_metric in result_metrics]
+            )
+            batch_sizes = torch.tensor(
+                [batch_size for _, _, batch_size in updates], dtype=cumulated_batch_sizes.dtype, device=device
+            )
+            states = states.index_add(0, index_t, (values * batch_sizes).to(dtype))
+            cumulated_batch_sizes = cumulated_batch_sizes.index_add(0, index_t, batch_sizes)
+            for result_metric, cumulated_batch_size in zip(result_metrics, cumulated_batch_sizes.unbind()):
+                result_metric.__dict__["cumulated_batch_size"] = cumulated_batch_size
+        elif meta.is_sum_reduction:
+            states = states.index_add(0, index_t, values.to(dtype))
+        else:
+            reduce = "amax" if meta.is_max_reduction else "amin"
+            states = states.scatter_reduce(0, index_t, values.to(dtype), reduce=reduce)
+
+        for result_metric, state in zip(result_metrics, states.unbind()):
+            result_metric.__dict__["value"] = state
+
+
 class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
     """Wraps the value provided to `:meth:`~pytorch_lightning.core.module.LightningModule.log`"""
 
+    value = _AccumulatedState()
+    cumulated_batch_size = _AccumulatedState()
+
     def __init__(self, metadata: _Metadata, is_tensor: bool) -> None:
         super().__init__()
         self.is_tensor = is_tensor
         self.meta = metadata
         self.has_reset = False
+        # set by the `_ResultCollection` to accumulate the scalar values with the ones of the other metrics
+        self._accumulator: Optional[_FusedAccumulator] = None
         if is_tensor:
             if metadata.is_max_reduction:
                 default = float("-inf")
@@ -219,7 +338,6 @@ class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
             # do not set a dtype in case the default dtype was changed
             self.add_state("value", torch.tensor(default), dist_reduce_fx=torch.sum)
             if self.meta.is_mean_reduction:
-                self.cumulated_batch_size: Tensor
                 self.add_state("cumulated_batch_size", torch.tensor(0), dist_reduce_fx=torch.sum)
         # this is defined here only because upstream is missing the type annotation
         self._forward_cache: Optional[Any] = None
@@ -243,6 +361,10 @@ class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
                     self.value = self._forward_cache
                     return
 
+            if self._accumulator is not None and self._accumulator.accepts(self, value):
+                self._accumulator.append(self, value, batch_size)
+                return
+
             # perform accumulation with reduction
             if self.meta.is_mean_reduction:
                 # do not use `+=` as it doesn't do type promotion
@@ -268,6 +390,9 @@ class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
 
     def reset(self) -> None:
         if self.is_tensor:
+            # the values logged before the reset are applied first, so they can't be applied after it
+            if self._accumulator is not None and self._accumulator.pending:
+                self._accumulator.flush()
             super().reset()
         else:
             self.value.reset()
@@ -311,7 +436,9 @@ class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
         return f"{self.__class__.__name__}({state})"
 
     def __getstate__(self, drop_value: bool = False) -> dict:
-        skip = ["update", "compute", "_update_signature", "_cache"]
+        if self._accumulator is not None and self._accumulator.pending:
+            self._accumulator.flush()
+        skip = ["update", "compute", "_update_signature", "_cache", "_accumulator"]
         if not self.is_tensor and drop_value:
             # Avoid serializing ResultMetrics which are passed Metrics
             skip.append("value")
@@ -334,6 +461,8 @@ class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
         return result_metric
 
     def to(self, *args: Any, **kwargs: Any) -> "_ResultMetric":
+        if self._accumulator is not None and self._accumulator.pending:
+            self._accumulator.flush()
         self.__dict__.update(apply_to_collection(self.__dict__, (Tensor, Metric), move_data_to_device, *args, **kwargs))
         return self
 
@@ -401,6 +530,10 @@ class _ResultCollection(dict):
         self.batch: Optional[Any] = None
         self.batch_size: Optional[int] = None
         self.dataloader_idx: Optional[int] = None
+        self._accumulator = _FusedAccumulator()
+        self._batch_size_extractor = _BatchSizeExtractor()
+        # the arguments of the last `log` call of each key along with its metadata, to avoid re-creating it
+        self._metadata_cache: Dict[str, Tuple[Tuple, _Metadata]] = {}
 
     @property
     def result_metrics(self) -> List[_ResultMetric]:
@@ -426,7 +559,7 @@ class _ResultCollection(dict):
         batch_size = 1
         is_tensor = value.is_tensor if isinstance(value, _ResultMetric) else value.has_tensor
         if self.batch is not None and is_tensor and meta.on_epoch and meta.is_mean_reduction:
-            batch_size = extract_batch_size(self.batch)
+            batch_size = self._batch_size_extractor(self.batch)
             self.batch_size = batch_size
 
         return batch_size
@@ -466,30 +599,53 @@ class _ResultCollection(dict):
             key += f".{self.dataloader_idx}"
             fx += f".{self.dataloader_idx}"
 
-        meta = _Metadata(
-            fx=fx,
-            name=name,
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            reduce_fx=reduce_fx,
-            enable_graph=enable_graph,
-            add_dataloader_idx=add_dataloader_idx,
-            dataloader_idx=self.dataloader_idx,
-            metric_attribute=metric_attribute,
+        args = (
+            prog_bar,
+            logger,
+            on_step,
+            on_epoch,
+            reduce_fx,
+            enable_graph,
+            sync_dist,
+            sync_dist_fn,
+            sync_dist_group,
+            add_dataloader_idx,
+            self.dataloader_idx,
+            metric_attribute,
+            rank_zero_only,
         )
-        meta.sync = _Sync(_should=sync_dist, fn=sync_dist_fn, _group=sync_dist_group, rank_zero_only=rank_zero_only)
+        cached = self._metadata_cache.get(key)
+        # performance: the metadata is only re-created when the arguments differ from the last call's
+        if cached is not None and key in self and cached[0] == args:
+            meta = cached[1]
+        else:
+            meta = _Metadata(
+                fx=fx,
+                name=name,
+                prog_bar=prog_bar,
+                logger=logger,
+                on_step=on_step,
+                on_epoch=on_epoch,
+                reduce_fx=reduce_fx,
+                enable_graph=enable_graph,
+                add_dataloader_idx=add_dataloader_idx,
+                dataloader_idx=self.dataloader_idx,
+                metric_attribute=metric_attribute,
+            )
+            meta.sync = _Sync(
+                _should=sync_dist, fn=sync_dist_fn, _group=sync_dist_group, rank_zero_only=rank_zero_only
+            )
 
-        # register logged value if it doesn't exist
-        if key not in self:
-            self.register_key(key, meta, value)
+            # register logged value if it doesn't exist
+            if key not in self:
+                self.register_key(key, meta, value)
 
-        # check the stored metadata and the current one match
-        elif meta != self[key].meta:
-            raise MisconfigurationException(
-                f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
-            )
+            # check the stored metadata and the current one match
+            elif meta != self[key].meta:
+                raise MisconfigurationException(
+                    f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
+                )
+            self._metadata_cache[key] = (args, meta)
 
         batch_size = self._extract_batch_size(self[key], batch_size, meta)
         self.update_metrics(key, value, batch_size)
@@ -502,6 +658,7 @@ class _ResultCollection(dict):
 
         def fn(v: _IN_METRIC) -> _ResultMetric:
             metric = _ResultMetric(meta, isinstance(v, Tensor))
+            metric._accumulator = self._accumulator
             return metric.to(self.device)
 
         value = apply_to_collection(value, (Tensor, Metric), fn)
@@ -574,8 +731,56 @@ class _ResultCollection(dict):
             forked_name += dataloader_suffix
         return name, forked_name
 
+    def _compute_synced(self) -> None:
+        """Computes the epoch values of the tensor metrics to sync.
+
+        The states sharing the same sync function, reduction op, group and dtype are flattened into a single tensor,
+        so they are reduced with one collective instead of one per metric.
+        """
+        result_metrics: List[_ResultMetric] = []
+        apply_to_collection([v for _, v in self.valid_items()], _ResultMetric, result_metrics.append)
+
+        # ensure sync happens for FT, see `_get_cache`
+        force = _distributed_available() and _fault_tolerant_training()
+        buckets: Dict[Tuple, List[Tensor]] = defaultdict(list)
+        # the bucket and the position in the bucket of the states of each metric
+        positions: List[Tuple[_ResultMetric, List[Tuple[Tuple, int]]]] = []
+        for result_metric in result_metrics:
+            sync = result_metric.meta.sync
+            if (
+                not result_metric.is_tensor
+                or not result_metric.meta.on_epoch
+                or result_metric._computed is not None
+                or not (sync.should or force)
+                or sync.fn in (None, _Sync.no_op)
+                or sync.rank_zero_only
+            ):
+                continue
+            states = [result_metric.value]
+            if result_metric.meta.is_mean_reduction:
+                states.append(result_metric.cumulated_batch_size)
+            locations = []
+            for state in states:
+                key = (sync.fn, sync.op, sync.group, state.dtype, state.device)
+                locations.append((key, len(buckets[key])))
+                buckets[key].append(state)
+            positions.append((result_metric, locations))
+
+        reduced: Dict[Tuple, List[Tensor]] = {}
+        for key, states in buckets.items():
+            fn, op, group = key[:3]
+            flat = fn(torch.cat([state.reshape(-1) for state in states]), reduce_op=op, group=group)
+            values = flat.split([state.numel() for state in states])
+            reduced[key] = [value.reshape(state.shape) for state, value in zip(states, values)]
+
+        for result_metric, locations in positions:
+            value, *cumulated_batch_size = (reduced[key][position] for key, position in locations)
+            result_metric._computed = value / cumulated_batch_size[0] if cumulated_batch_size else value
+
     def metrics(self, on_step: bool) -> _METRICS:
         metrics = _METRICS(callback={}, log={}, pbar={})
+        if not on_step:
+            self._compute_synced()
 
         for _, result_metric in self.valid_items():
 
@@ -644,6 +849,11 @@ class _ResultCollection(dict):
         """Move all data to CPU."""
         return self.to(device="cpu")
 
+    def flush(self) -> None:
+        """Applies the values logged on epoch level since the last call, with one update per reduction and dtype."""
+        if self._accumulator.pending:
+            self._accumulator.flush()
+
     def sync(self) -> None:
         for result_metric in self.result_metrics:
             if result_metric.is_tensor and not result_metric._is_synced:
@@ -663,7 +873,8 @@ class _ResultCollection(dict):
         return f"{{{self.training}, {repr(self.device)}, {super().__repr__()}}}"
 
     def __getstate__(self, drop_value: bool = True) -> dict:
-        d = self.__dict__.copy()
+        skip = ("_accumulator", "_batch_size_extractor", "_metadata_cache")
+        d = {k: v for k, v in self.__dict__.items() if k not in skip}
         # all the items should be either `_ResultMetric`s or `_ResultMetricCollection`s
         items = {k: v.__getstate__(drop_value=drop_value) for k, v in self.items()}
         return {**d, "items": items}
@@ -672,6 +883,13 @@ class _ResultCollection(dict):
         self, state: dict, map_location: Optional[Union[str, torch.device]] = None, sync_fn: Optional[Callable] = None
     ) -> None:
         self.__dict__.update({k: v for k, v in state.items() if k != "items"})
+        if "_accumulator" not in self.__dict__:
+            self._accumulator = _FusedAccumulator()
+            self._batch_size_extractor = _BatchSizeExtractor()
+        # the values logged before are applied to the metrics being replaced
+        if self._accumulator.pending:
+            self._accumulator.flush()
+        self._metadata_cache = {}
 
         def setstate(k: str, item: dict) -> Union[_ResultMetric, _ResultMetricCollection]:
             if not isinstance(item, dict):
@@ -687,6 +905,11 @@ class _ResultCollection(dict):
             return cls._reconstruct(item, sync_fn=_sync_fn)
 
         items = {k: setstate(k, v) for k, v in state["items"].items()}
+
+        def attach(result_metric: _ResultMetric) -> None:
+            result_metric._accumulator = self._accumulator
+
+        apply_to_collection(items, _ResultMetric, attach)
         self.update(items)
 
         device = map_location or self.device
@@ -31,6 +31,7 @@ from pytorch_lightning.profilers import (
     Profiler,
     PyTorchProfiler,
     SimpleProfiler,
+    TimelineProfiler,
     XLAProfiler,
 )
 from pytorch_lightning.utilities import _HPU_AVAILABLE, _IPU_AVAILABLE
@@ -134,6 +135,7 @@ def _init_profiler(trainer: "pl.Trainer", profiler: Optional[Union[Profiler, str
             "simple": SimpleProfiler,
             "advanced": AdvancedProfiler,
             "pytorch": PyTorchProfiler,
+            "timeline": TimelineProfiler,
             "xla": XLAProfiler,
         }
         profiler = profiler.lower()
@@ -30,7 +30,7 @@ from contextlib import contextmanager
 from copy import deepcopy
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Type, Union
 from weakref import proxy
 
 import torch
@@ -59,7 +59,7 @@ from pytorch_lightning.loops.dataloader.evaluation_loop import EvaluationLoop
 from pytorch_lightning.loops.fit_loop import FitLoop
 from pytorch_lightning.loops.utilities import _parse_loop_limits, _reset_progress
 from pytorch_lightning.plugins import ApexMixedPrecisionPlugin, MixedPrecisionPlugin, PLUGIN_INPUT, PrecisionPlugin
-from pytorch_lightning.profilers import Profiler
+from pytorch_lightning.profilers import PassThroughProfiler, Profiler
 from pytorch_lightning.strategies import (
     DDPFullyShardedNativeStrategy,
     DDPStrategy,
@@ -440,6 +440,10 @@ class Trainer:
         self._checkpoint_connector = CheckpointConnector(self, resume_from_checkpoint)
         self._signal_connector = SignalConnector(self)
         self.tuner = Tuner(self)
+        # the callbacks overriding each hook, along with their profiler action name, for the callbacks and profiler
+        # they were computed with
+        self._callback_hooks: Dict[str, List[Tuple[Callback, Optional[str]]]] = {}
+        self._callback_hooks_key: Tuple[List[Callback], Optional[Profiler]] = ([], None)
 
         fit_loop = FitLoop(min_epochs=min_epochs, max_epochs=max_epochs)
         training_epoch_loop = TrainingEpochLoop(min_steps=min_steps, max_steps=max_steps)
@@ -1025,6 +1029,8 @@ class Trainer:
 
         self._callback_connector._attach_model_callbacks()
         self._callback_connector._attach_model_logging_functions()
+        # the hooks overridden by the callbacks are looked up again for each stage
+        self._callback_hooks.clear()
 
         verify_loop_configurations(self)
 
@@ -1373,21 +1379,47 @@ class Trainer:
     ) -> None:
         log.debug(f"{self.__class__.__name__}: calling callback hook: {hook_name}")
 
+        callbacks = self._callbacks_overriding(hook_name)
+        if not callbacks:
+            return
+
         pl_module = self.lightning_module
         if pl_module:
             prev_fx_name = pl_module._current_fx_name
             pl_module._current_fx_name = hook_name
 
-        for callback in self.callbacks:
+        for callback, action_name in callbacks:
             fn = getattr(callback, hook_name)
-            if callable(fn):
-                with self.profiler.profile(f"[Callback]{callback.state_key}.{hook_name}"):
-                    fn(self, self.lightning_module, *args, **kwargs)
+            if action_name is None:
+                fn(self, pl_module, *args, **kwargs)
+            else:
+                with self.profiler.profile(action_name):
+                    fn(self, pl_module, *args, **kwargs)
 
         if pl_module:
             # restore current_fx when nested context
             pl_module._current_fx_name = prev_fx_name
 
+    def _callbacks_overriding(self, hook_name: str) -> List[Tuple[Callback, Optional[str]]]:
+        """Returns the callbacks overriding the hook along with the profiler action name of their call, or
+        ``None`` if the calls aren't profiled.
+
+        The dispatch table is computed again when the callbacks or the profiler change.
+        """
+        key = self._callback_hooks_key
+        if key[1] is not self.profiler or key[0] != self.callbacks:
+            self._callback_hooks.clear()
+            self._callback_hooks_key = (list(self.callbacks), self.profiler)
+        callbacks = self._callback_hooks.get(hook_name)
+        if callbacks is None:
+            profiled = not isinstance(self.profiler, PassThroughProfiler)
+            callbacks = self._callback_hooks[hook_name] = [
+                (callback, f"[Callback]{callback.state_key}.{hook_name}" if profiled else None)
+                for callback in self.callbacks
+                if _is_hook_overridden(callback, hook_name)
+            ]
+        return callbacks
+
     def _call_callbacks_state_dict(self) -> Dict[str, dict]:
         """Called when saving a model checkpoint, calls and returns every callback's `state_dict`, keyed by
         `Callback.state_key`."""
@@ -2264,3 +2296,11 @@ def _evaluation_context(accelerator: Accelerator, inference_mode: bool = True) -
     )
     with context_manager_class():
         yield
+
+
+def _is_hook_overridden(callback: Callback, hook_name: str) -> bool:
+    fn = getattr(callback, hook_name, None)
+    if not callable(fn):
+        return False
+    # the hooks replaced on the instance, e.g. by mocks, are always called
+    return not inspect.ismethod(fn) or is_overridden(hook_name, callback, parent=Callback)
@@ -13,7 +13,7 @@
 # limitations under the License.
 import inspect
 from dataclasses import fields
-from typing import Any, Dict, Generator, Iterable, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, Union
 
 import torch
 from lightning_utilities.core.apply_func import is_dataclass_instance
@@ -71,30 +71,121 @@ def extract_batch_size(batch: BType) -> int:
     Returns:
         ``len(tensor)`` when found, or ``1`` when it hits an empty or non iterable.
     """
-    error_msg = (
-        "We could not infer the batch_size from the batch. Either simplify its structure"
-        " or provide the batch_size as `self.log(..., batch_size=batch_size)`."
-    )
-    batch_size = None
     try:
-        for bs in _extract_batch_size(batch):
-            if batch_size is None:
-                batch_size = bs
-            elif batch_size != bs:
-                warning_cache.warn(
-                    "Trying to infer the `batch_size` from an ambiguous collection. The batch size we"
-                    f" found is {batch_size}. To avoid any miscalculations, use `self.log(..., batch_size=batch_size)`."
-                )
-                break
+        return _reduce_batch_sizes(_extract_batch_size(batch))
     except RecursionError:
-        raise RecursionError(error_msg)
+        raise RecursionError(_BATCH_SIZE_ERROR_MSG)
+
+
+_BATCH_SIZE_ERROR_MSG = (
+    "We could not infer the batch_size from the batch. Either simplify its structure"
+    " or provide the batch_size as `self.log(..., batch_size=batch_size)`."
+)
+
+
+def _reduce_batch_sizes(sizes: Iterable[Optional[int]]) -> int:
+    batch_size = None
+    for bs in sizes:
+        if batch_size is None:
+            batch_size = bs
+        elif batch_size != bs:
+            warning_cache.warn(
+                "Trying to infer the `batch_size` from an ambiguous collection. The batch size we"
+                f" found is {batch_size}. To avoid any miscalculations, use `self.log(..., batch_size=batch_size)`."
+            )
+            break
 
     if batch_size is None:
-        raise MisconfigurationException(error_msg)
+        raise MisconfigurationException(_BATCH_SIZE_ERROR_MSG)
 
     return batch_size
 
 
+# the kinds of nodes of the batch size plans
+_TENSOR, _OTHER, _MAPPING, _SEQUENCE, _DATACLASS = range(5)
+
+
+def _compile_batch_size_plan(batch: BType) -> Optional[Tuple]:
+    """Returns the structure of the batch along with the access path to its leaves, in the order they are visited by
+    :func:`extract_batch_size`. Returns ``None`` if the batch holds iterables which can't be indexed."""
+    if isinstance(batch, Tensor):
+        return (_TENSOR,)
+    if isinstance(batch, Mapping):
+        keys = tuple(batch)
+        children = tuple(_compile_batch_size_plan(batch[key]) for key in keys)
+        return None if None in children else (_MAPPING, type(batch), keys, children)
+    if isinstance(batch, (list, tuple)):
+        children = tuple(_compile_batch_size_plan(sample) for sample in batch)
+        return None if None in children else (_SEQUENCE, type(batch), len(batch), children)
+    if isinstance(batch, Iterable) and not isinstance(batch, str):
+        return None
+    if is_dataclass_instance(batch):
+        names = tuple(field.name for field in fields(batch))
+        children = tuple(_compile_batch_size_plan(getattr(batch, name)) for name in names)
+        return None if None in children else (_DATACLASS, type(batch), names, children)
+    return (_OTHER, type(batch))
+
+
+def _run_batch_size_plan(plan: Tuple, batch: BType, sizes: List[Optional[int]]) -> bool:
+    """Appends the sizes of the leaves of the batch following the plan.
+
+    Returns:
+        Whether the batch matches the structure of the plan.
+    """
+    kind = plan[0]
+    if kind == _TENSOR:
+        if not isinstance(batch, Tensor):
+            return False
+        sizes.append(batch.size(0) if batch.ndim else 1)
+        return True
+    # performance: compare the exact types instead of the slower checks against the abstract classes
+    if type(batch) is not plan[1]:
+        return False
+    if kind == _OTHER:
+        sizes.append(None)
+        return True
+    if kind == _MAPPING:
+        # the keys are visited in the same order
+        if tuple(batch) != plan[2]:
+            return False
+        children = zip((batch[key] for key in plan[2]), plan[3])
+    elif kind == _SEQUENCE:
+        if len(batch) != plan[2]:
+            return False
+        children = zip(batch, plan[3])
+    else:
+        children = zip((getattr(batch, name) for name in plan[2]), plan[3])
+    for child, child_plan in children:
+        # performance: the tensors are handled inline
+        if child_plan[0] == _TENSOR and isinstance(child, Tensor):
+            sizes.append(child.size(0) if child.ndim else 1)
+        elif not _run_batch_size_plan(child_plan, child, sizes):
+            return False
+    return True
+
+
+class _BatchSizeExtractor:
+    """Extracts the batch size as :func:`extract_batch_size` does.
+
+    The access path to the leaves of the batch is compiled for the structure of the first batch, and reused while the
+    next batches share its structure.
+    """
+
+    def __init__(self) -> None:
+        self._plan: Optional[Tuple] = None
+
+    def __call__(self, batch: BType) -> int:
+        if self._plan is not None:
+            sizes: List[Optional[int]] = []
+            if _run_batch_size_plan(self._plan, batch, sizes):
+                return _reduce_batch_sizes(sizes)
+        try:
+            self._plan = _compile_batch_size_plan(batch)
+        except RecursionError:
+            self._plan = None
+        return extract_batch_size(batch)
+
+
 def has_len_all_ranks(
     dataloader: Union[DataLoader, CombinedLoader],
     strategy: "pl.strategies.Strategy",
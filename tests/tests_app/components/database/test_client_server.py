@@ -1,18 +1,29 @@
+import json
 import os
 import sys
 import tempfile
 import time
 import traceback
-from pathlib import Path
 from time import sleep
 from typing import List, Optional
 from uuid import uuid4
 
 import pytest
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
 
 from lightning_app import LightningApp, LightningFlow, LightningWork
 from lightning_app.components.database import Database, DatabaseClient
-from lightning_app.components.database.utilities import _GeneralModel, _pydantic_column_type
+from lightning_app.components.database.utilities import (
+    _create_database,
+    _Delete,
+    _GeneralModel,
+    _Insert,
+    _pydantic_column_type,
+    _Select,
+    _SelectAll,
+    _Update,
+)
 from lightning_app.runners import MultiProcessRuntime
 from lightning_app.utilities.imports import _is_sqlmodel_available
 
@@ -31,6 +42,13 @@ if _is_sqlmodel_available():
         name: str
         secrets: List[Secret] = Field(..., sa_column=Column(_pydantic_column_type(List[Secret])))
 
+    class Trial(SQLModel, table=True):
+        __table_args__ = {"extend_existing": True}
+
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        score: float
+
 
 class Work(LightningWork):
     def __init__(self):
@@ -47,11 +65,9 @@ class Work(LightningWork):
 
 
 @pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
-def test_client_server():
-
-    database_path = Path("database.db").resolve()
-    if database_path.exists():
-        os.remove(database_path)
+def test_client_server(tmp_path, monkeypatch):
+    # the database runs in WAL mode, its log files are kept out of the working directory
+    monkeypatch.chdir(tmp_path)
 
     secrets = [Secret(name="example", value="secret")]
 
@@ -114,10 +130,6 @@ def test_client_server():
     app = LightningApp(Flow())
     MultiProcessRuntime(app, start_server=False).dispatch()
 
-    database_path = Path("database.db").resolve()
-    if database_path.exists():
-        os.remove(database_path)
-
 
 @pytest.mark.skipif(sys.platform == "win32", reason="currently not supported for windows.")
 @pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
@@ -204,3 +216,109 @@ def test_work_database_periodic_store():
             MultiProcessRuntime(app).dispatch()
     except Exception:
         print(traceback.print_exc())
+
+
+class _MockResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self._content = jsonable_encoder(content)
+        self.text = json.dumps(self._content)
+
+    def json(self):
+        return self._content
+
+
+class _MockSession:
+    """Calls the database endpoints directly instead of sending the requests."""
+
+    def __init__(self, token):
+        models = {"Trial": Trial}
+        self.endpoints = {
+            "/select_all/": _SelectAll(models, token),
+            "/select/": _Select(models, token),
+            "/insert/": _Insert(models, token),
+            "/update/": _Update(models, token),
+            "/delete/": _Delete(models, token),
+        }
+        self.num_requests = 0
+
+    def post(self, url, data):
+        self.num_requests += 1
+        response = Response()
+        response.status_code = 200
+        content = self.endpoints[url[len("http://db") :]](json.loads(data), response)
+        return _MockResponse(response.status_code, content)
+
+
+@pytest.fixture
+def trial_client(tmp_path):
+    _create_database(str(tmp_path / "database.db"), [Trial])
+    client = DatabaseClient("http://db", token="secret", model=Trial)
+    client._session = _MockSession("secret")
+    return client
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+def test_client_bulk_operations(trial_client):
+    trial_client.insert_many([Trial(name=f"trial_{i}", score=i) for i in range(5)])
+    assert trial_client.session.num_requests == 1
+    trials = trial_client.select_all()
+    assert [trial.name for trial in trials] == [f"trial_{i}" for i in range(5)]
+
+    for trial in trials[:3]:
+        trial.score *= 10
+    trial_client.update_many(trials[:3])
+    assert [trial.score for trial in trial_client.select_all()] == [0, 10, 20, 3, 4]
+
+    trial_client.delete_many(trials[3:])
+    assert len(trial_client.select_all()) == 3
+
+    # nothing is changed if some of the rows don't exist
+    trials = trial_client.select_all()
+    trials[0].score = -1
+    with pytest.raises(AssertionError, match="weren't found"):
+        trial_client.update_many([trials[0], Trial(id=100, name="missing", score=0)])
+    with pytest.raises(AssertionError, match="weren't found"):
+        trial_client.delete_many([trials[1], Trial(id=100, name="missing", score=0)])
+    assert [trial.score for trial in trial_client.select_all()] == [0, 10, 20]
+
+    num_requests = trial_client.session.num_requests
+    trial_client.insert_many([])
+    assert trial_client.session.num_requests == num_requests
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+def test_client_select(trial_client):
+    trial_client.insert_many([Trial(name=name, score=score) for name, score in zip("abcde", (3, 1, 4, 1, 5))])
+
+    trials = trial_client.select(filters={"score__ge": 3}, order_by="-score")
+    assert [trial.name for trial in trials] == ["e", "c", "a"]
+    assert all(isinstance(trial, Trial) for trial in trials)
+
+    trials = trial_client.select(filters={"score": 1, "name__in": ["b", "c"]})
+    assert [trial.name for trial in trials] == ["b"]
+
+    trials = trial_client.select(order_by=["score", "-name"], limit=2, offset=1)
+    assert [trial.name for trial in trials] == ["b", "a"]
+
+    assert trial_client.select(columns=["name"], filters={"name__like": "%d%"}) == [{"name": "d"}]
+    assert trial_client.select(columns=["name", "score"], order_by="-score", limit=1) == [{"name": "e", "score": 5}]
+
+    with pytest.raises(AssertionError, match="no column `unknown`"):
+        trial_client.select(filters={"unknown": 1})
+    with pytest.raises(AssertionError, match="filter operator `regex`"):
+        trial_client.select(filters={"name__regex": "a"})
+
+    trial_client.token = "wrong"
+    with pytest.raises(AssertionError):
+        trial_client.select()
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+def test_database_exit_before_run(tmp_path):
+    database = Database(db_filename=str(tmp_path / "database.db"), models=[TestConfig])
+    # the work can exit before it ran
+    database.on_exit()
+    assert database.total_shipped_bytes == 0
+    # the shipped bytes aren't part of the state
+    assert "total_shipped_bytes" not in database.state["vars"]
@@ -0,0 +1,109 @@
+import os
+import sqlite3
+
+from lightning_app.components.database.wal import _configure_wal, _WALShipper
+
+
+def _connect(db_filename):
+    connection = sqlite3.connect(db_filename, isolation_level=None)
+    _configure_wal(connection)
+    return connection
+
+
+def _rows(db_filename):
+    connection = sqlite3.connect(db_filename)
+    try:
+        return connection.execute("SELECT id, name FROM item ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+
+def test_wal_shipper_incremental(tmp_path, monkeypatch):
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", str(tmp_path / "storage"))
+    db_filename = str(tmp_path / "db" / "database.db")
+    os.makedirs(os.path.dirname(db_filename))
+    connection = _connect(db_filename)
+    connection.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.executemany("INSERT INTO item (name) VALUES (?)", [(f"name_{i}" * 100,) for i in range(200)])
+
+    shipper = _WALShipper(db_filename, component_name="root.db", compaction_ratio=10)
+    # the first call ships the full database
+    base_size = shipper.ship()
+    assert base_size == os.path.getsize(db_filename)
+    assert shipper.generation == 1
+
+    # the next calls only ship the committed transactions
+    connection.execute("INSERT INTO item (name) VALUES ('new')")
+    connection.execute("UPDATE item SET name = 'updated' WHERE id = 1")
+    segment_size = shipper.ship()
+    assert 0 < segment_size < base_size / 4
+    assert shipper.sequence == 1
+    assert shipper.ship() == 0
+
+    # the rolled back transactions aren't shipped
+    connection.execute("BEGIN")
+    connection.execute("DELETE FROM item WHERE id = 3")
+    connection.execute("ROLLBACK")
+    assert shipper.ship() == 0
+    connection.execute("DELETE FROM item WHERE id = 2")
+    assert shipper.ship() > 0
+    expected = _rows(db_filename)
+    shipper.close()
+    connection.close()
+
+    # the database is restored by replaying the segments onto the base
+    restored_filename = str(tmp_path / "restored" / "database.db")
+    restorer = _WALShipper(restored_filename, component_name="root.db")
+    assert restorer.restore()
+    assert _rows(restored_filename) == expected
+    assert (restorer.generation, restorer.sequence) == (1, 2)
+    assert ("updated",) in [row[1:] for row in expected]
+    assert 2 not in [row[0] for row in expected]
+
+
+def test_wal_shipper_compaction(tmp_path, monkeypatch):
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", str(tmp_path / "storage"))
+    db_filename = str(tmp_path / "database.db")
+    connection = _connect(db_filename)
+    connection.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+
+    shipper = _WALShipper(db_filename, component_name="root.db", compaction_ratio=1)
+    shipper.ship()
+    for i in range(5):
+        connection.executemany("INSERT INTO item (name) VALUES (?)", [(f"name_{i}" * 100,) for _ in range(20)])
+        shipper.ship()
+
+    # once the segments are larger than the base, a new generation replaces the previous one
+    assert shipper.generation > 1
+    files = [name for _, _, name in shipper._list()]
+    assert f"database.db.{shipper.generation:06d}.base" in files
+    assert all(name.startswith(f"database.db.{shipper.generation:06d}.") for name in files)
+    expected = _rows(db_filename)
+    shipper.close()
+    connection.close()
+
+    os.rename(db_filename, str(tmp_path / "other.db"))
+    restorer = _WALShipper(db_filename, component_name="root.db")
+    assert restorer.restore()
+    assert _rows(db_filename) == expected
+    assert len(expected) == 100
+
+
+def test_wal_shipper_restore_full_copy(tmp_path, monkeypatch):
+    """The full copies of the database stored by the previous versions are restored."""
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", str(tmp_path / "storage"))
+    drive_dir = tmp_path / "storage" / "artifacts" / "drive" / "database" / "root.db"
+    drive_dir.mkdir(parents=True)
+    connection = sqlite3.connect(str(drive_dir / "database.db"))
+    connection.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.execute("INSERT INTO item (name) VALUES ('a')")
+    connection.commit()
+    connection.close()
+
+    db_filename = str(tmp_path / "database.db")
+    shipper = _WALShipper(db_filename, component_name="root.db")
+    assert shipper.restore()
+    assert _rows(db_filename) == [(1, "a")]
+    assert shipper.generation is None
+
+    assert not _WALShipper(str(tmp_path / "other.db"), component_name="root.other").restore()
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import uuid
 from unittest import mock
@@ -8,7 +9,7 @@ from fastapi import HTTPException
 
 from lightning_app import CloudCompute, LightningWork
 from lightning_app.components import AutoScaler, ColdStartProxy, Text
-from lightning_app.components.serve.auto_scaler import _LoadBalancer
+from lightning_app.components.serve.auto_scaler import _LoadBalancer, _LoadBalancerMetrics, _RollingHistogram
 
 
 class EmptyWork(LightningWork):
@@ -109,6 +110,107 @@ def test_scale_from_zero_min_replica():
     assert resp <= 0
 
 
+@pytest.mark.parametrize(
+    "replicas, metrics, expected_replicas",
+    [
+        pytest.param(2, {"latency_p95": 0.4}, 4, id="scale out proportionally to the latency"),
+        pytest.param(2, {"latency_p95": 0.4, "pending_works": 1}, 3, id="account for the pending works"),
+        pytest.param(2, {"latency_p95": 0.22}, 2, id="dont scale out within the hysteresis"),
+        pytest.param(2, {"latency_p95": 0.17}, 2, id="dont scale in within the hysteresis"),
+        pytest.param(4, {"latency_p95": 0.05}, 3, id="scale in one work at a time"),
+        pytest.param(2, {"latency_p95": 0.15}, 2, id="dont scale in above the target"),
+        pytest.param(2, {"latency_p95": 0.1, "utilization": 0.9}, 3, id="use the highest ratio"),
+        pytest.param(2, {"latency_p95": None, "requests_per_second": 0}, 1, id="scale in without traffic"),
+        pytest.param(1, {"latency_p95": None, "pending_requests": 8}, 2, id="fallback on the pending requests"),
+    ],
+)
+def test_scale_to_targets(replicas, metrics, expected_replicas):
+    auto_scaler = AutoScaler(EmptyWork, max_batch_size=8, target_latency=0.2, target_utilization=0.6, hysteresis=0.2)
+    metrics = {"pending_requests": 0, "pending_works": 0, **metrics}
+    assert auto_scaler.scale(replicas, metrics) == expected_replicas
+
+
+def test_scale_targets_validation():
+    with pytest.raises(ValueError, match="target_utilization"):
+        AutoScaler(EmptyWork, target_utilization=1.5)
+    with pytest.raises(ValueError, match="hysteresis"):
+        AutoScaler(EmptyWork, hysteresis=1)
+
+
+def test_autoscale_load_balancer_metrics(monkeypatch):
+    monkeypatch.setattr(AutoScaler, "num_pending_works", 0)
+    monkeypatch.setattr(AutoScaler, "num_pending_requests", 0)
+    monkeypatch.setattr(AutoScaler, "load_balancer_metrics", {"latency_p95": 0.5})
+    scale_mock = mock.MagicMock(return_value=1)
+    monkeypatch.setattr(AutoScaler, "scale", scale_mock)
+    AutoScaler(EmptyWork, target_latency=1.0).autoscale()
+    scale_mock.assert_called_once_with(0, {"latency_p95": 0.5, "pending_requests": 0, "pending_works": 0})
+
+    # the metrics aren't fetched when the scaling logic doesn't use them
+    scale_mock.reset_mock()
+    AutoScaler(EmptyWork).autoscale()
+    scale_mock.assert_called_once_with(0, {"pending_requests": 0, "pending_works": 0})
+
+
+def test_autoscale_load_balancer_metrics_custom_scale(monkeypatch):
+    monkeypatch.setattr(AutoScaler, "num_pending_works", 0)
+    monkeypatch.setattr(AutoScaler, "num_pending_requests", 0)
+    monkeypatch.setattr(AutoScaler, "load_balancer_metrics", {"latency_p95": 0.5})
+
+    class CustomAutoScaler(AutoScaler):
+        def scale(self, replicas, metrics):
+            assert metrics["latency_p95"] == 0.5
+            return 1
+
+    CustomAutoScaler(EmptyWork).autoscale()
+
+
+def test_rolling_histogram():
+    histogram = _RollingHistogram(window=60, num_slices=6, precision=0.01)
+    assert histogram.quantiles(0.5) == [None]
+    assert histogram.mean() is None
+
+    for value in range(1, 101):
+        histogram.record(value / 100, now=1000.0)
+    p50, p99, p100 = histogram.quantiles(0.5, 0.99, 1.0, now=1000.0)
+    assert p50 == pytest.approx(0.5, rel=0.01)
+    assert p99 == pytest.approx(0.99, rel=0.01)
+    assert p100 == pytest.approx(1.0, rel=0.01)
+    assert histogram.count(now=1000.0) == 100
+    assert histogram.mean(now=1000.0) == pytest.approx(0.505)
+    # the values are bucketed, so the memory doesn't grow with the number of values
+    for _ in range(1000):
+        histogram.record(0.5, now=1000.0)
+    assert len(histogram._slices) == 1
+    assert len(histogram._slices[0].buckets) <= 100
+
+    # the values expire once they are out of the window
+    histogram.record(2.0, now=1055.0)
+    assert histogram.count(now=1055.0) == 1101
+    assert histogram.count(now=1065.0) == 1
+    assert histogram.quantiles(0.5, now=1065.0) == [pytest.approx(2.0, rel=0.01)]
+
+
+def test_load_balancer_metrics_summary():
+    metrics = _LoadBalancerMetrics()
+    for _ in range(10):
+        metrics.latency.record(0.1)
+        metrics.queue_wait.record(0.01)
+    metrics.record_batch("http://server-0", size=4, max_batch_size=8, duration=0.1)
+    summary = metrics.summary(["http://server-0", "http://server-1"])
+    assert summary["latency_p50"] == pytest.approx(0.1, rel=0.01)
+    assert summary["queue_wait_p99"] == pytest.approx(0.01, rel=0.01)
+    assert summary["batch_fill_ratio"] == 0.5
+    assert summary["requests_per_second"] > 0
+    assert summary["server_throughput"]["http://server-0"] > 0
+    assert summary["server_throughput"]["http://server-1"] == 0
+    assert 0 < summary["server_utilization"]["http://server-0"] <= 1
+    assert summary["utilization"] == summary["server_utilization"]["http://server-0"] / 2
+
+    metrics.remove_server("http://server-0")
+    assert metrics.summary(["http://server-1"])["server_throughput"] == {"http://server-1": 0}
+
+
 def test_create_work_cloud_compute_cloned():
     """Test CloudCompute is cloned to avoid creating multiple works in a single machine."""
     cloud_compute = CloudCompute("gpu")
@@ -190,8 +292,6 @@ class TestLoadBalancerProcessRequest:
             endpoint="/predict",
         )
         req_id = uuid.uuid4().hex
-        # populating the responses so the while loop exists
-        load_balancer._responses = {req_id: "Dummy"}
         with pytest.raises(HTTPException):
             await load_balancer.process_request("test", req_id)
 
@@ -217,7 +317,127 @@ class TestLoadBalancerProcessRequest:
         )
         load_balancer.servers.append(mock.MagicMock())
         req_id = uuid.uuid4().hex
-        # populating the responses so the while loop exists
-        load_balancer._responses = {req_id: "Dummy"}
-        await load_balancer.process_request("test", req_id)
+        task = asyncio.create_task(load_balancer.process_request("test", req_id))
+        await asyncio.sleep(0)
         assert load_balancer._batch == [(req_id, "test")]
+        # the future of the request is resolved once the batch is processed
+        load_balancer._resolve(req_id, "Dummy")
+        assert await task == "Dummy"
+        assert not load_balancer._futures
+
+
+class TestLoadBalancerBatching:
+    @staticmethod
+    def _load_balancer(**kwargs):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict", **kwargs)
+        load_balancer.servers = ["http://server-0", "http://server-1"]
+        load_balancer._server_outstanding = {server: [0, 0] for server in load_balancer.servers}
+        return load_balancer
+
+    @pytest.mark.asyncio
+    async def test_batch_sent_when_full(self, monkeypatch):
+        load_balancer = self._load_balancer(max_batch_size=2, timeout_batching=10)
+        batches = []
+
+        async def send_batch(self, batch, server_url):
+            batches.append((batch, server_url))
+            for request_id, data in batch:
+                load_balancer._resolve(request_id, data.upper())
+
+        monkeypatch.setattr(_LoadBalancer, "send_batch", send_batch)
+        consumer = asyncio.create_task(load_balancer.consumer())
+        t0 = time.time()
+        results = await asyncio.wait_for(
+            asyncio.gather(*(load_balancer.process_request(text) for text in ("a", "b", "c", "d"))), timeout=5
+        )
+        consumer.cancel()
+        assert results == ["A", "B", "C", "D"]
+        # the full batches are sent right away, without waiting for the batching timeout
+        assert time.time() - t0 < 1
+        assert [[data for _, data in batch] for batch, _ in batches] == [["a", "b"], ["c", "d"]]
+        # the latency and queue wait of each request is recorded
+        assert load_balancer._metrics.latency.count() == 4
+        assert load_balancer._metrics.queue_wait.count() == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_sent_on_deadline(self, monkeypatch):
+        load_balancer = self._load_balancer(max_batch_size=8, timeout_batching=0.2)
+
+        async def send_batch(self, batch, server_url):
+            for request_id, data in batch:
+                load_balancer._resolve(request_id, data)
+
+        monkeypatch.setattr(_LoadBalancer, "send_batch", send_batch)
+        consumer = asyncio.create_task(load_balancer.consumer())
+        t0 = time.time()
+        assert await asyncio.wait_for(load_balancer.process_request("a"), timeout=5) == "a"
+        consumer.cancel()
+        assert 0.2 <= time.time() - t0 < 1
+
+    def test_least_outstanding_server(self):
+        load_balancer = self._load_balancer()
+        load_balancer._server_outstanding = {"http://server-0": [1, 8], "http://server-1": [1, 2]}
+        assert load_balancer._find_free_server() == "http://server-1"
+        # the servers with too many in-flight batches aren't selected
+        load_balancer._server_outstanding["http://server-1"] = [2, 4]
+        assert load_balancer._find_free_server() == "http://server-0"
+        load_balancer._server_outstanding["http://server-0"] = [2, 4]
+        assert load_balancer._find_free_server() is None
+
+    @pytest.mark.asyncio
+    async def test_send_batch_reuses_session(self):
+        load_balancer = self._load_balancer()
+        response = mock.MagicMock(status=200)
+        response.json = mock.AsyncMock(return_value={"outputs": ["x", "y"]})
+        session = mock.MagicMock(closed=False)
+        session.post.return_value.__aenter__ = mock.AsyncMock(return_value=response)
+        session.post.return_value.__aexit__ = mock.AsyncMock(return_value=False)
+        load_balancer._server_sessions["http://server-0"] = session
+        load_balancer._server_outstanding["http://server-0"] = [1, 2]
+
+        loop = asyncio.get_running_loop()
+        load_balancer._futures = {"a": loop.create_future(), "b": loop.create_future()}
+        await load_balancer.send_batch([("a", "1"), ("b", "2")], "http://server-0")
+        assert session.post.call_count == 1
+        assert load_balancer._server_sessions["http://server-0"] is session
+        assert load_balancer._server_outstanding["http://server-0"] == [0, 0]
+        assert not load_balancer._futures
+
+    @pytest.mark.asyncio
+    async def test_removed_server_session_closed_once_drained(self):
+        load_balancer = self._load_balancer()
+        response = mock.MagicMock(status=200)
+        response.json = mock.AsyncMock(return_value={"outputs": ["x"]})
+        session = mock.MagicMock(closed=False)
+        session.post.return_value.__aenter__ = mock.AsyncMock(return_value=response)
+        session.post.return_value.__aexit__ = mock.AsyncMock(return_value=False)
+        session.close = mock.AsyncMock()
+        load_balancer._server_sessions["http://server-0"] = session
+        load_balancer._server_outstanding["http://server-0"] = [1, 1]
+
+        await load_balancer._update_servers(["http://server-1"])
+        # the server doesn't get new batches but its session is kept for the in-flight one
+        assert list(load_balancer._server_outstanding) == ["http://server-1"]
+        assert load_balancer._find_free_server() == "http://server-1"
+        session.close.assert_not_called()
+
+        loop = asyncio.get_running_loop()
+        load_balancer._futures = {"a": loop.create_future()}
+        await load_balancer.send_batch([("a", "1")], "http://server-0")
+        session.close.assert_called_once()
+        assert not load_balancer._draining_servers
+        assert "http://server-0" not in load_balancer._server_sessions
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_removed_from_batch(self):
+        load_balancer = self._load_balancer()
+        task = asyncio.create_task(load_balancer.process_request("a", "req-a"))
+        other = asyncio.create_task(load_balancer.process_request("b", "req-b"))
+        await asyncio.sleep(0)
+        assert [request_id for request_id, _ in load_balancer._batch] == ["req-a", "req-b"]
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert load_balancer._batch == [("req-b", "b")]
+        other.cancel()
@@ -1,6 +1,13 @@
+import asyncio
 import multiprocessing as mp
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI, HTTPException
 
 from lightning_app.components import Image, Number, PythonServer
+from lightning_app.components.serve.python_server import _DynamicBatcher
 from lightning_app.utilities.network import _configure_session, find_free_network_port
 
 
@@ -44,3 +51,96 @@ def test_number_sample_data():
     assert isinstance(data, dict)
     assert "prediction" in data
     assert data["prediction"] == 463
+
+
+class BatchedServer(PythonServer):
+    def collate(self, requests):
+        return [request.payload for request in requests]
+
+    def predict(self, payloads):
+        return [{"prediction": payload.upper()} for payload in payloads]
+
+
+def test_python_server_batching():
+    server = BatchedServer(max_batch_size=4, timeout_batching=0.1)
+    fastapi_app = FastAPI()
+    server._attach_predict_fn(fastapi_app)
+    endpoint = next(route.endpoint for route in fastapi_app.routes if getattr(route, "path", None) == "/predict")
+    input_type = server.configure_input_type()
+
+    async def run():
+        await fastapi_app.router.startup()
+        try:
+            return await asyncio.gather(*(endpoint(input_type(payload=payload)) for payload in "abcde"))
+        finally:
+            await fastapi_app.router.shutdown()
+
+    assert asyncio.run(run()) == [{"prediction": payload} for payload in "ABCDE"]
+
+    with pytest.raises(ValueError, match="max_batch_size"):
+        BatchedServer(max_batch_size=0)
+
+
+def test_dynamic_batcher():
+    batches = []
+
+    def predict_batch(requests):
+        batches.append(requests)
+        if "error" in requests:
+            raise RuntimeError("prediction failed")
+        return [request * 2 for request in requests]
+
+    async def run():
+        batcher = _DynamicBatcher(predict_batch, max_batch_size=3, timeout_batching=0.1)
+        await batcher.start()
+        t0 = time.monotonic()
+        # the full batches are processed without waiting for the batching timeout
+        assert await asyncio.gather(*(batcher.submit(i) for i in range(6))) == [0, 2, 4, 6, 8, 10]
+        assert time.monotonic() - t0 < 0.1
+        # the incomplete batches are processed once the batching timeout is reached
+        assert await batcher.submit(6) == 12
+        assert time.monotonic() - t0 >= 0.1
+        # the errors are raised for each request of the batch
+        with pytest.raises(RuntimeError, match="prediction failed"):
+            await batcher.submit("error")
+        await batcher.stop()
+
+    asyncio.run(run())
+    assert batches == [[0, 1, 2], [3, 4, 5], [6], ["error"]]
+
+
+def test_dynamic_batcher_backpressure_and_timeout():
+    release = threading.Event()
+    batches = []
+
+    def predict_batch(requests):
+        batches.append(requests)
+        release.wait(5)
+        return requests
+
+    async def run():
+        batcher = _DynamicBatcher(
+            predict_batch, max_batch_size=2, timeout_batching=0, max_queue_size=2, timeout_request=0.2
+        )
+        await batcher.start()
+        # the first request is being processed, the next two are waiting
+        first = asyncio.ensure_future(batcher.submit(0))
+        await asyncio.sleep(0.05)
+        waiting = [asyncio.ensure_future(batcher.submit(i)) for i in (1, 2)]
+        await asyncio.sleep(0)
+        # the queue is full, the new requests are rejected
+        with pytest.raises(HTTPException) as ex:
+            await batcher.submit(3)
+        assert ex.value.status_code == 503
+        # the requests waiting for too long time out
+        for task in [first, *waiting]:
+            with pytest.raises(HTTPException) as ex:
+                await task
+            assert ex.value.status_code == 408
+        release.set()
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+
+    asyncio.run(run())
+    # the requests which timed out before being processed were dropped
+    assert batches == [[0]]
@@ -6,6 +6,7 @@ import sys
 from copy import deepcopy
 from multiprocessing import Process
 from pathlib import Path
+from threading import Thread
 from time import sleep, time
 from unittest import mock
 
@@ -13,7 +14,7 @@ import aiohttp
 import pytest
 import requests
 from deepdiff import DeepDiff, Delta
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, Response
 from httpx import AsyncClient
 from pydantic import BaseModel
 
@@ -207,6 +208,105 @@ def test_update_publish_state_and_maybe_refresh_ui():
     global_app_state_store.add("1234")
 
 
+def test_update_publish_state_patch(monkeypatch):
+    """This test checks that the latest published state is served and its version is published to the websocket
+    clients along its patch."""
+    publisher = api._StatePublisher()
+    monkeypatch.setattr(api, "state_publisher", publisher)
+    # a websocket client is subscribed to the patches
+    monkeypatch.setattr(global_app_state_store, "num_patch_subscribers", 1)
+    global_app_state_store.remove("1234")
+    global_app_state_store.add("1234")
+    publish_state_queue = _MockQueue("publish_state_queue")
+    api_response_queue = _MockQueue("api_response_queue")
+    thread = UIRefresher(publish_state_queue, api_response_queue)
+
+    publish_state_queue.put(({"vars": {"a": 1}}, None))
+    publish_state_queue.put(({"vars": {"a": 2, "b": [1]}}, None))
+    assert thread.run_once()
+    assert global_app_state_store.get_app_state("1234") == {"vars": {"a": 2, "b": [1]}}
+    version = global_app_state_store.get_app_state_version("1234")
+    assert publisher.version == global_app_state_store.counter == version
+
+    publish_state_queue.put(({"vars": {"a": 3, "b": [1]}}, None))
+    assert thread.run_once()
+    assert not thread.run_once()
+    assert api._get_state_message(version) == {
+        "version": version + 1,
+        "patch": [{"op": "replace", "path": "/vars/a", "value": 3}],
+    }
+    assert api._get_state_message(0) == {
+        "version": version + 1,
+        "patch": [
+            {"op": "add", "path": "/vars", "value": {"a": 2, "b": [1]}},
+            {"op": "replace", "path": "/vars/a", "value": 3},
+        ],
+    }
+    # the full state is sent if the patch isn't known
+    assert api._get_state_message(-1) == {"version": version + 1, "state": {"vars": {"a": 3, "b": [1]}}}
+    global_app_state_store.remove("1234")
+    global_app_state_store.add("1234")
+
+
+def test_get_state_versions():
+    """This test checks that the state endpoint serves the changes since the version known by the client."""
+    global_app_state_store.remove("1234")
+    global_app_state_store.add("1234")
+    global_app_state_store.set_app_state("1234", {"vars": {"a": 1}})
+    version = global_app_state_store.get_app_state_version("1234")
+    headers = {"x_lightning_session_uuid": "1234", "x_lightning_session_id": "1234"}
+
+    def get_state(**kwargs):
+        response = Response()
+        out = asyncio.run(api.get_state(response, **headers, **kwargs))
+        return out, response
+
+    state, response = get_state(since=None, if_none_match=None)
+    assert state == {"vars": {"a": 1}}
+    etag = response.headers["ETag"]
+    assert etag == f'"{api.STATE_ETAG_PREFIX}-{version}"'
+
+    out, _ = get_state(since=version, if_none_match=etag)
+    assert out.status_code == 304
+    # the patches are computed once requested
+    out, _ = get_state(since=version, if_none_match=None)
+    assert out == {"version": version, "patch": []}
+
+    global_app_state_store.set_app_state("1234", {"vars": {"a": 2}})
+    out, response = get_state(since=version, if_none_match=etag)
+    assert out == {"version": version + 1, "patch": [{"op": "replace", "path": "/vars/a", "value": 2}]}
+    assert response.headers["ETag"] == f'"{api.STATE_ETAG_PREFIX}-{version + 1}"'
+
+    # the full state is served if the version is unknown or comes from another server
+    out, _ = get_state(since=version + 2, if_none_match=None)
+    assert out == {"version": version + 1, "state": {"vars": {"a": 2}}}
+    out, _ = get_state(since=version, if_none_match=f'"another-{version}"')
+    assert out == {"version": version + 1, "state": {"vars": {"a": 2}}}
+    global_app_state_store.remove("1234")
+    global_app_state_store.add("1234")
+
+
+def test_state_publisher_broadcast():
+    """This test checks that all the clients awaiting a state change are woken up by a publication from another
+    thread."""
+    publisher = api._StatePublisher()
+
+    async def run():
+        waiters = [asyncio.ensure_future(publisher.wait_for_change(0)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert not any(waiter.done() for waiter in waiters)
+
+        thread = Thread(target=publisher.publish, args=(1,))
+        thread.start()
+        assert await asyncio.wait_for(asyncio.gather(*waiters), timeout=5) == [1, 1, 1]
+        thread.join()
+
+        # a newer version is returned right away
+        assert await publisher.wait_for_change(0) == 1
+
+    asyncio.run(run())
+
+
 @pytest.mark.parametrize("x_lightning_type", ["DEFAULT", "STREAMLIT"])
 @pytest.mark.anyio
 async def test_start_server(x_lightning_type, monkeypatch):
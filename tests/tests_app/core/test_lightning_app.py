@@ -446,6 +446,8 @@ class EmptyFlow(LightningFlow):
         (0, 20),
     ],
 )
+# fetch the deltas one at a time to validate the aggregation time window
+@mock.patch("lightning_app.core.app.QUEUE_BATCH_SIZE", 1)
 def test_lightning_app_aggregation_speed(default_timeout, queue_type_cls: BaseQueue, sleep_time, expect):
 
     """This test validates the `_collect_deltas_from_ui_and_work_queues` can aggregate multiple delta together in a
@@ -482,6 +484,32 @@ def test_lightning_app_aggregation_speed(default_timeout, queue_type_cls: BaseQu
         assert generated > expect
 
 
+def test_lightning_app_aggregation_batched():
+    """Verify the deltas available in the queue are all fetched with a single call."""
+
+    class CountingQueue(MultiProcessQueue):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.get_many_calls = 0
+
+        def get_many(self, max_items, timeout=None):
+            self.get_many_calls += 1
+            return super().get_many(max_items, timeout)
+
+    app = LightningApp(EmptyFlow())
+    app.delta_queue = CountingQueue("api_delta_queue", 0)
+
+    for i in range(10):
+        app.delta_queue.put(_DeltaRequest(Delta({"values_changed": {"root['vars']['counter']": {"new_value": i}}})))
+    sleep(0.1)
+
+    deltas = app._collect_deltas_from_ui_and_work_queues()
+    assert len(deltas) == 10
+    assert deltas[-1].to_dict()["values_changed"]["root['vars']['counter']"]["new_value"] == 9
+    # one call to fetch the deltas and a last one to find the queue empty
+    assert app.delta_queue.get_many_calls == 2
+
+
 def test_lightning_app_aggregation_empty():
     """Verify the while loop exits before `state_accumulate_wait` is reached if no deltas are found."""
 
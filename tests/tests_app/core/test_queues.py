@@ -1,6 +1,7 @@
 import multiprocessing
 import pickle
 import queue
+import threading
 import time
 from unittest import mock
 
@@ -10,7 +11,16 @@ import requests_mock
 from lightning_app import LightningFlow
 from lightning_app.core import queues
 from lightning_app.core.constants import HTTP_QUEUE_URL
-from lightning_app.core.queues import BaseQueue, QueuingSystem, READINESS_QUEUE_CONSTANT, RedisQueue
+from lightning_app.core.queues import (
+    BaseQueue,
+    HTTPQueue,
+    MultiProcessQueue,
+    QueuingSystem,
+    READINESS_QUEUE_CONSTANT,
+    RedisQueue,
+)
+from lightning_app.core.serializers import FastQueueSerializer
+from lightning_app.testing.http_queue import HTTPQueueServer
 from lightning_app.utilities.imports import _is_redis_available
 from lightning_app.utilities.redis import check_if_redis_running
 
@@ -102,6 +112,86 @@ def test_redis_queue_read_timeout(redis_mock):
     assert redis_mock.return_value.blpop.call_args_list[2] == mock.call(["READINESS_QUEUE"], timeout=0)
 
 
+@pytest.mark.skipif(not _is_redis_available(), reason="redis isn't installed.")
+@mock.patch("lightning_app.core.queues.redis.Redis")
+def test_redis_queue_batched(redis_mock):
+    redis_queue = QueuingSystem.REDIS.get_readiness_queue()
+
+    # the length returned by RPUSH is used to warn about large queues, no LLEN round-trip
+    redis_mock.return_value.rpush.return_value = 3
+    redis_queue.put_many(["a", "b", "c"])
+    redis_mock.return_value.rpush.assert_called_once_with(
+        "READINESS_QUEUE", pickle.dumps("a"), pickle.dumps("b"), pickle.dumps("c")
+    )
+    redis_mock.return_value.llen.assert_not_called()
+
+    with mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE", 2), pytest.warns(UserWarning, match="larger than"):
+        redis_queue.put("d")
+
+    # nothing is pushed for an empty batch
+    redis_mock.return_value.rpush.reset_mock()
+    redis_queue.put_many([])
+    redis_mock.return_value.rpush.assert_not_called()
+
+    # the other elements are popped at once after the blocking pop of the first one
+    redis_mock.return_value.blpop.return_value = (b"READINESS_QUEUE", pickle.dumps("a"))
+    redis_mock.return_value.lpop.return_value = [pickle.dumps("b"), pickle.dumps("c")]
+    assert redis_queue.get_many(10, timeout=0) == ["a", "b", "c"]
+    redis_mock.return_value.blpop.assert_called_once_with(["READINESS_QUEUE"], timeout=0.005)
+    redis_mock.return_value.lpop.assert_called_once_with("READINESS_QUEUE", 9)
+
+    # nothing else is popped when the first pop times out
+    redis_mock.return_value.blpop.return_value = None
+    redis_mock.return_value.lpop.reset_mock()
+    with pytest.raises(queue.Empty):
+        redis_queue.get_many(10, timeout=1)
+    redis_mock.return_value.lpop.assert_not_called()
+
+    # the Redis versions older than 6.2 don't support the `count` argument of `LPOP`
+    redis_mock.return_value.blpop.return_value = (b"READINESS_QUEUE", pickle.dumps("a"))
+    redis_mock.return_value.lpop.side_effect = queues.redis.exceptions.ResponseError("wrong number of arguments")
+    pipe = redis_mock.return_value.pipeline.return_value
+    pipe.execute.return_value = [[pickle.dumps("b")], True]
+    assert redis_queue.get_many(10, timeout=0) == ["a", "b"]
+    redis_mock.return_value.pipeline.assert_called_once_with(transaction=True)
+    pipe.lrange.assert_called_once_with("READINESS_QUEUE", 0, 8)
+    pipe.ltrim.assert_called_once_with("READINESS_QUEUE", 9, -1)
+    assert redis_queue.get_many(10, timeout=0) == ["a", "b"]
+    redis_mock.return_value.lpop.assert_called_once()
+
+
+def test_process_queue_batched():
+    my_queue = QueuingSystem.MULTIPROCESS.get_readiness_queue()
+    my_queue.put_many(list(range(5)))
+    time.sleep(0.1)
+    assert my_queue.get_many(3, timeout=1) == [0, 1, 2]
+    assert my_queue.get_many(3, timeout=1) == [3, 4]
+    with pytest.raises(queue.Empty):
+        my_queue.get_many(3, timeout=0.1)
+
+
+def test_get_many_doesnt_wait_for_the_following_elements():
+    my_queue = MultiProcessQueue("test_queue", default_timeout=10)
+    my_queue.put("a")
+    time.sleep(0.1)
+    t0 = time.time()
+    assert my_queue.get_many(3, timeout=1) == ["a"]
+    # the following elements aren't waited for, even with the default timeout
+    assert time.time() - t0 < 1
+    with pytest.raises(queue.Empty):
+        my_queue.get_nowait()
+
+
+def test_process_queue_serializer():
+    my_queue = MultiProcessQueue("test_queue", 0, serializer=FastQueueSerializer())
+    my_queue.put_many([{"a": 1}, "b"])
+    time.sleep(0.1)
+    assert my_queue.get_many(2, timeout=1) == [{"a": 1}, "b"]
+    # the elements are encoded by the serializer before being pushed.
+    my_queue.put("c")
+    assert isinstance(my_queue.queue.get(timeout=1), bytes)
+
+
 @pytest.mark.parametrize(
     "queue_type, queue_process_mock",
     [(QueuingSystem.MULTIPROCESS, multiprocessing)],
@@ -214,3 +304,64 @@ class TestHTTPQueue:
             content=pickle.dumps("test"),
         )
         assert test_queue.get() == "test"
+
+    def test_http_queue_sampled_length(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_LENGTH_CHECK_INTERVAL", 3)
+        with HTTPQueueServer() as server:
+            monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+            test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+            for i in range(6):
+                test_queue.put(i)
+            # 6 pushes and 2 length requests
+            assert server.num_requests == 8
+            assert test_queue.length() == 6
+
+    def test_http_queue_long_polling(self, monkeypatch):
+        monkeypatch.setattr(queues, "ENABLE_HTTP_QUEUE_LONG_POLLING", True)
+        with HTTPQueueServer() as server:
+            monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+            test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+            test_queue.put_many(["a", "b", "c"])
+            test_queue.put("d")
+            assert server.num_requests == 2
+            assert test_queue.get_many(3, timeout=0) == ["a", "b", "c"]
+            assert test_queue.get() == "d"
+            assert server.num_requests == 4
+
+            with pytest.raises(queue.Empty):
+                test_queue.get(timeout=0)
+
+            # the server holds the request until an element is pushed
+            server.num_requests = 0
+            timer = threading.Timer(0.5, lambda: test_queue.put("e"))
+            timer.start()
+            t0 = time.time()
+            assert test_queue.get(timeout=5) == "e"
+            assert time.time() - t0 < 5
+            assert server.num_requests == 2
+
+            t0 = time.time()
+            with pytest.raises(queue.Empty):
+                test_queue.get_many(3, timeout=0.5)
+            assert time.time() - t0 >= 0.5
+
+    @mock.patch("lightning_app.core.queues.WARNING_QUEUE_SIZE", 2)
+    def test_http_queue_long_polling_warning(self, monkeypatch):
+        monkeypatch.setattr(queues, "ENABLE_HTTP_QUEUE_LONG_POLLING", True)
+        with HTTPQueueServer() as server:
+            monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+            test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+            test_queue.put(None)
+            with pytest.warns(UserWarning, match="is larger than the"):
+                test_queue.put(None)
+
+    @pytest.mark.parametrize("long_polling", [False, True])
+    def test_http_queue_serializer(self, long_polling, monkeypatch):
+        monkeypatch.setattr(queues, "ENABLE_HTTP_QUEUE_LONG_POLLING", long_polling)
+        with HTTPQueueServer() as server:
+            monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+            test_queue = HTTPQueue("test_http_queue", 0, serializer=FastQueueSerializer())
+            test_queue.put_many([{"a": 1}, "b"])
+            assert all(value[:1] == b"\xfe" for values in server.queues.values() for value in values)
+            assert test_queue.get_many(2, timeout=1) == [{"a": 1}, "b"]
@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+import pytest
+import torch
+from deepdiff import DeepDiff, Delta
+
+from lightning_app.core.serializers import _get_queue_serializer, FastQueueSerializer, PickleQueueSerializer
+from lightning_app.utilities.proxies import ComponentDelta
+
+
+def test_fast_queue_serializer_component_delta():
+    delta = Delta(DeepDiff({"vars": {"a": 1}}, {"vars": {"a": 2, "b": "c"}}, verbose_level=2), raise_errors=True)
+    component_delta = ComponentDelta(id="root.work", delta=delta)
+    serializer = FastQueueSerializer()
+
+    data = serializer.dumps(component_delta)
+    assert len(data) < len(pickle.dumps(component_delta)) / 1.5
+
+    out = serializer.loads(data)
+    assert out.id == "root.work"
+    assert out.delta.diff == delta.diff
+    assert out.delta.raise_errors
+    assert not out.delta.mutate
+    assert {"vars": {"a": 1}} + out.delta == {"vars": {"a": 2, "b": "c"}}
+
+
+def test_fast_queue_serializer_out_of_band_buffers():
+    serializer = FastQueueSerializer()
+    item = {
+        "array": np.arange(12, dtype=np.float32).reshape(3, 4),
+        "transposed": np.ones((2, 3)).T,
+        "tensor": torch.arange(5),
+        "bfloat16": torch.ones(2, dtype=torch.bfloat16),
+        "grad": torch.ones(2, requires_grad=True),
+    }
+
+    out = serializer.loads(serializer.dumps(item))
+    np.testing.assert_array_equal(out["array"], item["array"])
+    np.testing.assert_array_equal(out["transposed"], item["transposed"])
+    for key in ("tensor", "bfloat16", "grad"):
+        assert type(out[key]) is torch.Tensor
+        assert out[key].dtype == item[key].dtype
+        torch.testing.assert_close(out[key], item[key])
+    assert out["grad"].requires_grad
+    # the decoded arrays own writable buffers as with the in-band pickling
+    out["array"][0, 0] = 1.0
+
+
+def test_queue_serializers_interoperability():
+    fast, plain = FastQueueSerializer(), PickleQueueSerializer()
+    assert fast.loads(plain.dumps({"a": 1})) == {"a": 1}
+    assert plain.loads(fast.dumps({"a": 1})) == {"a": 1}
+
+
+def test_fast_queue_serializer_compression(monkeypatch):
+    from lightning_app.core import serializers
+
+    with pytest.raises(ValueError, match="compression should be one of"):
+        FastQueueSerializer(compression="gzip")
+
+    monkeypatch.setattr(serializers, "_is_lz4_available", lambda: False)
+    with pytest.raises(ModuleNotFoundError, match="pip install lz4"):
+        FastQueueSerializer(compression="lz4")
+
+    # mimic the compression without the optional packages
+    monkeypatch.setattr(serializers, "_is_zstandard_available", lambda: True)
+    monkeypatch.setattr(serializers, "_compress", lambda _, data: data[::-1])
+    monkeypatch.setattr(serializers, "_decompress", lambda _, data: data[::-1])
+    serializer = FastQueueSerializer(compression="zstd", compression_threshold=100)
+    assert serializer.dumps("a")[1] == 0
+    data = serializer.dumps("a" * 200)
+    assert data[1] == 1
+    assert serializer.loads(data) == "a" * 200
+
+
+def test_get_queue_serializer():
+    assert isinstance(_get_queue_serializer("pickle"), PickleQueueSerializer)
+    assert isinstance(_get_queue_serializer("fast"), FastQueueSerializer)
+    with pytest.raises(ValueError, match="either `pickle` or `fast`"):
+        _get_queue_serializer("json")
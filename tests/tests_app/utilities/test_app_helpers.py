@@ -1,4 +1,5 @@
 import os
+import time
 from functools import partial
 from unittest import mock
 
@@ -25,6 +26,7 @@ from lightning_app.utilities.app_helpers import (
     StateStore,
 )
 from lightning_app.utilities.exceptions import LightningAppStateException
+from lightning_app.utilities.json_patch import _make_json_patch
 
 
 class Work(LightningWork):
@@ -67,6 +69,57 @@ def test_simple_app_store():
     assert isinstance(store, StateStore)
 
 
+def test_simple_app_store_versions():
+    store = InMemoryStateStore(max_patches=2)
+    store.add("1234")
+    assert store.get_app_state_version("1234") == 0
+    assert store.get_app_state_patch("1234", 0) == []
+
+    for value in range(3):
+        store.set_app_state("1234", {"vars": {"a": value}})
+    assert store.get_app_state_version("1234") == 3
+    assert store.get_app_state_patch("1234", 3) == []
+    assert store.get_app_state_patch("1234", 1) == [
+        {"op": "replace", "path": "/vars/a", "value": 1},
+        {"op": "replace", "path": "/vars/a", "value": 2},
+    ]
+    # only the latest patches are kept
+    assert store.get_app_state_patch("1234", 0) is None
+    assert store.get_app_state_patch("1234", 4) is None
+
+    # the versions aren't re-used by a new entry
+    store.remove("1234")
+    store.add("1234")
+    store.set_app_state("1234", {"vars": {"a": 0}})
+    assert store.get_app_state_version("1234") == 4
+    assert store.get_app_state_patch("1234", 3) is None
+
+
+def test_simple_app_store_patches_computed_when_requested():
+    store = InMemoryStateStore(patch_request_timeout=10)
+    store.add("1234")
+    with mock.patch("lightning_app.utilities.app_helpers._make_json_patch", wraps=_make_json_patch) as make_patch:
+        store.set_app_state("1234", {"vars": {"a": 0}})
+        make_patch.assert_not_called()
+        # the patches are computed once requested
+        assert store.get_app_state_patch("1234", 0) is None
+        store.set_app_state("1234", {"vars": {"a": 1}})
+        assert make_patch.call_count == 1
+        assert store.get_app_state_patch("1234", 1) == [{"op": "replace", "path": "/vars/a", "value": 1}]
+
+        # until they aren't requested anymore
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 20):
+            store.set_app_state("1234", {"vars": {"a": 2}})
+        assert make_patch.call_count == 1
+        assert store.get_app_state_patch("1234", 2) is None
+
+        # or while clients are subscribed to them
+        store.num_patch_subscribers = 1
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 20):
+            store.set_app_state("1234", {"vars": {"a": 3}})
+        assert store.get_app_state_patch("1234", 3) == [{"op": "replace", "path": "/vars/a", "value": 3}]
+
+
 @mock.patch("lightning_app.core.constants.APP_STATE_MAX_SIZE_BYTES", 120)
 def test_simple_app_store_warning():
     store = InMemoryStateStore()
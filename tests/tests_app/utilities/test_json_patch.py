@@ -0,0 +1,39 @@
+from copy import deepcopy
+
+import pytest
+
+from lightning_app.utilities.json_patch import _apply_json_patch, _make_json_patch
+
+
+@pytest.mark.parametrize(
+    "src, dst",
+    [
+        ({}, {"a": 1}),
+        ({"a": 1}, {}),
+        ({"a": 1, "b": {"c": [1, 2]}}, {"a": 1, "b": {"c": [1, 3]}}),
+        ({"a": [1, 2]}, {"a": [1, 2, 3]}),
+        ({"a/b": {"~c": 1}}, {"a/b": {"~c": 2}}),
+        ({"a": 1}, {"a": 1.0}),
+        ([1], {"a": 1}),
+    ],
+)
+def test_json_patch(src, dst):
+    patch = _make_json_patch(src, dst)
+    assert _apply_json_patch(deepcopy(src), patch) == dst
+
+
+def test_make_json_patch():
+    assert _make_json_patch({"a": 1}, {"a": 1}) == []
+    assert _make_json_patch({"a": {"b": 1}, "c": 2}, {"a": {"b": 2}, "d": 3}) == [
+        {"op": "remove", "path": "/c"},
+        {"op": "replace", "path": "/a/b", "value": 2},
+        {"op": "add", "path": "/d", "value": 3},
+    ]
+
+
+def test_apply_json_patch():
+    doc = {"a": [1, 2]}
+    assert _apply_json_patch(doc, [{"op": "add", "path": "/a/-", "value": 3}]) == {"a": [1, 2, 3]}
+    assert _apply_json_patch(doc, [{"op": "remove", "path": "/a/0"}]) == {"a": [2, 3]}
+    with pytest.raises(ValueError, match="`move` isn't supported"):
+        _apply_json_patch(doc, [{"op": "move", "path": "/a", "from": "/b"}])
@@ -606,6 +606,29 @@ def test_work_state_observer():
     assert not observer._delta_memory
 
 
+def test_work_state_observer_applies_flow_deltas():
+    """Tests that the WorkStateObserver applies the deltas of the flow following an invalid one in the same
+    batch."""
+
+    class WorkWithVar(LightningWork):
+        def __init__(self):
+            super().__init__()
+            self.var = 1
+
+        def run(self):
+            pass
+
+    work = WorkWithVar()
+    flow_to_work_delta_queue = MagicMock(default_timeout=0)
+    observer = WorkStateObserver(work, _MockQueue(), flow_to_work_delta_queue=flow_to_work_delta_queue)
+    # the deltas of the flow are only received when the state of the work changed
+    work.var = 3
+    deep_diff = DeepDiff({**work.state["vars"], "var": 3}, {**work.state["vars"], "var": 2}, verbose_level=2)
+    flow_to_work_delta_queue.get_many.side_effect = [[None, deep_diff.to_dict()], []]
+    observer.run_once()
+    assert work.var == 2
+
+
 class WorkState(LightningWork):
     def __init__(self):
         super().__init__(parallel=True)
@@ -240,9 +240,10 @@ class Flow(LightningFlow):
 
 
 class MockResponse:
-    def __init__(self, state, status_code):
+    def __init__(self, state, status_code, headers=None):
         self._state = state
         self.status_code = status_code
+        self.headers = headers or {}
 
     def json(self):
         return self._state
@@ -266,6 +267,42 @@ def test_get_send_request(monkeypatch):
     state.w.counter = 1
 
 
+def test_app_state_request_state_changes(monkeypatch):
+    """Test that the AppState only requests the changes since the last served state."""
+    monkeypatch.setattr(lightning_app.utilities.state, "_configure_session", mock.MagicMock())
+    monkeypatch.setattr(lightning_app.utilities.state, "_SERVED_STATES", {})
+    served_state = {"vars": {"a": 1}, "flows": {}, "works": {}}
+
+    state = AppState(plugin=AppStatePlugin())
+    state._session.get.return_value = MockResponse(served_state, 200, headers={"ETag": '"abc-1"'})
+    state._request_state()
+    assert state.a == 1
+    assert state._session.get.call_args.kwargs["params"] == {}
+
+    state = AppState(plugin=AppStatePlugin())
+    state._session.get.return_value = MockResponse(None, 304)
+    state._request_state()
+    assert state.a == 1
+    assert state._session.get.call_args.kwargs["params"] == {"since": "1"}
+    assert state._session.get.call_args.kwargs["headers"]["If-None-Match"] == '"abc-1"'
+
+    state = AppState(plugin=AppStatePlugin())
+    patch = [{"op": "replace", "path": "/vars/a", "value": 2}]
+    state._session.get.return_value = MockResponse({"version": 2, "patch": patch}, 200, headers={"ETag": '"abc-2"'})
+    state._request_state()
+    assert state.a == 2
+    # the served state isn't modified by the user changes
+    state._state["vars"]["a"] = 3
+    assert lightning_app.utilities.state._SERVED_STATES[state._url + "/api/v1/state"][1]["vars"]["a"] == 2
+
+    state = AppState(plugin=AppStatePlugin())
+    full_state = {"vars": {"a": 4}, "flows": {}, "works": {}}
+    state._session.get.return_value = MockResponse({"version": 3, "state": full_state}, 200, headers={"ETag": '"d-3"'})
+    state._request_state()
+    assert state.a == 4
+    assert state._session.get.call_args.kwargs["params"] == {"since": "2"}
+
+
 @mock.patch("lightning_app.utilities.state.APP_SERVER_HOST", "https://lightning-cloud.com")
 @mock.patch.dict(os.environ, {"LIGHTNING_APP_STATE_URL": "https://lightning-cloud.com"})
 def test_app_state_with_env_var(**__):
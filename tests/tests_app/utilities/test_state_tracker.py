@@ -0,0 +1,118 @@
+from unittest import mock
+
+from lightning_app import LightningApp, LightningFlow
+from lightning_app.core.queues import MultiProcessQueue
+from lightning_app.structures import Dict
+from lightning_app.testing.helpers import EmptyFlow, EmptyWork
+
+
+class Work(EmptyWork):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+
+
+class Flow(LightningFlow):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.items = []
+        self.work = Work()
+        self.dict = Dict()
+
+    def run(self):
+        pass
+
+
+def test_state_tracker_collect_changes():
+    app = LightningApp(Flow())
+    app.delta_queue = MultiProcessQueue("a", 0)
+    tracker = app._state_tracker
+
+    # the tracker gets synced on the first call to `maybe_apply_changes`
+    assert not tracker.is_synced
+    app.maybe_apply_changes()
+    assert tracker.is_synced
+    assert tracker.collect_changes() == {}
+
+    # assigned attributes
+    app.root.counter = 1
+    app.root.work.counter = 2
+    # unchanged re-assigned attributes
+    app.root.work.counter = 2
+    # in-place mutations
+    app.root.items.append(1)
+
+    assert tracker.collect_changes() == {
+        "root": {"vars": {"counter": 1, "items": [1]}},
+        "root.work": {"vars": {"counter": 2}},
+    }
+
+    app._has_updated = False
+    app.maybe_apply_changes()
+    assert app._has_updated
+    assert app.last_state["vars"]["counter"] == 1
+    assert app.last_state["vars"]["items"] == [1]
+    assert app.last_state["works"]["work"]["vars"]["counter"] == 2
+    assert tracker.collect_changes() == {}
+
+    # the last state isn't aliasing the state of the components
+    app.root.items.append(2)
+    assert app.last_state["vars"]["items"] == [1]
+
+    app._has_updated = False
+    app.maybe_apply_changes()
+    assert app._has_updated
+    assert app.last_state == app.remove_changes(app.state)
+
+
+def test_state_tracker_structure_change():
+    app = LightningApp(Flow())
+    app.delta_queue = MultiProcessQueue("a", 0)
+    tracker = app._state_tracker
+    app.maybe_apply_changes()
+    assert tracker.is_synced
+
+    app.root.dict["flow"] = EmptyFlow()
+    assert not tracker.is_synced
+    assert tracker.collect_changes() is None
+
+    app._has_updated = False
+    app.maybe_apply_changes()
+    assert app._has_updated
+    assert "flow" in app.last_state["structures"]["dict"]["flows"]
+    assert tracker.is_synced
+
+
+def test_state_tracker_paused_on_set_state():
+    app = LightningApp(Flow())
+    app.delta_queue = MultiProcessQueue("a", 0)
+    app.maybe_apply_changes()
+
+    state = app.state
+    state["vars"]["counter"] = 3
+    app.set_state(state)
+    assert app.root.counter == 3
+    assert app._state_tracker.collect_changes() == {}
+
+
+def test_state_tracker_changes_collected_once():
+    app = LightningApp(Flow())
+    app.delta_queue = MultiProcessQueue("a", 0)
+    app.maybe_apply_changes()
+
+    app.root.counter = 1
+    with mock.patch.object(app._state_tracker, "collect_changes", wraps=app._state_tracker.collect_changes) as collect:
+        app.maybe_apply_changes()
+    assert collect.call_count == 1
+    assert app.last_state["vars"]["counter"] == 1
+
+    def process_requests():
+        # a request changes the state after the changes were collected
+        app.root.counter = 2
+        app._has_processed_requests = True
+        return []
+
+    with mock.patch.object(app, "_collect_deltas_from_ui_and_work_queues", process_requests):
+        app.maybe_apply_changes()
+    assert app.last_state["vars"]["counter"] == 2
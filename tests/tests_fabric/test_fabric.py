@@ -371,6 +371,16 @@ def test_setup_dataloaders_move_to_device(lite_device_mock):
     lite_device_mock.assert_called()
 
 
+def test_setup_dataloaders_coalesce():
+    """Test that the setup configures FabricDataLoader to coalesce the transfers of the batches."""
+    lite = EmptyLite()
+    lite_dataloader = lite.setup_dataloaders(DataLoader(range(2)))
+    assert not lite_dataloader._coalesce
+
+    lite_dataloader = lite.setup_dataloaders(DataLoader(range(2)), coalesce=True)
+    assert lite_dataloader._coalesce
+
+
 def test_setup_dataloaders_distributed_sampler_not_needed():
     """Test that replace_sampler option has no effect when no distributed sampler is needed."""
     custom_sampler = Mock(spec=Sampler)
@@ -232,6 +232,19 @@ def test_lite_dataloader_device_placement(src_device_str, dest_device_str):
     assert torch.equal(batch1["data"], torch.tensor([2, 3], device=dest_device))
 
 
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_lite_dataloader_coalesce(coalesce):
+    """Test that the FabricDataLoader forwards the `coalesce` option when moving the batches to the device."""
+    dataloader = DataLoader([torch.tensor(0), torch.tensor(1)], batch_size=2)
+    lite_dataloader = _FabricDataLoader(dataloader=dataloader, device=torch.device("cpu"), coalesce=coalesce)
+    with mock.patch(
+        "lightning_fabric.wrappers.move_data_to_device", side_effect=lambda batch, *_, **__: batch
+    ) as move_mock:
+        batch = next(iter(lite_dataloader))
+    assert torch.equal(batch, torch.tensor([0, 1]))
+    move_mock.assert_called_once_with(batch, torch.device("cpu"), coalesce=coalesce)
+
+
 def test_lite_dataloader_distributed_sampler_set_epoch():
     """Test that the LiteDataLoader calls `set_epoch()` on the wrapped sampler if applicable."""
     sampler = DistributedSampler(range(3), num_replicas=2, rank=0)
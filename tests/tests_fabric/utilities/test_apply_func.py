@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import namedtuple
+from unittest import mock
+
 import pytest
 import torch
+from tests_fabric.helpers.runif import RunIf
 from torch import Tensor
 
-from lightning_fabric.utilities.apply_func import move_data_to_device
+from lightning_fabric.utilities.apply_func import _coalesced_to, _compile_transfer_plan, move_data_to_device
 
 
 @pytest.mark.parametrize("should_return", [False, True])
@@ -34,3 +38,68 @@ def test_wrongly_implemented_transferable_data_type(should_return):
     tensor = torch.tensor(0.1)
     obj = TensorObject(tensor, should_return)
     assert obj == move_data_to_device(obj, torch.device("cpu"))
+
+
+def test_move_data_to_device_structures():
+    Batch = namedtuple("Batch", ["x", "y"])
+    batch = {
+        "a": [torch.zeros(2), (torch.ones(3), "text")],
+        "b": Batch(torch.tensor(1), None),
+        "c": 1.5,
+        "d": {},
+    }
+    _compile_transfer_plan.cache_clear()
+    for i in range(2):
+        moved = move_data_to_device(batch, torch.device("cpu"))
+        assert type(moved) is dict
+        assert list(moved) == list(batch)
+        assert type(moved["a"][1]) is tuple
+        assert type(moved["b"]) is Batch
+        assert moved["a"][1][1] == "text"
+        assert moved["b"].y is None
+        assert moved["c"] == 1.5
+        assert moved["d"] == {}
+        assert torch.equal(moved["a"][0], batch["a"][0])
+        if i == 0:
+            misses = _compile_transfer_plan.cache_info().misses
+    # the plan is compiled once for the structure
+    assert _compile_transfer_plan.cache_info().misses == misses
+
+
+def test_move_data_to_device_unsupported_structures():
+    class CustomList(list):
+        pass
+
+    batch = {"a": CustomList([torch.zeros(2)]), "b": {1, 2}}
+    moved = move_data_to_device(batch, torch.device("cpu"))
+    assert type(moved["a"]) is CustomList
+    assert moved["b"] == {1, 2}
+
+
+def test_coalesced_to():
+    tensors = [
+        torch.tensor(True),
+        torch.arange(3, dtype=torch.float64),
+        torch.arange(6, dtype=torch.int16).view(2, 3),
+        torch.zeros(0, 2),
+        torch.arange(4, dtype=torch.float32).t(),
+        torch.arange(8, dtype=torch.float32).view(2, 4)[:, 1:3],
+    ]
+    moved = _coalesced_to(tensors, torch.device("cpu"), pin_memory=False)
+    assert len(moved) == len(tensors)
+    for tensor, moved_tensor in zip(tensors, moved):
+        assert moved_tensor.dtype == tensor.dtype
+        assert torch.equal(moved_tensor, tensor)
+
+
+@RunIf(min_cuda_gpus=1)
+def test_move_data_to_device_coalesce():
+    batch = {"a": torch.arange(3), "b": [torch.ones(2, 2), torch.zeros(100_000)], "c": torch.tensor(0.5)}
+    with mock.patch("lightning_fabric.utilities.apply_func._coalesced_to", wraps=_coalesced_to) as coalesced_mock:
+        moved = move_data_to_device(batch, torch.device("cuda", 0), coalesce=True)
+    # the large tensor is transferred on its own
+    assert len(coalesced_mock.call_args.args[0]) == 3
+    assert moved["a"].is_cuda and moved["b"][1].is_cuda
+    assert torch.equal(moved["a"].cpu(), batch["a"])
+    assert torch.equal(moved["b"][0].cpu(), batch["b"][0])
+    assert moved["c"].item() == 0.5
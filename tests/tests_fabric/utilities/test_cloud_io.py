@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+from unittest import mock
 
 import fsspec
+import pytest
+import torch
 from fsspec.implementations.local import LocalFileSystem
 
-from lightning_fabric.utilities.cloud_io import get_filesystem
+from lightning_fabric.plugins import TorchCheckpointIO
+from lightning_fabric.utilities.cloud_io import _atomic_save, _load, _SAVE_BUFFER_SIZE, get_filesystem
 
 
 def test_get_filesystem_custom_filesystem():
@@ -32,3 +36,81 @@ def test_get_filesystem_custom_filesystem():
 
 def test_get_filesystem_local_filesystem():
     assert isinstance(get_filesystem("tmpdir/tmp_file"), LocalFileSystem)
+
+
+@pytest.mark.parametrize("buffer_size", [1, 1024])
+def test_atomic_save_local(tmp_path, buffer_size):
+    checkpoint = {"weight": torch.arange(1000.0), "epoch": 1}
+    filepath = tmp_path / "model.ckpt"
+    filepath.write_bytes(b"previous")
+
+    _atomic_save(checkpoint, filepath, buffer_size=buffer_size)
+    assert os.listdir(tmp_path) == ["model.ckpt"]
+    loaded = _load(filepath)
+    assert torch.equal(loaded["weight"], checkpoint["weight"])
+    assert loaded["epoch"] == 1
+
+
+def test_atomic_save_local_failure(tmp_path):
+    filepath = tmp_path / "model.ckpt"
+    filepath.write_bytes(b"previous")
+
+    with mock.patch("torch.save", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+        _atomic_save({"epoch": 1}, filepath)
+    # the previous checkpoint is left untouched and the temporary file is removed
+    assert os.listdir(tmp_path) == ["model.ckpt"]
+    assert filepath.read_bytes() == b"previous"
+
+
+def test_atomic_save_remote():
+    fs = fsspec.filesystem("memory")
+    filepath = "memory://checkpoints/model.ckpt"
+    _atomic_save({"epoch": 1}, filepath)
+    assert _load(filepath) == {"epoch": 1}
+    fs.rm("memory://checkpoints", recursive=True)
+
+
+def test_atomic_save_remote_commit():
+    """Test that the remote files are committed on their own once complete, or discarded."""
+    fs = fsspec.filesystem("memory")
+    filepath = "memory://checkpoints/model.ckpt"
+    file = mock.MagicMock()
+    with mock.patch.object(fs, "open", return_value=file) as open_mock:
+        _atomic_save({"epoch": 1}, filepath)
+        assert open_mock.call_args.kwargs["autocommit"] is False
+        file.commit.assert_called_once()
+        file.discard.assert_not_called()
+
+        file.reset_mock()
+        with mock.patch("torch.save", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+            _atomic_save({"epoch": 1}, filepath)
+        file.commit.assert_not_called()
+        file.discard.assert_called_once()
+    # the transaction of the shared filesystem isn't used
+    assert not fs._intrans
+
+
+def test_torch_checkpoint_io_buffer_size(tmp_path):
+    with pytest.raises(ValueError, match="`buffer_size` should be a positive"):
+        TorchCheckpointIO(buffer_size=0)
+
+    checkpoint_io = TorchCheckpointIO(buffer_size=64)
+    filepath = tmp_path / "sub" / "model.ckpt"
+    with mock.patch("lightning_fabric.plugins.io.torch_io._atomic_save") as save_mock:
+        checkpoint_io.save_checkpoint({"epoch": 1}, filepath)
+    save_mock.assert_called_once_with({"epoch": 1}, filepath, buffer_size=64)
+
+    checkpoint_io.save_checkpoint({"epoch": 1}, filepath)
+    assert checkpoint_io.load_checkpoint(filepath) == {"epoch": 1}
+
+
+def test_torch_checkpoint_io_buffer_size_default(tmp_path):
+    class CustomCheckpointIO(TorchCheckpointIO):
+        def __init__(self):
+            # doesn't call `super().__init__()`
+            pass
+
+    checkpoint_io = CustomCheckpointIO()
+    assert checkpoint_io.buffer_size == _SAVE_BUFFER_SIZE
+    checkpoint_io.save_checkpoint({"epoch": 1}, tmp_path / "model.ckpt")
+    assert checkpoint_io.load_checkpoint(tmp_path / "model.ckpt") == {"epoch": 1}
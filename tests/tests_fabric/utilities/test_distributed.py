@@ -8,7 +8,7 @@ from lightning_fabric.accelerators import CPUAccelerator, CUDAAccelerator, MPSAc
 from lightning_fabric.plugins.environments import LightningEnvironment
 from lightning_fabric.strategies import DDPStrategy
 from lightning_fabric.strategies.launchers.multiprocessing import _MultiProcessingLauncher
-from lightning_fabric.utilities.distributed import _gather_all_tensors
+from lightning_fabric.utilities.distributed import _gather_all_tensors, _gather_all_tensors_batched
 
 
 def wrap_launch_function(fn, strategy, *args, **kwargs):
@@ -62,12 +62,49 @@ def _test_all_gather_uneven_tensors_multidim(strategy):
         assert (val == torch.ones_like(val)).all()
 
 
+def _test_all_gather_uneven_tensors_without_padding(strategy):
+    rank = strategy.local_rank
+    device = strategy.root_device
+    world_size = strategy.num_processes
+
+    tensor = torch.arange((rank + 1) * (2 - rank), device=device).view(rank + 1, 2 - rank)
+    result = _gather_all_tensors(tensor, padding=False)
+    assert len(result) == world_size
+    for idx in range(world_size):
+        assert torch.equal(result[idx], torch.arange((idx + 1) * (2 - idx), device=device).view(idx + 1, 2 - idx))
+
+
+def _test_all_gather_batched(strategy):
+    rank = strategy.local_rank
+    device = strategy.root_device
+    world_size = strategy.num_processes
+
+    def tensors(rank):
+        return [
+            torch.full((rank + 1, 3), rank, device=device),
+            torch.tensor(rank + 0.5, device=device),
+            torch.ones(2, 2, dtype=torch.long, device=device) * rank,
+            torch.zeros(0, 2 - rank, device=device),
+        ]
+
+    result = _gather_all_tensors_batched(tensors(rank))
+    assert len(result) == 4
+    for index, gathered in enumerate(result):
+        assert len(gathered) == world_size
+        for idx in range(world_size):
+            expected = tensors(idx)[index]
+            assert gathered[idx].dtype == expected.dtype
+            assert torch.equal(gathered[idx], expected)
+
+
 @RunIf(skip_windows=True)
 @pytest.mark.parametrize(
     "process",
     [
         _test_all_gather_uneven_tensors_multidim,
         _test_all_gather_uneven_tensors,
+        _test_all_gather_uneven_tensors_without_padding,
+        _test_all_gather_batched,
     ],
 )
 @pytest.mark.parametrize(
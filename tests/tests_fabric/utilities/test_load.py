@@ -0,0 +1,99 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+
+import pytest
+import torch
+import torch.nn as nn
+
+from lightning_fabric.utilities.cloud_io import _load
+from lightning_fabric.utilities.load import _lazy_load, _materialize_tensors, _NotYetLoadedTensor
+
+
+def test_lazy_load_module(tmp_path):
+    model0 = nn.Linear(2, 2)
+    torch.save(model0, tmp_path / "model.pt")
+
+    model1 = _lazy_load(tmp_path / "model.pt")
+    assert isinstance(model1.weight, _NotYetLoadedTensor)
+    assert model1.weight.shape == (2, 2)
+    assert model1.weight.dtype == torch.float32
+    assert model1.weight.requires_grad
+
+    model1.weight = _materialize_tensors(model1.weight)
+    model1.bias = _materialize_tensors(model1.bias)
+    assert isinstance(model1.weight, nn.Parameter)
+    assert torch.equal(model0.weight, model1.weight)
+    assert torch.equal(model0.bias, model1.bias)
+
+
+def test_lazy_load_tensors(tmp_path):
+    base = torch.arange(6.0)
+    checkpoint = {
+        "view": base[2:4],
+        "base": base,
+        "int": torch.tensor([1, 2]),
+        "nested": [torch.rand(2, 3).t(), {"value": 1}],
+    }
+    torch.save(checkpoint, tmp_path / "checkpoint.pt")
+
+    loaded = _lazy_load(tmp_path / "checkpoint.pt")
+    assert loaded["nested"][1] == {"value": 1}
+    materialized = _materialize_tensors(loaded)
+    for expected, actual in zip(
+        (checkpoint["view"], checkpoint["base"], checkpoint["int"], checkpoint["nested"][0]),
+        (materialized["view"], materialized["base"], materialized["int"], materialized["nested"][0]),
+    ):
+        assert torch.equal(expected, actual)
+        assert expected.stride() == actual.stride()
+    # the tensors sharing their storage still do
+    assert materialized["view"].data_ptr() == materialized["base"][2:].data_ptr()
+
+    # torch operations load the tensors
+    assert torch.equal(torch.add(loaded["base"], 1), base + 1)
+    assert torch.equal(torch.cat([loaded["int"], loaded["int"]]), torch.tensor([1, 2, 1, 2]))
+
+
+def test_lazy_load_only_reads_used_tensors(tmp_path):
+    torch.save({"used": torch.ones(2), "unused": torch.zeros(2)}, tmp_path / "checkpoint.pt")
+    loaded = _lazy_load(tmp_path / "checkpoint.pt")
+
+    with mock.patch("torch._C.PyTorchFileReader.get_storage_from_record", wraps=None) as read_mock:
+        read_mock.side_effect = lambda *_: pytest.fail("The unused tensor was read")
+        assert loaded["unused"].shape == (2,)
+    assert torch.equal(_materialize_tensors(loaded["used"]), torch.ones(2))
+
+
+def test_load_lazy_fallback(tmp_path):
+    filepath = tmp_path / "checkpoint.pt"
+    # the legacy format can't be loaded lazily
+    torch.save({"value": torch.ones(2)}, filepath, _use_new_zipfile_serialization=False)
+    loaded = _load(filepath, lazy=True)
+    assert isinstance(loaded["value"], torch.Tensor)
+
+    torch.save({"value": torch.ones(2)}, filepath)
+    loaded = _load(filepath, lazy=True)
+    assert isinstance(loaded["value"], _NotYetLoadedTensor)
+
+
+@mock.patch("lightning_fabric.utilities.load._TORCH_GREATER_EQUAL_1_12", False)
+def test_lazy_load_unsupported_torch_version(tmp_path):
+    filepath = tmp_path / "checkpoint.pt"
+    torch.save({"value": torch.ones(2)}, filepath)
+    with pytest.raises(NotImplementedError, match="supported from PyTorch v1.12.0 onwards"):
+        _lazy_load(filepath)
+
+    with mock.patch("lightning_fabric.utilities.cloud_io._TORCH_GREATER_EQUAL_1_12", False):
+        loaded = _load(filepath, lazy=True)
+    assert isinstance(loaded["value"], torch.Tensor)
@@ -422,9 +422,10 @@ def test_rich_progress_bar_padding():
 
 
 @RunIf(rich=True)
-def test_rich_progress_bar_can_be_pickled():
+def test_rich_progress_bar_can_be_pickled(tmpdir):
     bar = RichProgressBar()
     trainer = Trainer(
+        default_root_dir=tmpdir,
         callbacks=[bar],
         max_epochs=1,
         limit_train_batches=1,
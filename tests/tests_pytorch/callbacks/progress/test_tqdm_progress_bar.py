@@ -538,9 +538,10 @@ def test_tqdm_progress_bar_print_disabled(tqdm_write, mock_print, tmpdir):
     tqdm_write.assert_not_called()
 
 
-def test_tqdm_progress_bar_can_be_pickled():
+def test_tqdm_progress_bar_can_be_pickled(tmpdir):
     bar = TQDMProgressBar()
     trainer = Trainer(
+        default_root_dir=tmpdir,
         callbacks=[bar],
         max_epochs=1,
         limit_train_batches=1,
@@ -13,6 +13,7 @@
 # limitations under the License.
 from pathlib import Path
 from re import escape
+from unittest import mock
 from unittest.mock import Mock
 
 import pytest
@@ -21,6 +22,7 @@ from lightning_utilities.test.warning import no_warning_call
 from pytorch_lightning import Callback, Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.demos.boring_classes import BoringModel
+from pytorch_lightning.profilers import SimpleProfiler
 
 
 def test_callbacks_configured_in_model(tmpdir):
@@ -160,3 +162,46 @@ def test_resume_incomplete_callbacks_list_warning(tmpdir):
     )
     with no_warning_call(UserWarning, match="Please add the following callbacks:"):
         trainer.fit(model, ckpt_path=ckpt_path)
+
+
+class BatchEndCallback(Callback):
+    def __init__(self):
+        self.calls = 0
+
+    def on_train_batch_end(self, *_):
+        self.calls += 1
+
+
+def test_callback_hooks_dispatch_table():
+    """Test that the callback hooks are only dispatched to the callbacks overriding them."""
+    callback, other = BatchEndCallback(), Callback()
+    trainer = Trainer(callbacks=[callback, other], enable_checkpointing=False, enable_progress_bar=False)
+    assert trainer._callbacks_overriding("on_train_batch_end") == [(callback, None)]
+    assert trainer._callbacks_overriding("on_train_batch_start") == []
+
+    with mock.patch.object(trainer.profiler, "profile") as profile_mock:
+        trainer._call_callback_hooks("on_train_batch_end", None, None, 0)
+        trainer._call_callback_hooks("on_train_batch_start", None, 0)
+    assert callback.calls == 1
+    # the calls aren't profiled by the `PassThroughProfiler`
+    profile_mock.assert_not_called()
+
+    # the dispatch table follows the changes of the callbacks
+    added = BatchEndCallback()
+    trainer.callbacks.append(added)
+    trainer._call_callback_hooks("on_train_batch_end", None, None, 0)
+    assert callback.calls == 2
+    assert added.calls == 1
+
+    # and of the profiler
+    trainer.profiler = SimpleProfiler()
+    assert trainer._callbacks_overriding("on_train_batch_end") == [
+        (callback, "[Callback]BatchEndCallback.on_train_batch_end"),
+        (added, "[Callback]BatchEndCallback.on_train_batch_end"),
+    ]
+
+    # the mocked hooks are always called
+    mocked = Mock(spec=Callback)
+    trainer.callbacks = [mocked]
+    trainer._call_callback_hooks("on_train_batch_start", None, 0)
+    mocked.on_train_batch_start.assert_called_once_with(trainer, None, None, 0)
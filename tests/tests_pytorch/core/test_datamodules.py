@@ -474,11 +474,12 @@ def test_define_as_dataclass():
 
 
 @RunIf(skip_windows=True)  # TODO: all durations are 0 on Windows
-def test_datamodule_hooks_are_profiled():
+def test_datamodule_hooks_are_profiled(tmpdir):
     """Test that `LightningDataModule` hooks are profiled."""
 
     def get_trainer():
         trainer = Trainer(
+            default_root_dir=tmpdir,
             max_steps=1,
             limit_val_batches=0,
             profiler="simple",
@@ -36,6 +36,7 @@ from pytorch_lightning.trainer.connectors.logger_connector.result import (
     _ResultMetric,
     _Sync,
 )
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests_pytorch.core.test_results import spawn_launch
 from tests_pytorch.helpers.runif import RunIf
 
@@ -680,3 +681,97 @@ def test_logger_sync_dist(distributed_env, log_val):
         with warning_ctx(PossibleUserWarning, match=r"recommended to use `self.log\('bar', ..., sync_dist=True\)`"):
             value = _ResultCollection._get_cache(result_metric, on_step=False)
         assert value == 0.5
+
+
+def test_result_collection_fused_accumulation():
+    result = _ResultCollection(True, torch.device("cpu"))
+    expected = {"mean": 0.0, "sum": 0.0, "max": float("-inf"), "min": float("inf")}
+    total_batch_size = 0
+
+    for i, batch_size in enumerate((2, 5, 3)):
+        values = (torch.tensor(float(i)), torch.tensor(-2.0 * i))
+        for value in values:
+            # logging twice in the same step updates the metrics twice
+            for reduce_fx in expected:
+                result.log("training_step", reduce_fx, value, on_step=False, reduce_fx=reduce_fx, batch_size=batch_size)
+            expected["mean"] += value.item() * batch_size
+            expected["sum"] += value.item()
+            expected["max"] = max(expected["max"], value.item())
+            expected["min"] = min(expected["min"], value.item())
+            total_batch_size += batch_size
+        # the updates are applied together once a state is read
+        if i:
+            assert len(result._accumulator._pending) == 8
+        assert result["training_step.mean"].value == expected["mean"]
+        assert not result._accumulator.pending
+        assert result["training_step.mean"].cumulated_batch_size == total_batch_size
+
+    metrics = result.metrics(on_step=False)["callback"]
+    assert metrics["mean"] == expected["mean"] / total_batch_size
+    assert metrics["sum"] == expected["sum"]
+    assert metrics["max"] == expected["max"]
+    assert metrics["min"] == expected["min"]
+
+
+def test_result_collection_fused_accumulation_dtype_promotion():
+    result = _ResultCollection(True, torch.device("cpu"))
+    result.log("training_step", "a", torch.tensor(1.0, dtype=torch.double), on_step=False, batch_size=1)
+    result.log("training_step", "a", torch.tensor(3.0), on_step=False, batch_size=1)
+    assert result["training_step.a"].value.dtype == torch.double
+    assert result["training_step.a"].compute() == 2
+
+
+def test_result_collection_fused_accumulation_state_dict():
+    result = _ResultCollection(True, torch.device("cpu"))
+    result.log("training_step", "a", torch.tensor(1.0), on_step=False, batch_size=2)
+    # the pending updates are applied before the states are saved
+    state_dict = result.state_dict()
+    assert state_dict["items"]["training_step.a"]["value"] == 2
+    assert "_accumulator" not in state_dict["items"]["training_step.a"]
+
+    new_result = _ResultCollection(True, torch.device("cpu"))
+    new_result.load_state_dict(state_dict, sync_fn=_Sync.no_op)
+    assert new_result["training_step.a"]._accumulator is new_result._accumulator
+    new_result.log("training_step", "a", torch.tensor(4.0), on_step=False, batch_size=2)
+    assert new_result["training_step.a"].compute() == 2.5
+
+    # the values logged before a reset are dropped
+    new_result.log("training_step", "a", torch.tensor(4.0), on_step=False, batch_size=2)
+    new_result.reset()
+    assert new_result["training_step.a"].value == 0
+
+
+def test_result_collection_metadata_cache():
+    result = _ResultCollection(True, torch.device("cpu"))
+    with mock.patch(
+        "pytorch_lightning.trainer.connectors.logger_connector.result._Metadata", wraps=_Metadata
+    ) as metadata_mock:
+        for _ in range(3):
+            result.log("training_step", "a", torch.tensor(1.0), on_step=True, batch_size=1)
+    metadata_mock.assert_called_once()
+
+    with pytest.raises(MisconfigurationException, match="twice in `training_step` with different arguments"):
+        result.log("training_step", "a", torch.tensor(1.0), on_step=False, batch_size=1)
+
+
+def test_result_collection_coalesced_sync():
+    sync_fn = mock.Mock(side_effect=lambda x, reduce_op, group: x * 2)
+    result = _ResultCollection(True, torch.device("cpu"))
+    for i in range(2):
+        for name in ("a", "b", "c"):
+            result.log("training_step", name, torch.tensor(1.0 + i), sync_dist=True, sync_dist_fn=sync_fn, batch_size=2)
+        result.log("training_step", "d", torch.tensor(2.0 + i), sync_dist=True, sync_dist_fn=sync_fn, reduce_fx="sum")
+        result.log("training_step", "e", torch.tensor(3.0), sync_dist=True, sync_dist_fn=sync_fn, reduce_fx="max")
+        result.log("training_step", "f", torch.tensor(4.0), sync_dist=False, sync_dist_fn=sync_fn)
+        result.log("training_step", "g", torch.tensor(5.0), sync_dist=True, sync_dist_fn=sync_fn, rank_zero_only=True)
+
+    metrics = result.metrics(on_step=False)["callback"]
+    # one call for the values and one for the batch sizes of the mean reductions, one call each for the sum and max
+    assert sync_fn.call_count == 4
+    calls = {(call.kwargs["reduce_op"], call.args[0].dtype): call.args[0] for call in sync_fn.call_args_list}
+    assert set(calls) == {("mean", torch.float), ("mean", torch.long), ("sum", torch.float), ("max", torch.float)}
+    assert calls[("mean", torch.float)].shape == (3,)
+    # the values are computed as they would be without coalescing
+    assert metrics == {"a": 1.5, "b": 1.5, "c": 1.5, "d": 10.0, "e": 6.0, "f": 4.0, "g": 5.0}
+    # the states aren't modified
+    assert result["training_step.d"].value == 5
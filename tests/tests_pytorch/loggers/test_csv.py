@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import csv
 import os
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
@@ -128,3 +130,65 @@ def test_flush_n_steps(tmpdir):
     logger.save.assert_not_called()
     logger.log_metrics(metrics, step=1)
     logger.save.assert_called_once()
+
+
+def test_flush_n_pending_rows(tmpdir):
+    """The rows logged without a step are flushed once the number of pending rows reaches the budget."""
+    logger = CSVLogger(tmpdir, flush_logs_every_n_steps=3)
+    logger.save = MagicMock()
+    logger.log_metrics({"a": 1})
+    logger.log_metrics({"a": 2})
+    logger.save.assert_not_called()
+    logger.log_metrics({"a": 3})
+    logger.save.assert_called_once()
+
+
+def test_metrics_writer_append_only(tmpdir):
+    writer = ExperimentWriter(log_dir=str(tmpdir))
+
+    def read_rows():
+        with open(writer.metrics_file_path, newline="") as f:
+            return list(csv.reader(f))
+
+    writer.log_metrics({"a": 1}, step=0)
+    writer.log_metrics({"a": 2}, step=1)
+    writer.save()
+    # the saved rows are released
+    assert writer.metrics == []
+    assert read_rows() == [["a", "step"], ["1", "0"], ["2", "1"]]
+
+    # the rows with known keys are appended without rewriting the file
+    writer.log_metrics({"a": 3}, step=2)
+    with mock.patch.object(writer, "_write_metrics", wraps=writer._write_metrics) as write_mock:
+        writer.save()
+    write_mock.assert_called_once_with("a", [{"a": 3, "step": 2}])
+    assert read_rows() == [["a", "step"], ["1", "0"], ["2", "1"], ["3", "2"]]
+
+    # new keys rewrite the header
+    writer.log_metrics({"b": torch.tensor(4.0)}, step=3)
+    writer.log_metrics({"a": 5, "c": 6})
+    writer.save()
+    assert read_rows() == [
+        ["a", "step", "b", "c"],
+        ["1", "0", "", ""],
+        ["2", "1", "", ""],
+        ["3", "2", "", ""],
+        ["", "3", "4.0", ""],
+        ["5", "4", "", "6"],
+    ]
+    assert writer.metrics == []
+
+    # nothing is written without new rows
+    writer.save()
+    assert len(read_rows()) == 6
+
+
+def test_metrics_writer_overwrites_previous_run(tmpdir):
+    with open(os.path.join(tmpdir, ExperimentWriter.NAME_METRICS_FILE), "w") as f:
+        f.write("x,step\n1,0\n")
+    with pytest.warns(UserWarning, match="exists and is not empty"):
+        writer = ExperimentWriter(log_dir=str(tmpdir))
+    writer.log_metrics({"a": 1}, step=0)
+    writer.save()
+    with open(writer.metrics_file_path) as f:
+        assert f.read().splitlines() == ["a,step", "1,0"]
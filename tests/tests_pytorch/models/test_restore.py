@@ -29,6 +29,7 @@ from torch import Tensor
 import tests_pytorch.helpers.pipelines as tpipes
 import tests_pytorch.helpers.utils as tutils
 from lightning_fabric import seed_everything
+from lightning_fabric.utilities.load import _LazyStorage
 from pytorch_lightning import Callback, Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.demos.boring_classes import BoringModel
@@ -552,6 +553,30 @@ def test_load_model_from_checkpoint(tmpdir, model_template):
     new_trainer.test(pretrained_model)
 
 
+def test_load_model_from_checkpoint_lazy(tmpdir):
+    """Test that the lazy loading only reads the state dict of the model from the checkpoint."""
+
+    class AdamModel(BoringModel):
+        def configure_optimizers(self):
+            return torch.optim.Adam(self.parameters())
+
+    model = AdamModel()
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=1, limit_val_batches=0, enable_progress_bar=False)
+    trainer.fit(model)
+    checkpoint_path = trainer.checkpoint_callback.best_model_path
+    assert torch.load(checkpoint_path)["optimizer_states"][0]["state"]
+
+    with mock.patch(
+        "lightning_fabric.utilities.load._LazyStorage.load", side_effect=_LazyStorage.load, autospec=True
+    ) as load_mock:
+        pretrained_model = AdamModel.load_from_checkpoint(checkpoint_path, lazy=True)
+    # the weight and the bias of the layer, the optimizer states are never read
+    assert load_mock.call_count == 2
+
+    for old_p, new_p in zip(model.parameters(), pretrained_model.parameters()):
+        assert torch.equal(old_p, new_p)
+
+
 @RunIf(min_cuda_gpus=2, sklearn=True)
 def test_dp_resume(tmpdir):
     """Make sure DP continues training correctly."""
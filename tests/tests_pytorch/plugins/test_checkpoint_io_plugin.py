@@ -11,11 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Event, Thread
 from typing import Any, Dict, Optional
+from unittest import mock
 from unittest.mock import MagicMock, Mock
 
+import pytest
 import torch
 
 from lightning_fabric.plugins import CheckpointIO, TorchCheckpointIO
@@ -24,6 +29,8 @@ from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.demos.boring_classes import BoringModel
 from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
+from pytorch_lightning.plugins.io.incremental_plugin import _as_bytes, IncrementalCheckpointIO
+from pytorch_lightning.plugins.io.sharded_plugin import ShardedCheckpointIO
 from pytorch_lightning.strategies import SingleDeviceStrategy
 
 
@@ -150,3 +157,376 @@ def test_multi_wrapped_checkpoint_io_initialization():
     assert isinstance(ckpt_io.checkpoint_io.checkpoint_io, TorchCheckpointIO)
     assert ckpt_io._base_checkpoint_io_configured is True
     assert ckpt_io.checkpoint_io._base_checkpoint_io_configured is True
+
+
+class BlockingCheckpointIO(CheckpointIO):
+    def __init__(self):
+        self.saved = {}
+        self.event = Event()
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        self.event.wait()
+        self.saved[path] = checkpoint
+
+    def load_checkpoint(self, path: _PATH, storage_options: Optional[Any] = None) -> Dict[str, Any]:
+        return self.saved[path]
+
+    def remove_checkpoint(self, path: _PATH) -> None:
+        del self.saved[path]
+
+
+def test_async_checkpoint_plugin_snapshot():
+    """Test that the tensors are copied before being saved, and that the copies are reused."""
+    base_ckpt_io = BlockingCheckpointIO()
+    checkpoint_io = AsyncCheckpointIO(base_ckpt_io)
+    tensor = torch.zeros(2)
+    checkpoint_io.save_checkpoint({"tensor": tensor, "epoch": 0}, "0.ckpt")
+    # mutated by the training while the checkpoint is being saved
+    tensor.add_(1)
+    base_ckpt_io.event.set()
+    assert torch.equal(checkpoint_io.load_checkpoint("0.ckpt")["tensor"], torch.zeros(2))
+    buffer = base_ckpt_io.saved["0.ckpt"]["tensor"]
+
+    checkpoint_io.save_checkpoint({"tensor": tensor, "epoch": 1}, "1.ckpt")
+    checkpoint_io.remove_checkpoint("1.ckpt")
+    checkpoint_io.teardown()
+    assert base_ckpt_io.saved == {"0.ckpt": {"tensor": buffer, "epoch": 0}}
+    # the buffer of the first checkpoint was released and reused by the second one
+    assert torch.equal(buffer, torch.ones(2))
+    assert checkpoint_io.metrics["saved"] == 2
+    assert checkpoint_io.metrics["pending"] == 0
+
+
+@pytest.mark.parametrize("policy", ["block", "drop"])
+def test_async_checkpoint_plugin_policy(policy):
+    base_ckpt_io = BlockingCheckpointIO()
+    checkpoint_io = AsyncCheckpointIO(base_ckpt_io, max_workers=2, max_pending=1, policy=policy)
+    checkpoint_io.save_checkpoint({"epoch": 0}, "0.ckpt")
+
+    if policy == "drop":
+        with pytest.warns(UserWarning, match="The checkpoint 1.ckpt was dropped"):
+            checkpoint_io.save_checkpoint({"epoch": 1}, "1.ckpt")
+        base_ckpt_io.event.set()
+    else:
+        thread = Thread(target=checkpoint_io.save_checkpoint, args=({"epoch": 1}, "1.ckpt"))
+        thread.start()
+        thread.join(timeout=0.1)
+        # waiting for the first checkpoint to be saved
+        assert thread.is_alive()
+        base_ckpt_io.event.set()
+        thread.join()
+    checkpoint_io.teardown()
+
+    expected = {"0.ckpt": {"epoch": 0}}
+    if policy == "block":
+        expected["1.ckpt"] = {"epoch": 1}
+    assert base_ckpt_io.saved == expected
+    assert checkpoint_io.metrics["dropped"] == int(policy == "drop")
+
+    with pytest.raises(ValueError, match="`policy` should be one of"):
+        AsyncCheckpointIO(policy="wait")
+
+
+def test_async_checkpoint_plugin_dropped_checkpoints_kept(tmpdir):
+    """Test that the ``ModelCheckpoint`` keeps its previous checkpoints when the new ones are dropped."""
+    base_ckpt_io = BlockingCheckpointIO()
+    checkpoint_io = AsyncCheckpointIO(base_ckpt_io, max_pending=1, policy="drop")
+
+    class CustomBoringModel(BoringModel):
+        def on_train_end(self):
+            base_ckpt_io.event.set()
+
+    ck = ModelCheckpoint(dirpath=tmpdir, monitor="step", mode="max", save_top_k=1, save_last=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[checkpoint_io],
+        callbacks=ck,
+        max_epochs=3,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    # the first checkpoint is being saved until the end of the training, the next ones are dropped
+    with pytest.warns(UserWarning, match="was dropped"):
+        trainer.fit(CustomBoringModel())
+
+    first_path = os.path.join(tmpdir, "epoch=0-step=1.ckpt")
+    assert ck.best_model_path == first_path
+    assert ck.best_k_models == {first_path: 1}
+    assert ck.last_model_path == ""
+    assert list(base_ckpt_io.saved) == [first_path]
+    assert checkpoint_io.metrics["dropped"] == 5
+
+
+def test_async_checkpoint_plugin_dropped_checkpoints_synced_across_ranks(tmpdir):
+    """Test that the ``ModelCheckpoint`` state stays the same on all ranks when rank 0 drops a checkpoint, the other
+    ranks never saving the checkpoints themselves."""
+
+    def fit(global_zero, broadcast):
+        base_ckpt_io = BlockingCheckpointIO()
+        checkpoint_io = AsyncCheckpointIO(base_ckpt_io, max_pending=1, policy="drop")
+
+        class CustomBoringModel(BoringModel):
+            def on_train_end(self):
+                base_ckpt_io.event.set()
+
+        ck = ModelCheckpoint(dirpath=tmpdir, monitor="step", mode="max", save_top_k=1, save_last=True)
+        trainer = Trainer(
+            default_root_dir=tmpdir,
+            plugins=[checkpoint_io],
+            callbacks=ck,
+            max_epochs=3,
+            limit_train_batches=1,
+            limit_val_batches=0,
+            enable_progress_bar=False,
+            enable_model_summary=False,
+            logger=False,
+        )
+        with mock.patch.object(
+            SingleDeviceStrategy, "is_global_zero", new_callable=mock.PropertyMock, return_value=global_zero
+        ), mock.patch.object(SingleDeviceStrategy, "broadcast", side_effect=broadcast):
+            trainer.fit(CustomBoringModel())
+        return ck
+
+    # the objects broadcast by rank 0 are received in the same order by the other ranks
+    broadcast_objects = []
+
+    def broadcast_rank_zero(obj, src=0):
+        broadcast_objects.append(obj)
+        return obj
+
+    with pytest.warns(UserWarning, match="was dropped"):
+        rank_zero_ck = fit(True, broadcast_rank_zero)
+    assert True in broadcast_objects
+    received = iter(broadcast_objects)
+    rank_one_ck = fit(False, lambda obj, src=0: next(received))
+
+    assert rank_one_ck.state_dict() == rank_zero_ck.state_dict()
+    assert rank_one_ck.best_k_models == rank_zero_ck.best_k_models == {os.path.join(tmpdir, "epoch=0-step=1.ckpt"): 1}
+    assert rank_one_ck.last_model_path == ""
+
+
+def test_async_checkpoint_plugin_error(tmpdir):
+    """Test that the errors raised while saving a checkpoint are raised at the next training step."""
+
+    class FailingCheckpointIO(BlockingCheckpointIO):
+        def save_checkpoint(self, *_: Any, **__: Any) -> None:
+            raise RuntimeError("Failed to save")
+
+    class CustomBoringModel(BoringModel):
+        def on_train_batch_start(self, batch, batch_idx):
+            if batch_idx == 1:
+                # the error is raised once the save is completed
+                self.trainer.strategy.checkpoint_io._executor.submit(lambda: None).result()
+
+    checkpoint_io = AsyncCheckpointIO(FailingCheckpointIO())
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[checkpoint_io],
+        callbacks=ModelCheckpoint(dirpath=tmpdir, every_n_train_steps=1),
+        max_steps=3,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    with pytest.raises(RuntimeError, match="Failed to save"):
+        trainer.fit(CustomBoringModel())
+    assert trainer.global_step == 1
+
+
+def test_sharded_checkpoint_plugin(tmpdir):
+    """Test that the ``ShardedCheckpointIO`` saves the checkpoints as directories which can be restored."""
+
+    class AdamModel(BoringModel):
+        def configure_optimizers(self):
+            return [torch.optim.Adam(self.layer.parameters()), torch.optim.SGD(self.layer.parameters(), lr=0.1)], []
+
+        def training_step(self, batch, batch_idx, optimizer_idx):
+            return super().training_step(batch, batch_idx)
+
+    trainer_kwargs = dict(
+        default_root_dir=tmpdir,
+        plugins=[ShardedCheckpointIO(max_workers=2)],
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    trainer = Trainer(max_epochs=1, **trainer_kwargs)
+    model = AdamModel()
+    trainer.fit(model)
+
+    path = trainer.checkpoint_callback.best_model_path
+    assert os.path.isdir(path)
+    with open(os.path.join(path, "manifest.json")) as f:
+        manifest = json.load(f)
+    assert set(os.listdir(path)) == {shard["file"] for shard in manifest["shards"]} | {"manifest.json"}
+    assert {shard["file"] for shard in manifest["shards"]} == {
+        "state_dict.pt",
+        "loops.pt",
+        "callbacks.pt",
+        "optimizer_states.0.pt",
+        "optimizer_states.1.pt",
+        "checkpoint.pt",
+    }
+
+    checkpoint = trainer.strategy.checkpoint_io.load_checkpoint(path)
+    expected = torch.load(os.path.join(path, "optimizer_states.1.pt"))
+    assert checkpoint["optimizer_states"][1] == expected
+    assert checkpoint["epoch"] == 0
+    for key, value in model.state_dict().items():
+        assert torch.equal(checkpoint["state_dict"][key], value)
+
+    # resume the training from the sharded checkpoint
+    trainer = Trainer(max_epochs=2, **trainer_kwargs)
+    trainer.fit(AdamModel(), ckpt_path=path)
+    assert trainer.current_epoch == 2
+    assert trainer.global_step == 4
+
+    # the checkpoints saved as a single file can still be loaded
+    filepath = os.path.join(tmpdir, "model.ckpt")
+    torch.save({"epoch": 1}, filepath)
+    assert trainer.strategy.checkpoint_io.load_checkpoint(filepath) == {"epoch": 1}
+
+    trainer.strategy.checkpoint_io.remove_checkpoint(path)
+    assert not os.path.exists(path)
+
+
+def test_sharded_checkpoint_plugin_integrity(tmpdir):
+    checkpoint_io = ShardedCheckpointIO()
+    path = os.path.join(tmpdir, "model.ckpt")
+    checkpoint = {"state_dict": {"weight": torch.ones(2)}, "optimizer_states": [], "epoch": 1}
+    checkpoint_io.save_checkpoint(checkpoint, path)
+    loaded = checkpoint_io.load_checkpoint(path)
+    assert loaded["optimizer_states"] == []
+    assert torch.equal(loaded["state_dict"]["weight"], torch.ones(2))
+
+    # same size, different content
+    shard_path = os.path.join(path, "state_dict.pt")
+    with open(shard_path, "r+b") as f:
+        data = f.read()
+        f.seek(0)
+        f.write(data.replace(torch.ones(2).numpy().tobytes(), torch.zeros(2).numpy().tobytes()))
+    with pytest.raises(RuntimeError, match="its checksum doesn't match"):
+        checkpoint_io.load_checkpoint(path)
+    assert ShardedCheckpointIO(verify=False).load_checkpoint(path)["epoch"] == 1
+
+    with open(shard_path, "ab") as f:
+        f.write(b"0")
+    with pytest.raises(RuntimeError, match="is corrupted: expected"):
+        ShardedCheckpointIO(verify=False).load_checkpoint(path)
+
+    os.remove(os.path.join(path, "manifest.json"))
+    with pytest.raises(RuntimeError, match="is incomplete"):
+        checkpoint_io.load_checkpoint(path)
+
+    # a new save replaces the previous checkpoint
+    checkpoint_io.save_checkpoint(checkpoint, path)
+    assert checkpoint_io.load_checkpoint(path)["epoch"] == 1
+
+    # an interrupted save keeps the previous checkpoint
+    with mock.patch.object(ShardedCheckpointIO, "_save_shard", side_effect=RuntimeError("Interrupted")):
+        with pytest.raises(RuntimeError, match="Interrupted"):
+            checkpoint_io.save_checkpoint({**checkpoint, "epoch": 2}, path)
+    assert checkpoint_io.load_checkpoint(path)["epoch"] == 1
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+
+    checkpoint_io.save_checkpoint({**checkpoint, "epoch": 2}, path)
+    assert checkpoint_io.load_checkpoint(path)["epoch"] == 2
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+
+
+def test_incremental_checkpoint_plugin(tmpdir):
+    """Test that the ``IncrementalCheckpointIO`` only writes the tensors which changed and removes the blobs once
+    they aren't referenced anymore."""
+
+    class FrozenBackboneModel(BoringModel):
+        def __init__(self):
+            super().__init__()
+            self.backbone = torch.nn.Linear(32, 32)
+            self.backbone.requires_grad_(False)
+
+        def forward(self, x):
+            return super().forward(self.backbone(x))
+
+    def list_blobs():
+        return sorted(
+            os.path.join(root, filename)
+            for root, _, filenames in os.walk(os.path.join(tmpdir, ".blobs"))
+            for filename in filenames
+            if filename.endswith(".pt")
+        )
+
+    # only the weights of the layers are stored as blobs
+    checkpoint_io = IncrementalCheckpointIO(min_blob_size=256)
+    save_mock = Mock(wraps=torch.save)
+    model = FrozenBackboneModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[checkpoint_io],
+        callbacks=ModelCheckpoint(dirpath=tmpdir, monitor="step", mode="max", save_top_k=2),
+        max_epochs=3,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    with mock.patch("torch.save", save_mock):
+        trainer.fit(model)
+    assert {fn.name for fn in Path(tmpdir).glob("*.ckpt")} == {"epoch=1-step=2.ckpt", "epoch=2-step=3.ckpt"}
+
+    # the frozen weight is written once, the trained one at every epoch
+    blobs = [call.args[0] for call in save_mock.call_args_list if isinstance(call.args[0], torch.Tensor)]
+    assert len(blobs) == 1 + 3
+    # the blob of the removed checkpoint is collected, the frozen one is kept
+    assert len(list_blobs()) == 1 + 2
+
+    checkpoint = checkpoint_io.load_checkpoint(trainer.checkpoint_callback.best_model_path)
+    for key, value in model.state_dict().items():
+        assert torch.equal(checkpoint["state_dict"][key], value)
+
+    checkpoint_io.remove_checkpoint(os.path.join(tmpdir, "epoch=1-step=2.ckpt"))
+    assert len(list_blobs()) == 1 + 1
+    checkpoint_io.remove_checkpoint(os.path.join(tmpdir, "epoch=2-step=3.ckpt"))
+    assert list_blobs() == []
+
+
+def test_incremental_checkpoint_plugin_concurrent_saves(tmpdir):
+    """Test that the index of the ``IncrementalCheckpointIO`` stays consistent when the checkpoints are saved and
+    removed concurrently."""
+    checkpoint_io = IncrementalCheckpointIO(min_blob_size=0)
+    shared = torch.ones(8)
+
+    def save(i):
+        checkpoint_io.save_checkpoint({"shared": shared, "own": torch.full((8,), i)}, os.path.join(tmpdir, f"{i}.ckpt"))
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(save, range(4)))
+    with ThreadPoolExecutor(4) as executor:
+        remove = checkpoint_io.remove_checkpoint
+        removals = [executor.submit(remove, os.path.join(tmpdir, f"{i}.ckpt")) for i in range(3)]
+        saves = [executor.submit(save, i) for i in range(4, 8)]
+        for future in removals + saves:
+            future.result()
+
+    with open(os.path.join(tmpdir, ".blobs", "index.json")) as f:
+        assert sorted(json.load(f)["checkpoints"]) == [f"{i}.ckpt" for i in range(3, 8)]
+    for i in range(3, 8):
+        checkpoint = checkpoint_io.load_checkpoint(os.path.join(tmpdir, f"{i}.ckpt"))
+        assert torch.equal(checkpoint["shared"], shared)
+        assert torch.equal(checkpoint["own"], torch.full((8,), i))
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16, torch.complex64, torch.bool])
+def test_incremental_checkpoint_plugin_tensor_bytes(dtype):
+    """Test that the bytes of the tensors are hashed the same way on the PyTorch versions which can't view them as
+    bytes."""
+    tensor = torch.arange(6).reshape(2, 3).to(dtype)
+    expected = tensor.reshape(-1).view(torch.uint8).numpy().tobytes() if not tensor.is_complex() else None
+    with mock.patch("pytorch_lightning.plugins.io.incremental_plugin._TORCH_GREATER_EQUAL_1_13", False):
+        fallback = _as_bytes(tensor).tobytes()
+    assert len(fallback) == tensor.numel() * tensor.element_size()
+    if expected is not None:
+        assert fallback == expected
+        assert _as_bytes(tensor).tobytes() == expected
@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import logging
 import os
+import threading
 import platform
 import time
 from copy import deepcopy
@@ -26,8 +28,15 @@ from pytorch_lightning import Callback, Trainer
 from pytorch_lightning.callbacks import EarlyStopping, StochasticWeightAveraging
 from pytorch_lightning.demos.boring_classes import BoringModel, ManualOptimBoringModel
 from pytorch_lightning.loggers import CSVLogger, TensorBoardLogger
-from pytorch_lightning.profilers import AdvancedProfiler, PassThroughProfiler, PyTorchProfiler, SimpleProfiler
+from pytorch_lightning.profilers import (
+    AdvancedProfiler,
+    PassThroughProfiler,
+    PyTorchProfiler,
+    SimpleProfiler,
+    TimelineProfiler,
+)
 from pytorch_lightning.profilers.pytorch import RegisterRecordFunction, warning_cache
+from pytorch_lightning.profilers.simple import _BUFFER_SIZE, _SAMPLE_SIZE, _StreamingStats
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _KINETO_AVAILABLE
 from tests_pytorch.helpers.runif import RunIf
@@ -188,6 +197,60 @@ def test_simple_profiler_logs(tmpdir, caplog, simple_profiler):
     assert caplog.text.count("Profiler Report") == 2
 
 
+def test_simple_profiler_streaming_stats():
+    """Test the aggregates of the durations computed in constant memory by the streaming `SimpleProfiler`."""
+    durations = np.random.default_rng(1).exponential(size=10_000)
+    stats = _StreamingStats(np.random.default_rng(0))
+    for values in np.split(durations, 40):
+        stats.update(values)
+
+    assert stats.count == len(durations)
+    assert stats.total == pytest.approx(durations.sum())
+    assert stats.mean == pytest.approx(durations.mean())
+    assert stats.std == pytest.approx(durations.std())
+    assert stats.min == durations.min()
+    assert stats.max == durations.max()
+    assert stats._sample.shape == (_SAMPLE_SIZE,)
+    np.testing.assert_allclose(stats.quantiles(), np.quantile(durations, (0.5, 0.9, 0.99)), rtol=0.2)
+
+    # less durations than the size of the sample give the exact quantiles
+    stats = _StreamingStats(np.random.default_rng(0))
+    stats.update(durations[:100])
+    np.testing.assert_allclose(stats.quantiles(), np.quantile(durations[:100], (0.5, 0.9, 0.99)))
+
+
+def test_simple_profiler_streaming(tmpdir):
+    """Test that the streaming `SimpleProfiler` doesn't keep the durations and reports their statistics."""
+    profiler = SimpleProfiler(streaming=True)
+    num_calls = _BUFFER_SIZE + 10
+    for _ in range(num_calls):
+        with profiler.profile("a"):
+            pass
+
+    # only the durations not aggregated yet are kept
+    assert len(profiler.recorded_durations["a"]) == 10
+    assert profiler.recorded_stats["a"].count == _BUFFER_SIZE
+    summary = profiler.summary()
+    assert "Std (s)" in summary
+    assert "P99 (s)" in summary
+    assert f"|  {num_calls} " in summary
+    assert profiler.recorded_stats["a"].count == num_calls
+
+
+def test_simple_profiler_interim_summary(tmpdir):
+    """Test that the latest interim summary of the `SimpleProfiler` is written to its directory."""
+    profiler = SimpleProfiler(dirpath=tmpdir, streaming=True, summary_interval=0)
+    profiler.setup(stage="fit")
+    for _ in range(3):
+        with profiler.profile("a"):
+            pass
+
+    assert os.listdir(tmpdir) == ["fit-interim.txt"]
+    interim_summary = tmpdir.join("fit-interim.txt").read_text("utf-8")
+    assert interim_summary.startswith("FIT Profiler Report")
+    assert "|  3 " in interim_summary
+
+
 @pytest.mark.parametrize("extended", [True, False])
 @patch("time.monotonic", return_value=70)
 def test_simple_profiler_summary(tmpdir, extended):
@@ -528,7 +591,7 @@ def test_register_record_function(tmpdir):
     assert "[pl][module]torch.nn.modules.linear.Linear: layer.2" in event_names
 
 
-@pytest.mark.parametrize("cls", (SimpleProfiler, AdvancedProfiler, PyTorchProfiler))
+@pytest.mark.parametrize("cls", (SimpleProfiler, AdvancedProfiler, PyTorchProfiler, TimelineProfiler))
 def test_profiler_teardown(tmpdir, cls):
     """This test checks if profiler teardown method is called when trainer is exiting."""
 
@@ -563,6 +626,7 @@ def test_pytorch_profiler_deepcopy(tmpdir):
         ("Simple", SimpleProfiler),
         ("advanced", AdvancedProfiler),
         ("pytorch", PyTorchProfiler),
+        ("timeline", TimelineProfiler),
     ],
 )
 def test_trainer_profiler_correct_args(profiler, expected):
@@ -620,10 +684,90 @@ def test_profile_callbacks(tmpdir):
     )
     trainer.fit(model)
     assert sum(
-        e.name == "[pl][profile][Callback]EarlyStopping{'monitor': 'val_loss', 'mode': 'min'}.on_validation_start"
+        e.name == "[pl][profile][Callback]EarlyStopping{'monitor': 'val_loss', 'mode': 'min'}.on_validation_end"
         for e in pytorch_profiler.function_events
     )
     assert sum(
-        e.name == "[pl][profile][Callback]EarlyStopping{'monitor': 'train_loss', 'mode': 'min'}.on_validation_start"
+        e.name == "[pl][profile][Callback]EarlyStopping{'monitor': 'train_loss', 'mode': 'min'}.on_validation_end"
         for e in pytorch_profiler.function_events
     )
+
+
+def test_timeline_profiler_events(tmpdir):
+    """Test the events recorded by the `TimelineProfiler`, per thread."""
+    profiler = TimelineProfiler(dirpath=tmpdir, max_events=3)
+
+    with profiler.profile("[Callback]A.on_train_start"):
+        with profiler.profile("b"):
+            pass
+    with pytest.raises(ValueError, match="never started"):
+        profiler.stop("b")
+
+    # the same action can run in several threads
+    profiler.start("c")
+    thread = threading.Thread(target=lambda: (profiler.start("c"), profiler.stop("c")), name="worker")
+    thread.start()
+    thread.join()
+    with pytest.raises(ValueError, match="already started"):
+        profiler.start("c")
+    profiler.stop("c")
+
+    # the oldest events are dropped
+    assert [event[0] for event in profiler.recorded_events] == ["[Callback]A.on_train_start", "c", "c"]
+    trace = profiler.trace()
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["cat"] for event in events] == ["Callback", "lightning", "lightning"]
+    assert events[1]["tid"] != events[2]["tid"]
+    assert events[2]["ts"] < events[1]["ts"]
+    assert all(event["pid"] == 0 and event["dur"] >= 0 for event in events)
+    thread_names = {event["args"]["name"] for event in trace["traceEvents"] if event["name"] == "thread_name"}
+    assert thread_names == {threading.current_thread().name, "worker"}
+
+    summary = profiler.summary()
+    assert "3 events exported" in summary
+    assert "1 older events were dropped" in summary
+    with open(tmpdir / "trace.json") as f:
+        assert json.load(f) == trace
+
+    profiler.start("d")
+    profiler.teardown(stage=None)
+    assert not profiler.current_actions
+    assert not profiler.recorded_events
+    assert profiler.trace()["traceEvents"][-1]["name"] == "process_sort_index"
+
+
+def test_timeline_profiler_trace_filename_global_rank(tmpdir):
+    """Test that the traces are named after the global rank, the local ranks colliding across the nodes."""
+    profiler = TimelineProfiler(dirpath=tmpdir, filename="profile")
+    with patch("pytorch_lightning.profilers.timeline.rank_zero_only.rank", 3, create=True):
+        profiler.setup(stage="fit", local_rank=1)
+    with profiler.profile("a"):
+        pass
+    profiler.summary()
+    assert os.path.exists(os.path.join(tmpdir, "fit-profile-3-trace.json"))
+
+
+@RunIf(skip_windows=True)
+def test_timeline_profiler_distributed_traces(tmpdir):
+    """Test that the traces of the ranks are exported and can be merged."""
+    profiler = TimelineProfiler(dirpath=tmpdir)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        fast_dev_run=2,
+        strategy="ddp_spawn",
+        accelerator="cpu",
+        devices=2,
+        profiler=profiler,
+        logger=False,
+    )
+    trainer.fit(BoringModel())
+
+    filepaths = [os.path.join(tmpdir, f"fit-{rank}-trace.json") for rank in (0, 1)]
+    merged_filepath = os.path.join(tmpdir, "trace.json")
+    TimelineProfiler.merge(filepaths, merged_filepath)
+    with open(merged_filepath) as f:
+        events = json.load(f)["traceEvents"]
+    assert {event["pid"] for event in events} == {0, 1}
+    names = {event["name"] for event in events if event["ph"] == "X"}
+    assert "[Strategy]DDPSpawnStrategy.training_step" in names
+    assert any(name.startswith("[Callback]") for name in names)
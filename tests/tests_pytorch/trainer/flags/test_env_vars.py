@@ -18,14 +18,14 @@ from pytorch_lightning import Trainer
 from pytorch_lightning.demos.boring_classes import BoringModel
 
 
-def test_passing_no_env_variables():
+def test_passing_no_env_variables(tmpdir):
     """Testing overwriting trainer arguments."""
     trainer = Trainer()
     model = BoringModel()
     assert trainer.logger is not None
     assert trainer.max_steps == -1
     assert trainer.max_epochs is None
-    trainer = Trainer(logger=False, max_steps=1)
+    trainer = Trainer(default_root_dir=tmpdir, logger=False, max_steps=1)
     trainer.fit(model)
     assert trainer.logger is None
     assert trainer.max_steps == 1
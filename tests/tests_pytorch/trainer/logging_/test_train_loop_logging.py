@@ -845,3 +845,40 @@ def test_unsqueezed_tensor_logging():
     model.trainer = trainer
     model.log("foo", Tensor([1.2]))
     assert trainer.callback_metrics["foo"].ndim == 0
+
+
+def test_epoch_level_logging_accumulator_stays_bounded(tmpdir):
+    """Test that the values logged on epoch level are accumulated at the end of each batch instead of queued for
+    the whole epoch."""
+
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            for i in range(10):
+                self.log(f"metric_{i}", torch.tensor(float(batch_idx)), on_step=False, on_epoch=True)
+            return super().training_step(batch, batch_idx)
+
+    class AssertCallback(callbacks.Callback):
+        def __init__(self):
+            self.max_pending = 0
+
+        def on_train_batch_end(self, trainer, *_):
+            self.max_pending = max(self.max_pending, len(trainer._results._accumulator._pending))
+
+        def on_train_batch_start(self, trainer, *_):
+            assert not trainer._results._accumulator.pending
+
+    callback = AssertCallback()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=50,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        enable_checkpointing=False,
+        logger=False,
+        callbacks=callback,
+    )
+    trainer.fit(TestModel())
+    assert 0 < callback.max_pending <= 10
+    assert trainer.callback_metrics["metric_0"] == pytest.approx(sum(range(50)) / 50)
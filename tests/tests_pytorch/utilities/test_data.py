@@ -13,6 +13,7 @@ from pytorch_lightning.demos.boring_classes import BoringModel, RandomDataset, R
 from pytorch_lightning.overrides.distributed import IndexBatchSamplerWrapper
 from pytorch_lightning.trainer.states import RunningStage
 from pytorch_lightning.utilities.data import (
+    _BatchSizeExtractor,
     _dataloader_init_kwargs_resolve_sampler,
     _get_dataloader_init_args_and_kwargs,
     _update_dataloader,
@@ -92,6 +93,61 @@ def test_extract_batch_size():
     _check_error_raised(data)
 
 
+@dataclass
+class _CustomDataclass:
+    a: Tensor
+    b: str
+
+
+@pytest.mark.parametrize(
+    "batch",
+    [
+        torch.zeros(11, 10),
+        torch.tensor(1.0),
+        {"a": [torch.zeros(11, 10), torch.zeros(11)], "b": {"c": torch.zeros(11, 3)}},
+        ("some text", torch.zeros(11, 10)),
+        (torch.zeros(11, 10), "some text"),
+        {"a": [torch.tensor(1), torch.tensor(2)], "b": torch.tensor([1, 2, 3, 4])},
+        _CustomDataclass(torch.zeros(11, 10), "some text"),
+        [{1, 2}, torch.zeros(11, 10)],
+    ],
+)
+def test_batch_size_extractor(batch):
+    """Test that the batch size extracted with the compiled access path matches `extract_batch_size`."""
+    extractor = _BatchSizeExtractor()
+    expected = extract_batch_size(batch)
+    warning_cache.clear()
+    for _ in range(2):
+        assert extractor(batch) == expected
+    warning_cache.clear()
+
+
+def test_batch_size_extractor_structure_changes():
+    extractor = _BatchSizeExtractor()
+    assert extractor({"x": torch.zeros(4, 2), "y": [torch.zeros(4)]}) == 4
+    plan = extractor._plan
+    assert extractor({"x": torch.zeros(5, 2), "y": [torch.zeros(5)]}) == 5
+    assert extractor._plan is plan
+
+    # the plan is recompiled once the structure changes
+    assert extractor({"y": [torch.zeros(6)], "x": torch.zeros(7, 2)}) == 6
+    assert extractor._plan is not plan
+    plan = extractor._plan
+    assert extractor({"y": ["text", torch.zeros(3)], "x": torch.zeros(3, 2)}) == 3
+    assert extractor._plan is not plan
+    assert extractor({"y": [torch.zeros(3), "text"], "x": torch.zeros(3, 2)}) == 3
+
+    # the iterables which can't be indexed aren't compiled
+    assert extractor([{1, 2}, torch.zeros(11, 10)]) == 11
+    assert extractor._plan is None
+
+    warning_cache.clear()
+    with pytest.raises(MisconfigurationException, match="We could not infer the batch_size"):
+        extractor({"x": ["text"]})
+    with pytest.raises(MisconfigurationException, match="We could not infer the batch_size"):
+        extractor({"x": ["text"]})
+
+
 def test_get_len():
     assert get_len(DataLoader(RandomDataset(1, 1))) == 1
 